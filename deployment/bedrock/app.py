@@ -8,40 +8,35 @@ import sys
 import os
 import logging
 import traceback
+import functools
+import copy
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Final, Tuple
 
 # Add project paths for modern src/ layout
 project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-from strands import Agent
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
 
-# Import our AWS DevOps tools from new structure
-from aws_devops_agent.tools import *
-from aws_devops_agent.config import get_config
-
-# Import specific tools that might not be in __init__.py
-from aws_devops_agent.tools.aws_cost.optimization import get_cost_forecast_mcp, compare_cost_periods_mcp
-from aws_devops_agent.tools.aws_cost.resources import scan_live_aws_resources, analyze_unused_resources, get_resource_utilization_metrics, discover_cross_account_resources
-from aws_devops_agent.tools.aws_cost.multi_account import list_cross_account_resources, execute_cross_account_operation, monitor_cross_account_compliance
-from aws_devops_agent.tools.github.integration import update_iac_via_github, list_infrastructure_repositories, monitor_infrastructure_prs
-
-# Load configuration from environment variables
-import os
-from pathlib import Path
-
 # Import centralized environment configuration
 from aws_devops_agent.config.env_config import load_env_file, get_env_config
 
 # Load .env file
 load_env_file()
 
+
+@functools.lru_cache(maxsize=1)
+def get_app_config():
+    """Load and validate the environment configuration once per worker"""
+    return get_env_config(strict_validation=True)
+
+
 # Get environment configuration with strict validation for production
 try:
-    env_config = get_env_config(strict_validation=True)
+    env_config = get_app_config()
     print("✅ Environment configuration loaded successfully")
     print(f"   AWS Region: {env_config.aws_region}")
     print(f"   Model ID: {env_config.bedrock_model_id}")
@@ -87,175 +82,133 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create the Strands agent
-agent = Agent(
-    model=model_id,
-    tools=[
+# Tool catalog by category; names are resolved to tools (and their modules imported) only on demand
+TOOL_CATEGORIES: Final[Dict[str, Tuple[str, ...]]] = {
+    "aws_cost": (
         # Cost Optimization Tools (AWS Pricing API)
-        get_real_aws_pricing,
-        analyze_price_optimization_opportunities,
-        generate_cost_comparison_report,
-        calculate_reserved_instance_savings,
-        compare_instance_types,
-        compare_pricing_models,
-        compare_regions_pricing,
-        suggest_cost_effective_alternatives,
-        calculate_savings_potential,
-        
+        "get_real_aws_pricing",
+        "analyze_price_optimization_opportunities",
+        "generate_cost_comparison_report",
+        "calculate_reserved_instance_savings",
+        "compare_instance_types",
+        "compare_pricing_models",
+        "compare_regions_pricing",
+        "suggest_cost_effective_alternatives",
+        "calculate_savings_potential",
+
         # Cost Explorer Tools (Real AWS Data via MCP)
-        get_actual_aws_costs,
-        get_cost_by_service,
-        get_cost_trends,
-        get_rightsizing_recommendations,
-        get_reserved_instance_recommendations,
-        analyze_cost_anomalies,
-        analyze_usage_based_optimization,
-        get_underutilized_resources,
-        calculate_wasted_spend,
-        generate_cost_optimization_report,
-        get_cost_forecast_mcp,
-        compare_cost_periods_mcp,
-        
+        "get_actual_aws_costs",
+        "get_cost_by_service",
+        "get_cost_trends",
+        "get_rightsizing_recommendations",
+        "get_reserved_instance_recommendations",
+        "analyze_cost_anomalies",
+        "get_cost_dashboard_bundle",
+        "analyze_usage_based_optimization",
+        "get_underutilized_resources",
+        "calculate_wasted_spend",
+        "generate_cost_optimization_report",
+        "get_cost_forecast_mcp",
+        "compare_cost_periods_mcp",
+
         # Live AWS Resources Tools
-        scan_live_aws_resources,
-        analyze_unused_resources,
-        get_resource_utilization_metrics,
-        discover_cross_account_resources,
-        analyze_resource_costs,
-        get_unused_resources,
-        calculate_resource_utilization,
-        
+        "scan_live_aws_resources",
+        "analyze_unused_resources",
+        "get_resource_utilization_metrics",
+        "discover_cross_account_resources",
+        "analyze_resource_costs",
+        "get_unused_resources",
+        "calculate_resource_utilization",
+
+        # Multi-Account Management Tools
+        "get_organization_costs",
+        "analyze_account_costs",
+        "generate_multi_account_report",
+        "list_cross_account_resources",
+        "execute_cross_account_operation",
+        "monitor_cross_account_compliance",
+    ),
+    "iac": (
         # Infrastructure as Code Tools
-        analyze_terraform_configuration,
-        validate_cloudformation_template,
-        scan_infrastructure_drift,
-        generate_iac_best_practices_report,
-        
+        "analyze_terraform_configuration",
+        "validate_cloudformation_template",
+        "scan_infrastructure_drift",
+        "generate_iac_best_practices_report",
+
         # CDK Analysis Tools
-        analyze_cdk_project,
-        synthesize_cdk_project,
-        analyze_cdk_synthesized_output,
-        generate_cdk_optimization_report,
-        
+        "analyze_cdk_project",
+        "synthesize_cdk_project",
+        "analyze_cdk_synthesized_output",
+        "generate_cdk_optimization_report",
+
         # Terraform Analysis Tools
-        analyze_terraform_project,
-        validate_terraform_configuration,
-        plan_terraform_changes,
-        analyze_terraform_state,
-        generate_terraform_optimization_report,
-        
+        "analyze_terraform_project",
+        "validate_terraform_configuration",
+        "plan_terraform_changes",
+        "analyze_terraform_state",
+        "generate_terraform_optimization_report",
+    ),
+    "security": (
         # Compliance and Security Tools
-        validate_security_policies,
-        check_compliance_standards,
-        generate_compliance_report,
-        scan_security_vulnerabilities,
-        analyze_security_hub_findings,
-        get_security_insights,
-        analyze_security_posture,
-        analyze_config_compliance,
-        get_compliance_details,
-        check_resource_compliance,
-        analyze_inspector_findings,
-        
-        # Multi-Account Management Tools
-        get_organization_costs,
-        analyze_account_costs,
-        generate_multi_account_report,
-        list_cross_account_resources,
-        execute_cross_account_operation,
-        monitor_cross_account_compliance,
-        
+        "validate_security_policies",
+        "check_compliance_standards",
+        "generate_compliance_report",
+        "scan_security_vulnerabilities",
+        "analyze_security_hub_findings",
+        "get_security_insights",
+        "analyze_security_posture",
+        "analyze_config_compliance",
+        "get_compliance_details",
+        "check_resource_compliance",
+        "analyze_inspector_findings",
+    ),
+    "github": (
         # GitHub Integration Tools
-        create_optimization_pull_request,
-        update_iac_via_github,
-        list_infrastructure_repositories,
-        monitor_infrastructure_prs,
-        
+        "create_optimization_pull_request",
+        "update_iac_via_github",
+        "list_infrastructure_repositories",
+        "monitor_infrastructure_prs",
+    ),
+    "docs": (
         # Document Generation Tools
-        generate_document,
-        generate_cost_analysis_document,
-        generate_security_compliance_document,
-        generate_infrastructure_document,
-        generate_cdk_analysis_document,
-        generate_terraform_analysis_document,
-        list_generated_documents,
-        get_document_info,
-    ],
-    system_prompt="""Eres un especialista en AWS DevOps desplegado en Bedrock Agent Core con acceso completo a APIs reales de AWS via servidores MCP.
-
-TUS CAPACIDADES PRINCIPALES:
-💰 OPTIMIZACIÓN DE COSTOS:
-- Análisis de precios en tiempo real via AWS Pricing API
-- Acceso REAL a AWS Cost Explorer con datos de facturación actuales
-- Análisis de tendencias y breakdowns multi-cuenta via Cost Explorer API
-- Recomendaciones de rightsizing y Reserved Instances basadas en datos reales
-- Escaneo de recursos vivos para identificar recursos sin usar
-- Métricas de utilización en tiempo real de todos los servicios AWS
-- Análisis de anomalías de costos y optimización basada en uso
-- Comparación de modelos de precios y regiones
-
-🏗️ ANÁLISIS DE INFRAESTRUCTURA COMO CÓDIGO (IaC):
-- Validación de configuraciones Terraform y CloudFormation
-- Análisis completo de proyectos CDK con síntesis y optimización
-- Detección de drift entre código y estado real
-- Best practices y recomendaciones de seguridad
-- Análisis de cumplimiento de estándares
-- Planificación y análisis de cambios de Terraform
-
-🔒 SEGURIDAD Y COMPLIANCE:
-- Validación contra estándares SOC2, HIPAA, PCI-DSS, ISO27001
-- Escaneo de vulnerabilidades de seguridad via Security Hub
-- Análisis de políticas y configuraciones
-- Reportes de compliance ejecutivos
-- Análisis de Inspector y Config Compliance
-- Insights de seguridad y postura de seguridad
-
-🌐 GESTIÓN MULTI-CUENTA:
-- Operaciones cross-account en organizaciones AWS
-- Inventario de recursos en múltiples cuentas y regiones
-- Análisis de costos organizacional
-- Monitoreo de compliance centralizado
-- Ejecución de operaciones en múltiples cuentas
-
-📱 INTEGRACIÓN GITHUB:
-- Generación automática de Pull Requests con optimizaciones
-- Gestión de repositorios de infraestructura
-- Automatización de CI/CD para IaC
-- Monitoring de PRs de infraestructura
-
-📄 GENERACIÓN DE DOCUMENTOS:
-- Reportes ejecutivos de análisis de costos
-- Documentos de compliance y seguridad
-- Análisis de infraestructura y CDK
-- Documentación de optimizaciones de Terraform
-
-FLUJO DE TRABAJO CONVERSACIONAL:
-1. Analiza la consulta del usuario en español/inglés
-2. Determina qué herramientas usar y en qué secuencia
-3. Ejecuta análisis usando datos reales de AWS via MCP
-4. Combina resultados en una respuesta integral
-5. Genera PRs automáticos cuando sea apropiado
-6. Proporciona next steps accionables
-
-IMPORTANTE:
-- Siempre especifica que los datos provienen de APIs reales de AWS via MCP servers
-- Incluye números específicos y ahorros en dólares
-- Genera PRs automáticamente para cambios seguros
-- Proporciona executive summaries para stakeholders
-- Mantén foco en ROI y value delivery
-
-Responde de manera concisa pero completa, integrando múltiples fuentes de datos en un análisis coherente.""",
-    name="AWS DevOps Agent",
-    description="Production AWS DevOps agent for cost optimization, IaC analysis, compliance validation, and automated infrastructure improvements",
-)
+        "generate_document",
+        "generate_cost_analysis_document",
+        "generate_security_compliance_document",
+        "generate_infrastructure_document",
+        "generate_cdk_analysis_document",
+        "generate_terraform_analysis_document",
+        "list_generated_documents",
+        "get_document_info",
+    ),
+}
+
+
+# Create the model and tools on first use so importing the app stays cheap
+@functools.lru_cache(maxsize=1)
+def get_agent_factory():
+    """Build the model and tool list once per worker; agents are built from it per invocation"""
+    from aws_devops_agent.app_factory import AgentFactory
+    
+    return AgentFactory(model_id, TOOL_CATEGORIES)
+
+
+# Bounds how many idle session conversations a worker keeps in memory
+MAX_SESSION_AGENTS: Final[int] = int(os.getenv("MAX_SESSION_AGENTS", "128"))
+
+
+@functools.lru_cache(maxsize=MAX_SESSION_AGENTS)
+def get_session_agent(session_id: str):
+    """Agent for one runtime session; tools it loads stay within that conversation"""
+    return get_agent_factory().build()
+
 
 # Create the Bedrock Agent Core app with environment configuration
 app = BedrockAgentCoreApp(debug=env_config.debug_mode)
 
 
 @app.entrypoint
-def invoke(payload):
-    """Process user input and return a response"""
+async def invoke(payload, context=None):
+    """Process user input and stream the response as it is generated"""
     request_id = f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     logger.info(f"[{request_id}] Received AWS DevOps payload: {payload}")
 
@@ -269,43 +222,29 @@ def invoke(payload):
 
         logger.info(f"[{request_id}] Processing query: {user_message[:100]}...")
 
-        # Process with Strands agent
-        response = agent(user_message)
-        logger.info(f"[{request_id}] Agent response generated successfully")
-
-        # Return JSON serializable response
-        if isinstance(response, str):
-            result = {
-                "response": response,
-                "status": "success",
-                "agent": "AWS DevOps Agent",
-                "request_id": request_id,
-                "capabilities": [
-                    "Real-time AWS cost analysis",
-                    "IaC analysis (Terraform/CloudFormation)",
-                    "Security compliance validation",
-                    "Multi-account operations",
-                    "Automated PR generation"
-                ]
-            }
-        else:
-            result = {
-                "response": str(response),
-                "status": "success",
-                "agent": "AWS DevOps Agent",
-                "request_id": request_id,
-                "data_source": "Real AWS APIs via MCP servers"
-            }
+        # Loaded tools and history belong to one session; requests without one get a fresh agent
+        session_id = getattr(context, "session_id", None)
+        agent = get_session_agent(session_id) if session_id else get_agent_factory().build()
+
+        # Stream text deltas from the Strands agent as SSE frames
+        async for event in agent.stream_async(user_message):
+            if "data" in event:
+                yield {"delta": str(event["data"])}
 
         logger.info(f"[{request_id}] Request completed successfully")
-        return result
+        yield {
+            "status": "success",
+            "agent": "AWS DevOps Agent",
+            "request_id": request_id,
+            "data_source": "Real AWS APIs via MCP servers"
+        }
 
     except Exception as e:
         error_msg = f"Error processing AWS DevOps request: {str(e)}"
         logger.error(f"[{request_id}] {error_msg}")
         logger.error(f"[{request_id}] Traceback: {traceback.format_exc()}")
         
-        return {
+        yield {
             "response": error_msg,
             "status": "error",
             "error": str(e),
@@ -331,6 +270,17 @@ def health_check():
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _environment_snapshot():
+    """Serializable configuration for /metrics (fixed for the life of the worker)"""
+    return get_app_config().to_dict()
+
+
+def _environment_info():
+    """Copy of the cached configuration, so callers cannot alter it (it holds nested dicts)"""
+    return copy.deepcopy(_environment_snapshot())
+
+
 @app.route("/metrics")
 def metrics():
     """Metrics endpoint for monitoring"""
@@ -338,14 +288,14 @@ def metrics():
         "agent_name": "AWS DevOps Agent",
         "version": "1.0.0",
         "uptime": "running",
-        "tools_loaded": len(agent.tools),
-        "environment": env_config.to_dict()
+        "tools_loaded": sum(len(names) for names in TOOL_CATEGORIES.values()),
+        "environment": _environment_info()
     }
 
 
 if __name__ == "__main__":
     print("🚀 Starting AWS DevOps Agent")
-    print(f"🤖 Agent: {agent.name}")
+    print(f"🤖 Agent: {get_agent_factory().build().name}")
     print(f"🧠 Model: {model_id}")
     print(f"🔧 Debug Mode: {env_config.debug_mode}")
     print(f"🌐 Server: {env_config.host}:{env_config.port}")
@@ -5,11 +5,14 @@ Focused demonstrations of specific security capabilities
 """
 
 import sys
+import random
 import asyncio
-from pathlib import Path
+import functools
+import itertools
 
 # Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 from aws_devops_agent.tools.aws_security import (
     analyze_security_hub_findings,
@@ -18,207 +21,220 @@ from aws_devops_agent.tools.aws_security import (
     get_security_recommendations,
     perform_comprehensive_security_analysis
 )
+from botocore.exceptions import ClientError
 
+# Section banners, built once
+_EQ40 = "=" * 40
+_EQ50 = "=" * 50
 
-async def demo_security_hub_focused():
-    """Demo Security Hub with specific focus"""
-    print("🔍 Security Hub Analysis Demo")
-    print("=" * 40)
-    print("Focus: Critical and High severity findings from last 7 days")
-    
-    try:
-        result = analyze_security_hub_findings(
-            severity_filter=['CRITICAL', 'HIGH'],
-            time_range_days=7
-        )
-        
-        print(f"Status: {result.get('status')}")
-        print(f"Data Source: {result.get('data_source')}")
-        
-        if result.get('status') == 'success':
-            analysis = result.get('analysis', {})
-            print(f"Total Findings: {result.get('total_findings', 0)}")
-            print(f"Severity Breakdown: {analysis.get('severity_breakdown', {})}")
-            print(f"Compliance Status: {analysis.get('compliance_status', 'Unknown')}")
+# AWS error codes that mean "slow down" rather than a real failure
+THROTTLE_CODES = ("Throttling", "ThrottlingException", "TooManyRequestsException", "RequestLimitExceeded")
+
+# At most four demos hit the AWS APIs at once
+_API_SLOTS = asyncio.Semaphore(4)
+
+
+def _is_throttled(result) -> bool:
+    """Tools report AWS errors in their result, so throttling is detected from the message"""
+    return (
+        isinstance(result, dict) and result.get("status") == "error"
+        and any(code in str(result.get("error", "")) for code in THROTTLE_CODES)
+    )
+
+
+async def _call(fn, max_attempts: int = 3, **kwargs):
+    """
+    Run a blocking boto3-backed tool in a worker thread, retrying throttled calls
+    with exponential backoff and jitter
+    """
+    async with _API_SLOTS:
+        for attempt in range(max_attempts):
+            try:
+                result = await asyncio.to_thread(fn, **kwargs)
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in THROTTLE_CODES or attempt == max_attempts - 1:
+                    raise
+            else:
+                if not _is_throttled(result) or attempt == max_attempts - 1:
+                    return result
+            await asyncio.sleep(min(15, 0.5 * 2 ** attempt + random.random()))
+
+
+def _buffer():
+    """Per-demo line buffer so concurrently running demos print as whole sections"""
+    lines = []
+    return lines, lines.append
+
+
+def demo_section(title: str, focus: str, tool_fn, **tool_args):
+    """
+    Turn a result renderer into a demo: prints the banner, calls the tool and reports
+    status, data source and failures, leaving only the success details to the renderer
+    """
+    def decorator(render):
+        @functools.wraps(render)
+        async def demo():
+            lines, emit = _buffer()
+            emit(title)
+            emit(_EQ40)
+            emit(f"Focus: {focus}")
             
-            # Show top threats
-            top_threats = analysis.get('top_threats', [])
-            if top_threats:
-                print("\n🚨 Top Security Threats:")
-                for i, threat in enumerate(top_threats[:3], 1):
-                    print(f"  {i}. {threat.get('threat')} ({threat.get('count')} occurrences)")
-        else:
-            print(f"Error: {result.get('error')}")
-            print(f"Suggestion: {result.get('suggestion')}")
+            try:
+                result = await _call(tool_fn, **tool_args)
+                
+                status = result.get('status')
+                emit(f"Status: {status}")
+                emit(f"Data Source: {result.get('data_source')}")
+                
+                if status == 'success':
+                    render(result, emit)
+                else:
+                    emit(f"Error: {result.get('error')}")
+                    emit(f"Suggestion: {result.get('suggestion')}")
+                    
+            except Exception as e:
+                emit(f"Exception: {e}")
             
-    except Exception as e:
-        print(f"Exception: {e}")
+            return "\n".join(lines) + "\n"
+        return demo
+    return decorator
+
+
+@demo_section(
+    "🔍 Security Hub Analysis Demo",
+    "Critical and High severity findings from last 7 days",
+    analyze_security_hub_findings,
+    severity_filter=['CRITICAL', 'HIGH'],
+    time_range_days=7
+)
+def demo_security_hub_focused(result, emit):
+    """Demo Security Hub with specific focus"""
+    analysis = result.get('analysis') or {}
+    emit(f"Total Findings: {result.get('total_findings', 0)}")
+    emit(f"Severity Breakdown: {analysis.get('severity_breakdown', {})}")
+    emit(f"Compliance Status: {analysis.get('compliance_status', 'Unknown')}")
+    
+    # Show top threats
+    top_threats = analysis.get('top_threats', [])
+    if top_threats:
+        emit("\n🚨 Top Security Threats:")
+        for i, threat in enumerate(itertools.islice(top_threats, 3), 1):
+            emit(f"  {i}. {threat.get('threat')} ({threat.get('count')} occurrences)")
 
 
-async def demo_config_compliance_focused():
+@demo_section(
+    "\n📋 Config Compliance Demo",
+    "Non-compliant resources and compliance score",
+    analyze_config_compliance,
+    compliance_types=['NON_COMPLIANT']
+)
+def demo_config_compliance_focused(result, emit):
     """Demo Config compliance with specific focus"""
-    print("\n📋 Config Compliance Demo")
-    print("=" * 40)
-    print("Focus: Non-compliant resources and compliance score")
+    analysis = result.get('analysis') or {}
+    non_compliant = analysis.get('non_compliant_resources', [])
+    emit(f"Compliance Score: {analysis.get('compliance_score', 0)}/100")
+    emit(f"Non-compliant Resources: {len(non_compliant)}")
     
-    try:
-        result = analyze_config_compliance(
-            compliance_types=['NON_COMPLIANT']
-        )
-        
-        print(f"Status: {result.get('status')}")
-        print(f"Data Source: {result.get('data_source')}")
-        
-        if result.get('status') == 'success':
-            analysis = result.get('analysis', {})
-            print(f"Compliance Score: {analysis.get('compliance_score', 0)}/100")
-            print(f"Non-compliant Resources: {len(analysis.get('non_compliant_resources', []))}")
-            
-            # Show non-compliant resources
-            non_compliant = analysis.get('non_compliant_resources', [])
-            if non_compliant:
-                print("\n❌ Non-Compliant Resources:")
-                for i, resource in enumerate(non_compliant[:3], 1):
-                    print(f"  {i}. {resource.get('resource_id')} ({resource.get('resource_type')})")
-        else:
-            print(f"Error: {result.get('error')}")
-            print(f"Suggestion: {result.get('suggestion')}")
-            
-    except Exception as e:
-        print(f"Exception: {e}")
+    # Show non-compliant resources
+    if non_compliant:
+        emit("\n❌ Non-Compliant Resources:")
+        for i, resource in enumerate(itertools.islice(non_compliant, 3), 1):
+            emit(f"  {i}. {resource.get('resource_id')} ({resource.get('resource_type')})")
 
 
-async def demo_inspector_focused():
+@demo_section(
+    "\n🔬 Inspector Vulnerability Demo",
+    "Critical vulnerabilities and affected resources",
+    analyze_inspector_findings,
+    severity_filter=['CRITICAL', 'HIGH']
+)
+def demo_inspector_focused(result, emit):
     """Demo Inspector with specific focus"""
-    print("\n🔬 Inspector Vulnerability Demo")
-    print("=" * 40)
-    print("Focus: Critical vulnerabilities and affected resources")
+    analysis = result.get('analysis') or {}
+    emit(f"Total Findings: {result.get('total_findings', 0)}")
+    emit(f"Risk Assessment: {analysis.get('risk_assessment', 'Unknown')}")
     
-    try:
-        result = analyze_inspector_findings(
-            severity_filter=['CRITICAL', 'HIGH']
-        )
-        
-        print(f"Status: {result.get('status')}")
-        print(f"Data Source: {result.get('data_source')}")
-        
-        if result.get('status') == 'success':
-            analysis = result.get('analysis', {})
-            print(f"Total Findings: {result.get('total_findings', 0)}")
-            print(f"Risk Assessment: {analysis.get('risk_assessment', 'Unknown')}")
-            
-            # Show affected resources
-            affected_resources = analysis.get('affected_resources', {})
-            if affected_resources:
-                print(f"\n🎯 Affected Resources: {len(affected_resources)}")
-                for i, (resource_id, data) in enumerate(list(affected_resources.items())[:3], 1):
-                    print(f"  {i}. {resource_id} ({data.get('type')}) - {data.get('vulnerability_count')} vulnerabilities")
-        else:
-            print(f"Error: {result.get('error')}")
-            print(f"Suggestion: {result.get('suggestion')}")
-            
-    except Exception as e:
-        print(f"Exception: {e}")
+    # Show affected resources
+    affected_resources = analysis.get('affected_resources', {})
+    if affected_resources:
+        emit(f"\n🎯 Affected Resources: {len(affected_resources)}")
+        for i, (resource_id, data) in enumerate(itertools.islice(affected_resources.items(), 3), 1):
+            emit(f"  {i}. {resource_id} ({data.get('type')}) - {data.get('vulnerability_count')} vulnerabilities")
 
 
-async def demo_trusted_advisor_focused():
+@demo_section(
+    "\n💡 Trusted Advisor Security Demo",
+    "Security-specific recommendations and issues",
+    get_security_recommendations
+)
+def demo_trusted_advisor_focused(result, emit):
     """Demo Trusted Advisor with specific focus"""
-    print("\n💡 Trusted Advisor Security Demo")
-    print("=" * 40)
-    print("Focus: Security-specific recommendations and issues")
+    analysis = result.get('analysis') or {}
+    security_issues = analysis.get('security_issues') or ()
+    emit(f"Security Checks: {result.get('total_security_checks', 0)}")
+    emit(f"Issues Found: {analysis.get('issues_found', len(security_issues))}")
     
-    try:
-        result = get_security_recommendations()
-        
-        print(f"Status: {result.get('status')}")
-        print(f"Data Source: {result.get('data_source')}")
-        
-        if result.get('status') == 'success':
-            analysis = result.get('analysis', {})
-            print(f"Security Checks: {result.get('total_security_checks', 0)}")
-            print(f"Issues Found: {analysis.get('issues_found', 0)}")
-            
-            # Show security issues
-            security_issues = analysis.get('security_issues', [])
-            if security_issues:
-                print("\n⚠️ Security Issues:")
-                for i, issue in enumerate(security_issues[:3], 1):
-                    print(f"  {i}. {issue.get('check_name')} - {issue.get('status')}")
-        else:
-            print(f"Error: {result.get('error')}")
-            print(f"Suggestion: {result.get('suggestion')}")
-            
-    except Exception as e:
-        print(f"Exception: {e}")
+    # Show security issues
+    if security_issues:
+        emit("\n⚠️ Security Issues:")
+        for i, issue in enumerate(itertools.islice(security_issues, 3), 1):
+            emit(f"  {i}. {issue.get('check_name')} - {issue.get('status')}")
 
 
-async def demo_comprehensive_focused():
+@demo_section(
+    "\n🛡️ Comprehensive Security Analysis Demo",
+    "Overall security score and top 3 actionable recommendations",
+    perform_comprehensive_security_analysis,
+    include_findings=True,
+    include_compliance=True,
+    include_vulnerabilities=True,
+    include_recommendations=True
+)
+def demo_comprehensive_focused(result, emit):
     """Demo comprehensive analysis with specific focus"""
-    print("\n🛡️ Comprehensive Security Analysis Demo")
-    print("=" * 40)
-    print("Focus: Overall security score and top 3 actionable recommendations")
+    summary = result.get('comprehensive_summary') or {}
+    emit(f"Overall Security Score: {summary.get('overall_security_score', 0)}/100")
+    emit(f"Risk Level: {summary.get('risk_level', 'Unknown')}")
+    emit(f"Total Issues: {summary.get('total_issues', 0)}")
     
-    try:
-        result = perform_comprehensive_security_analysis(
-            include_findings=True,
-            include_compliance=True,
-            include_vulnerabilities=True,
-            include_recommendations=True
-        )
-        
-        print(f"Status: {result.get('status')}")
-        print(f"Data Source: {result.get('data_source')}")
-        
-        if result.get('status') == 'success':
-            summary = result.get('comprehensive_summary', {})
-            print(f"Overall Security Score: {summary.get('overall_security_score', 0)}/100")
-            print(f"Risk Level: {summary.get('risk_level', 'Unknown')}")
-            print(f"Total Issues: {summary.get('total_issues', 0)}")
-            
-            # Show actionable recommendations
-            recommendations = result.get('actionable_recommendations', [])
-            if recommendations:
-                print("\n🎯 Top 3 Actionable Recommendations:")
-                for i, rec in enumerate(recommendations[:3], 1):
-                    print(f"  {i}. [{rec.get('priority', 'Unknown')}] {rec.get('action', 'Unknown')}")
-                    print(f"     Source: {rec.get('source', 'Unknown')}")
-        else:
-            print(f"Error: {result.get('error')}")
-            print(f"Suggestion: {result.get('suggestion')}")
-            
-    except Exception as e:
-        print(f"Exception: {e}")
+    # Show actionable recommendations
+    recommendations = result.get('actionable_recommendations', [])
+    if recommendations:
+        emit("\n🎯 Top 3 Actionable Recommendations:")
+        for i, rec in enumerate(itertools.islice(recommendations, 3), 1):
+            emit(f"  {i}. [{rec.get('priority', 'Unknown')}] {rec.get('action', 'Unknown')}")
+            emit(f"     Source: {rec.get('source', 'Unknown')}")
 
 
 async def demo_terraform_security_focused():
     """Demo Terraform security with specific focus"""
-    print("\n🏗️ Terraform Security Analysis Demo")
-    print("=" * 40)
-    print("Focus: Real AWS security analysis for infrastructure code")
+    lines, emit = _buffer()
+    emit("\n🏗️ Terraform Security Analysis Demo")
+    emit(_EQ40)
+    emit("Focus: Real AWS security analysis for infrastructure code")
     
     try:
-        # Simulate a Terraform project analysis
-        from aws_devops_agent.tools.aws_terraform import analyze_terraform_project
-        
         # This would normally analyze a real Terraform project
-        print("Note: This demo shows the integration capability")
-        print("In production, this would analyze actual Terraform files")
-        print("and use real AWS security APIs for analysis")
+        emit("Note: This demo shows the integration capability")
+        emit("In production, this would analyze actual Terraform files")
+        emit("and use real AWS security APIs for analysis")
         
-        print("\n✅ Terraform security analysis now uses:")
-        print("  - Real Security Hub findings")
-        print("  - Real Config compliance data")
-        print("  - Real Inspector vulnerability data")
-        print("  - Real Trusted Advisor recommendations")
+        emit("\n✅ Terraform security analysis now uses:")
+        emit("  - Real Security Hub findings")
+        emit("  - Real Config compliance data")
+        emit("  - Real Inspector vulnerability data")
+        emit("  - Real Trusted Advisor recommendations")
         
     except Exception as e:
-        print(f"Exception: {e}")
+        emit(f"Exception: {e}")
+    
+    return "\n".join(lines) + "\n"
 
 
 async def main():
     """Run focused security demos"""
     print("🚀 AWS Security Analysis - Focused Demos")
-    print("=" * 50)
+    print(_EQ50)
     print("Each demo focuses on specific capabilities with clear scope:")
     print("1. Security Hub: Critical/High findings from last 7 days")
     print("2. Config: Non-compliant resources and compliance score")
@@ -227,12 +243,20 @@ async def main():
     print("5. Comprehensive: Overall score and top 3 recommendations")
     print("6. Terraform: Real AWS security integration")
     
-    await demo_security_hub_focused()
-    await demo_config_compliance_focused()
-    await demo_inspector_focused()
-    await demo_trusted_advisor_focused()
-    await demo_comprehensive_focused()
-    await demo_terraform_security_focused()
+    # Independent demos run together; each section is printed in order once complete
+    sections = await asyncio.gather(
+        demo_security_hub_focused(),
+        demo_config_compliance_focused(),
+        demo_inspector_focused(),
+        demo_trusted_advisor_focused(),
+        demo_comprehensive_focused(),
+        demo_terraform_security_focused(),
+        return_exceptions=True
+    )
+    sys.stdout.write("".join(
+        f"Exception: {section}\n" if isinstance(section, Exception) else section
+        for section in sections
+    ))
     
     print("\n🎉 Focused Demos Completed!")
     print("\nKey Benefits Demonstrated:")
@@ -5,13 +5,13 @@ This demonstrates the CDK analysis tools without requiring the full agent setup
 """
 
 import os
-import sys
 import tempfile
 import json
 from pathlib import Path
 
-# Add src to path (go up two levels from docs/demos to project root)
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Add the src directory to the Python path
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 # Import CDK analysis functions directly
 from aws_devops_agent.tools.aws_cdk.cdk_analysis import (
@@ -22,29 +22,23 @@ from aws_devops_agent.tools.aws_cdk.cdk_analysis import (
 )
 
 
-def create_sample_cdk_project(project_path: str):
-    """Create a sample CDK project for demonstration"""
-    os.makedirs(project_path, exist_ok=True)
-    
-    # Create cdk.json
-    cdk_config = {
-        "version": "2.0.0",
-        "language": "typescript",
-        "app": "npx ts-node --prefer-ts-exts bin/app.ts",
-        "context": {
-            "@aws-cdk/aws-lambda:recognizeLayerVersion": True,
-            "@aws-cdk/core:checkSecretUsage": True
-        }
+# Section banners, built once
+_EQ60 = "=" * 60
+_DASH40 = "-" * 40
+
+
+# Sample project files, encoded once at import
+CDK_CONFIG = {
+    "version": "2.0.0",
+    "language": "typescript",
+    "app": "npx ts-node --prefer-ts-exts bin/app.ts",
+    "context": {
+        "@aws-cdk/aws-lambda:recognizeLayerVersion": True,
+        "@aws-cdk/core:checkSecretUsage": True
     }
-    
-    with open(os.path.join(project_path, "cdk.json"), 'w') as f:
-        json.dump(cdk_config, f, indent=2)
-    
-    # Create bin/app.ts
-    bin_dir = os.path.join(project_path, "bin")
-    os.makedirs(bin_dir, exist_ok=True)
-    
-    app_content = '''
+}
+
+APP_CONTENT = '''
 import { App } from 'aws-cdk-lib';
 import { SampleStack } from '../lib/sample-stack';
 
@@ -56,15 +50,8 @@ new SampleStack(app, 'SampleStack', {
   },
 });
 '''
-    
-    with open(os.path.join(bin_dir, "app.ts"), 'w') as f:
-        f.write(app_content)
-    
-    # Create lib/sample-stack.ts
-    lib_dir = os.path.join(project_path, "lib")
-    os.makedirs(lib_dir, exist_ok=True)
-    
-    stack_content = '''
+
+STACK_CONTENT = '''
 import { Stack, StackProps } from 'aws-cdk-lib';
 import { Construct } from 'constructs';
 import * as ec2 from 'aws-cdk-lib/aws-ec2';
@@ -114,15 +101,31 @@ export class SampleStack extends Stack {
   }
 }
 '''
-    
-    with open(os.path.join(lib_dir, "sample-stack.ts"), 'w') as f:
-        f.write(stack_content)
+
+SAMPLE_CDK_FILES = (
+    ("cdk.json", json.dumps(CDK_CONFIG, indent=2).encode()),
+    ("bin/app.ts", APP_CONTENT.encode()),
+    ("lib/sample-stack.ts", STACK_CONTENT.encode()),
+)
+
+
+def create_sample_cdk_project(project_path: str):
+    """Create a sample CDK project for demonstration"""
+    for rel_path, content in SAMPLE_CDK_FILES:
+        file_path = os.path.join(project_path, rel_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # One open/write/close per file with the pre-encoded bytes
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
 
 
 def demo_cdk_analysis():
     """Demonstrate CDK analysis functionality"""
     print("🚀 AWS DevOps Agent - CDK Analysis Demo")
-    print("=" * 60)
+    print(_EQ60)
     print()
     
     # Create temporary directory for demo project
@@ -135,7 +138,7 @@ def demo_cdk_analysis():
         
         # Demo 1: Analyze CDK project
         print("1️⃣ Analyzing CDK project structure...")
-        print("-" * 40)
+        print(_DASH40)
         
         try:
             analysis_result = analyze_cdk_project(project_path, "production")
@@ -205,7 +208,7 @@ def demo_cdk_analysis():
         
         # Demo 2: Generate optimization report
         print("2️⃣ Generating comprehensive optimization report...")
-        print("-" * 40)
+        print(_DASH40)
         
         try:
             report_result = generate_cdk_optimization_report(project_path, "production")
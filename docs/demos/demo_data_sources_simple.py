@@ -4,11 +4,11 @@ Demo: Data Source Indicators
 Demonstrates clear data source indicators in tool responses
 """
 
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 from aws_devops_agent.tools.aws_iac.terraform import analyze_terraform_configuration
 from aws_devops_agent.tools.aws_compliance.security import validate_security_policies
@@ -16,74 +16,50 @@ from aws_devops_agent.tools.github.integration import create_optimization_pull_r
 from aws_devops_agent.tools.reporting.document_generator import generate_document
 
 
+# Section banners, built once
+_EQ40 = "=" * 40
+_DASH25 = "-" * 25
+_DASH35 = "-" * 35
+_DASH40 = "-" * 40
+
+
 def demo_data_sources_simple():
     """Simple, focused data sources demo"""
     print("📊 Data Source Indicators Demo")
-    print("=" * 40)
+    print(_EQ40)
     print("Purpose: Show clear data source indicators in tool responses")
     print("Scope: Different tool types and their data sources")
     print()
     
-    # Test IaC Analysis
-    print("🏗️ Infrastructure as Code Analysis:")
-    print("-" * 40)
-    try:
-        result = analyze_terraform_configuration("/tmp", "production")
-        data_source = result.get("data_source", "Not specified")
-        print(f"   Data Source: {data_source}")
-        print(f"   Status: {result.get('status', 'Unknown')}")
-    except Exception as e:
-        print(f"   Error: {e}")
-    
-    print()
-    
-    # Test Security Validation
-    print("🔒 Security Policy Validation:")
-    print("-" * 35)
-    try:
-        result = validate_security_policies("EC2", {"InstanceType": "t3.micro"})
-        data_source = result.get("data_source", "Not specified")
-        print(f"   Data Source: {data_source}")
-        print(f"   Status: {result.get('status', 'Unknown')}")
-    except Exception as e:
-        print(f"   Error: {e}")
+    # The tool calls are independent, so they run together and are reported in order
+    sections = (
+        ("🏗️ Infrastructure as Code Analysis:", _DASH40,
+         analyze_terraform_configuration, ("/tmp", "production"), {}),
+        ("🔒 Security Policy Validation:", _DASH35,
+         validate_security_policies, ("EC2", {"InstanceType": "t3.micro"}), {}),
+        # GitHub Integration (without consent)
+        ("🐙 GitHub Integration (No Consent):", _DASH35,
+         create_optimization_pull_request, ("test/repo", "cost", {"changes": []}), {"user_consent": False}),
+        ("📄 Document Generation:", _DASH25,
+         generate_document, ("Test content", "Test Document", "general"), {}),
+    )
     
-    print()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(fn, *args, **kwargs) for _, _, fn, args, kwargs in sections]
+        
+        for (title, banner, _, _, _), future in zip(sections, futures):
+            print(title)
+            print(banner)
+            try:
+                result = future.result()
+                data_source = result.get("data_source", "Not specified")
+                print(f"   Data Source: {data_source}")
+                print(f"   Status: {result.get('status', 'Unknown')}")
+            except Exception as e:
+                print(f"   Error: {e}")
+            
+            print()
     
-    # Test GitHub Integration (without consent)
-    print("🐙 GitHub Integration (No Consent):")
-    print("-" * 35)
-    try:
-        result = create_optimization_pull_request(
-            "test/repo", 
-            "cost", 
-            {"changes": []}, 
-            user_consent=False
-        )
-        data_source = result.get("data_source", "Not specified")
-        print(f"   Data Source: {data_source}")
-        print(f"   Status: {result.get('status', 'Unknown')}")
-    except Exception as e:
-        print(f"   Error: {e}")
-    
-    print()
-    
-    # Test Document Generation
-    print("📄 Document Generation:")
-    print("-" * 25)
-    try:
-        result = generate_document(
-            "Test content", 
-            "Test Document", 
-            "general"
-        )
-        data_source = result.get("data_source", "Not specified")
-        print(f"   Data Source: {data_source}")
-        print(f"   Status: {result.get('status', 'Unknown')}")
-    except Exception as e:
-        print(f"   Error: {e}")
-    
-    print()
     print("🎉 Demo completed!")
     print("This shows how all tools now include clear data source indicators.")
 
@@ -4,12 +4,11 @@ Enhanced Document Generation Demo
 Showcases the improved report generation with icons and comprehensive content
 """
 
-import os
-import sys
 from pathlib import Path
 
-# Add src to path (go up two levels from docs/demos to project root)
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Add the src directory to the Python path
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 def demo_enhanced_reports():
     """Demonstrate enhanced document generation with icons and rich content"""
@@ -11,11 +11,12 @@ import os
 import sys
 import tempfile
 import shutil
-import json
-from datetime import datetime
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Add the src directory to the Python path
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 from aws_devops_agent.tools.aws_terraform.terraform_analysis import (
     analyze_terraform_project,
@@ -26,12 +27,134 @@ from aws_devops_agent.tools.aws_terraform.terraform_analysis import (
 )
 
 
-def create_sample_terraform_project():
-    """Create a sample Terraform project for demonstration"""
-    project_dir = tempfile.mkdtemp(prefix="terraform_demo_")
-    
-    # Create main.tf
-    main_tf = '''
+# Section banners, built once
+_EQ50 = "=" * 50
+_DASH15 = "-" * 15
+_DASH25 = "-" * 25
+_DASH30 = "-" * 30
+_DASH35 = "-" * 35
+_DASH40 = "-" * 40
+
+
+# Canned analysis results for the report step, built once
+MOCK_ANALYSIS_DATA = {
+    "environment": "production",
+    "security": {
+        "overall_security_score": 65,
+        "security_issues": [
+            {
+                "type": "Hardcoded Secrets",
+                "severity": "High",
+                "count": 1,
+                "description": "Hardcoded password in RDS configuration"
+            },
+            {
+                "type": "Public Resources",
+                "severity": "Medium",
+                "count": 3,
+                "description": "Security groups allow access from 0.0.0.0/0"
+            },
+            {
+                "type": "Missing Encryption",
+                "severity": "Medium",
+                "count": 1,
+                "description": "RDS instance missing encryption configuration"
+            }
+        ]
+    },
+    "cost_optimization": {
+        "estimated_monthly_cost": "$1,250.00",
+        "potential_savings": "$300.00/month",
+        "savings_percentage": 24,
+        "optimization_opportunities": [
+            {
+                "resource_type": "EC2 Instances",
+                "current_cost": "$800.00",
+                "optimized_cost": "$600.00",
+                "savings": "$200.00",
+                "recommendation": "Use t3.medium instead of t3.large for non-production workloads"
+            },
+            {
+                "resource_type": "RDS Instances",
+                "current_cost": "$300.00",
+                "optimized_cost": "$200.00",
+                "savings": "$100.00",
+                "recommendation": "Use gp3 storage instead of gp2 and enable automated backups"
+            }
+        ]
+    },
+    "best_practices": {
+        "overall_score": 75,
+        "violations": [
+            {
+                "practice": "Resource naming conventions",
+                "severity": "Low",
+                "count": 2,
+                "description": "Some resources don't follow consistent naming patterns"
+            },
+            {
+                "practice": "Module usage",
+                "severity": "Medium",
+                "count": 1,
+                "description": "Consider using modules for repeated security group configurations"
+            },
+            {
+                "practice": "Variable usage",
+                "severity": "Low",
+                "count": 1,
+                "description": "Some hardcoded values could be parameterized"
+            }
+        ]
+    },
+    "recommendations": [
+        {
+            "category": "Security",
+            "priority": "High",
+            "description": "Address Hardcoded Secrets: Hardcoded password in RDS configuration",
+            "impact": "High"
+        },
+        {
+            "category": "Security",
+            "priority": "Medium",
+            "description": "Address Public Resources: Security groups allow access from 0.0.0.0/0",
+            "impact": "High"
+        },
+        {
+            "category": "Cost Optimization",
+            "priority": "High",
+            "description": "EC2 Instance Optimization: Use t3.medium instead of t3.large (Save $200.00/month)",
+            "impact": "Medium"
+        },
+        {
+            "category": "Best Practices",
+            "priority": "Medium",
+            "description": "Fix Module usage: Consider using modules for repeated security group configurations",
+            "impact": "Low"
+        }
+    ]
+}
+
+
+# Consoles that cannot encode emoji get plain-text labels, swapped in once per buffered section
+USE_EMOJI = (sys.stdout.encoding or "").lower().replace("-", "").startswith("utf")
+_ASCII_LABELS = str.maketrans({
+    "✅": "[OK]", "❌": "[FAIL]", "⚠": "[WARN]", "💡": "[TIP]", "⏳": "[...]", "⏹": "[STOP]",
+    "🎉": "[DONE]", "🎯": "[GOAL]", "🏗": "[TF]", "💰": "[$]", "📁": "[DIR]", "📄": "[DOC]",
+    "📅": "[DATE]", "📊": "[#]", "📋": "[LIST]", "📝": "[NOTE]", "🔍": "[SCAN]", "🔒": "[SEC]",
+    "🔧": "[TOOL]", "🗃": "[STATE]", "🚀": "[>>]", "🧹": "[CLEAN]", "•": "-", "\ufe0f": None,
+})
+
+
+def _flush(lines):
+    """Write the buffered lines to stdout in one call and empty the buffer"""
+    if lines:
+        text = "\n".join(lines) + "\n"
+        sys.stdout.write(text if USE_EMOJI else text.translate(_ASCII_LABELS))
+        lines.clear()
+
+
+# Sample project files, encoded once at import
+MAIN_TF = '''
 provider "aws" {
   region = "us-east-1"
 }
@@ -178,9 +301,8 @@ resource "random_string" "bucket_suffix" {
   upper   = false
 }
 '''
-    
-    # Create variables.tf
-    variables_tf = '''
+
+VARIABLES_TF = '''
 variable "environment" {
   description = "Environment name"
   type        = string
@@ -204,9 +326,8 @@ variable "db_instance_class" {
   default     = "db.t3.medium"
 }
 '''
-    
-    # Create outputs.tf
-    outputs_tf = '''
+
+OUTPUTS_TF = '''
 output "web_server_id" {
   description = "ID of the web server instance"
   value       = aws_instance.web_server.id
@@ -236,333 +357,283 @@ output "security_group_ids" {
   }
 }
 '''
-    
-    # Create terraform.tfvars
-    tfvars = '''
+
+TFVARS = '''
 environment = "production"
 instance_type = "t3.large"
 db_instance_class = "db.t3.medium"
 '''
+
+# Sample projects are short-lived, so keep them on tmpfs when the system has one
+SAMPLE_PROJECT_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+SAMPLE_TERRAFORM_FILES = (
+    ("main.tf", MAIN_TF.encode()),
+    ("variables.tf", VARIABLES_TF.encode()),
+    ("outputs.tf", OUTPUTS_TF.encode()),
+    ("terraform.tfvars", TFVARS.encode()),
+)
+
+
+def create_sample_terraform_project():
+    """Create a sample Terraform project for demonstration, returning its directory and file paths"""
+    project_dir = tempfile.mkdtemp(prefix="terraform_demo_", dir=SAMPLE_PROJECT_ROOT)
+    file_paths = tuple(os.path.join(project_dir, filename) for filename, _ in SAMPLE_TERRAFORM_FILES)
     
-    # Write files
-    files = {
-        'main.tf': main_tf,
-        'variables.tf': variables_tf,
-        'outputs.tf': outputs_tf,
-        'terraform.tfvars': tfvars
-    }
-    
-    for filename, content in files.items():
-        with open(os.path.join(project_dir, filename), 'w') as f:
-            f.write(content)
+    for file_path, (_, content) in zip(file_paths, SAMPLE_TERRAFORM_FILES):
+        # Raw fd write, skipping the text and buffering layers of open()
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
     
-    return project_dir
+    return project_dir, file_paths
+
+
+def remove_sample_terraform_project(project_dir, file_paths):
+    """Remove the sample project, walking the tree only if the tools left extra files behind"""
+    try:
+        for file_path in file_paths:
+            os.unlink(file_path)
+        os.rmdir(project_dir)
+    except OSError:
+        shutil.rmtree(project_dir, ignore_errors=True)
+
+
+def _validate_and_plan(project_dir):
+    """Validate then plan; both run terraform init in the project, so they must not overlap"""
+    return validate_terraform_configuration(project_dir), plan_terraform_changes(project_dir, "production")
 
 
 def demo_terraform_analysis():
     """Demonstrate Terraform analysis capabilities"""
-    print("🏗️  TERRAFORM ANALYSIS DEMO")
-    print("=" * 50)
-    print()
+    # Reuse downloaded providers across runs instead of fetching them into each temp project
+    plugin_cache = os.path.join(os.path.expanduser("~"), ".terraform.d", "plugin-cache")
+    os.makedirs(plugin_cache, exist_ok=True)
+    os.environ.setdefault("TF_PLUGIN_CACHE_DIR", plugin_cache)
+    os.environ.setdefault("TF_IN_AUTOMATION", "1")
+    
+    # Each section is buffered and written once, before the next tool call
+    out = []
+    p = out.append
+    p("🏗️  TERRAFORM ANALYSIS DEMO")
+    p(_EQ50)
+    p("")
     
     # Create sample project
-    print("📁 Creating sample Terraform project...")
-    project_dir = create_sample_terraform_project()
-    print(f"   ✅ Project created at: {project_dir}")
-    print()
+    p("📁 Creating sample Terraform project...")
+    project_dir, file_paths = create_sample_terraform_project()
+    p(f"   ✅ Project created at: {project_dir}")
+    p("")
     
     try:
-        # 1. Analyze Terraform Project
-        print("🔍 1. ANALYZING TERRAFORM PROJECT")
-        print("-" * 30)
+        # Steps 1-4 only read the project, so they run concurrently
+        p("⏳ Running project analysis, validation, plan and state checks...")
+        p("")
+        _flush(out)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            analysis_future = executor.submit(analyze_terraform_project, project_dir, "production")
+            validate_and_plan_future = executor.submit(_validate_and_plan, project_dir)
+            state_future = executor.submit(analyze_terraform_state, project_dir)
+        analysis_result = analysis_future.result()
+        validation_result, plan_result = validate_and_plan_future.result()
+        state_result = state_future.result()
         
-        analysis_result = analyze_terraform_project(project_dir, "production")
+        # 1. Analyze Terraform Project
+        p("🔍 1. ANALYZING TERRAFORM PROJECT")
+        p(_DASH30)
         
         if analysis_result["status"] == "success":
-            print("   ✅ Project analysis completed successfully")
+            p("   ✅ Project analysis completed successfully")
             data = analysis_result["data"]
-            print(f"   📊 Environment: {data['environment']}")
-            print(f"   📅 Analysis timestamp: {data['analysis_timestamp']}")
-            print(f"   💰 Cost impact: {analysis_result.get('cost_impact', 'N/A')}")
-            print(f"   📋 Recommendations: {len(data.get('recommendations', []))}")
+            p(f"   📊 Environment: {data['environment']}")
+            p(f"   📅 Analysis timestamp: {data['analysis_timestamp']}")
+            p(f"   💰 Cost impact: {analysis_result.get('cost_impact', 'N/A')}")
+            p(f"   📋 Recommendations: {len(data.get('recommendations', []))}")
         else:
-            print(f"   ⚠️  Project analysis: {analysis_result['status']}")
-            print(f"   📝 Error: {analysis_result.get('error', 'Unknown error')}")
-            print(f"   💡 Suggestion: {analysis_result.get('suggestion', 'N/A')}")
+            p(f"   ⚠️  Project analysis: {analysis_result['status']}")
+            p(f"   📝 Error: {analysis_result.get('error', 'Unknown error')}")
+            p(f"   💡 Suggestion: {analysis_result.get('suggestion', 'N/A')}")
         
-        print()
+        p("")
         
         # 2. Validate Configuration
-        print("✅ 2. VALIDATING TERRAFORM CONFIGURATION")
-        print("-" * 40)
-        
-        validation_result = validate_terraform_configuration(project_dir)
+        p("✅ 2. VALIDATING TERRAFORM CONFIGURATION")
+        p(_DASH40)
         
         if validation_result["status"] == "success":
-            print("   ✅ Configuration validation completed")
+            p("   ✅ Configuration validation completed")
             if validation_result["data"]["validation_passed"]:
-                print("   ✅ Configuration is valid")
+                p("   ✅ Configuration is valid")
             else:
-                print("   ❌ Configuration has errors")
-                print(f"   📝 Errors: {validation_result['data'].get('errors', 'N/A')}")
+                p("   ❌ Configuration has errors")
+                p(f"   📝 Errors: {validation_result['data'].get('errors', 'N/A')}")
         else:
-            print(f"   ⚠️  Validation: {validation_result['status']}")
-            print(f"   📝 Error: {validation_result.get('error', 'Unknown error')}")
+            p(f"   ⚠️  Validation: {validation_result['status']}")
+            p(f"   📝 Error: {validation_result.get('error', 'Unknown error')}")
         
-        print()
+        p("")
         
         # 3. Generate Plan
-        print("📋 3. GENERATING TERRAFORM PLAN")
-        print("-" * 30)
-        
-        plan_result = plan_terraform_changes(project_dir, "production")
+        p("📋 3. GENERATING TERRAFORM PLAN")
+        p(_DASH30)
         
         if plan_result["status"] == "success":
-            print("   ✅ Plan generation completed")
-            print(f"   📊 Environment: {plan_result['data']['environment']}")
-            print(f"   📁 Plan file: {plan_result['data'].get('plan_file', 'N/A')}")
+            p("   ✅ Plan generation completed")
+            p(f"   📊 Environment: {plan_result['data']['environment']}")
+            p(f"   📁 Plan file: {plan_result['data'].get('plan_file', 'N/A')}")
         else:
-            print(f"   ⚠️  Plan generation: {plan_result['status']}")
-            print(f"   📝 Error: {plan_result.get('error', 'Unknown error')}")
+            p(f"   ⚠️  Plan generation: {plan_result['status']}")
+            p(f"   📝 Error: {plan_result.get('error', 'Unknown error')}")
         
-        print()
+        p("")
         
         # 4. Analyze State (if exists)
-        print("🗃️  4. ANALYZING TERRAFORM STATE")
-        print("-" * 30)
-        
-        state_result = analyze_terraform_state(project_dir)
+        p("🗃️  4. ANALYZING TERRAFORM STATE")
+        p(_DASH30)
         
         if state_result["status"] == "success":
-            print("   ✅ State analysis completed")
-            print(f"   📊 Resource count: {state_result['data']['resource_count']}")
-            print(f"   🔧 Terraform version: {state_result['data'].get('terraform_version', 'N/A')}")
+            p("   ✅ State analysis completed")
+            p(f"   📊 Resource count: {state_result['data']['resource_count']}")
+            p(f"   🔧 Terraform version: {state_result['data'].get('terraform_version', 'N/A')}")
         else:
-            print(f"   ⚠️  State analysis: {state_result['status']}")
-            print(f"   📝 Message: {state_result.get('error', 'No state file found (expected)')}")
+            p(f"   ⚠️  State analysis: {state_result['status']}")
+            p(f"   📝 Message: {state_result.get('error', 'No state file found (expected)')}")
         
-        print()
+        p("")
         
         # 5. Generate Optimization Report
-        print("📊 5. GENERATING OPTIMIZATION REPORT")
-        print("-" * 35)
+        p("📊 5. GENERATING OPTIMIZATION REPORT")
+        p(_DASH35)
         
-        # Create mock analysis results for demonstration
+        # Mock analysis results for demonstration; only the project path varies per run
         mock_analysis_results = {
             "status": "success",
-            "data": {
-                "project_path": project_dir,
-                "environment": "production",
-                "security": {
-                    "overall_security_score": 65,
-                    "security_issues": [
-                        {
-                            "type": "Hardcoded Secrets",
-                            "severity": "High",
-                            "count": 1,
-                            "description": "Hardcoded password in RDS configuration"
-                        },
-                        {
-                            "type": "Public Resources",
-                            "severity": "Medium",
-                            "count": 3,
-                            "description": "Security groups allow access from 0.0.0.0/0"
-                        },
-                        {
-                            "type": "Missing Encryption",
-                            "severity": "Medium",
-                            "count": 1,
-                            "description": "RDS instance missing encryption configuration"
-                        }
-                    ]
-                },
-                "cost_optimization": {
-                    "estimated_monthly_cost": "$1,250.00",
-                    "potential_savings": "$300.00/month",
-                    "savings_percentage": 24,
-                    "optimization_opportunities": [
-                        {
-                            "resource_type": "EC2 Instances",
-                            "current_cost": "$800.00",
-                            "optimized_cost": "$600.00",
-                            "savings": "$200.00",
-                            "recommendation": "Use t3.medium instead of t3.large for non-production workloads"
-                        },
-                        {
-                            "resource_type": "RDS Instances",
-                            "current_cost": "$300.00",
-                            "optimized_cost": "$200.00",
-                            "savings": "$100.00",
-                            "recommendation": "Use gp3 storage instead of gp2 and enable automated backups"
-                        }
-                    ]
-                },
-                "best_practices": {
-                    "overall_score": 75,
-                    "violations": [
-                        {
-                            "practice": "Resource naming conventions",
-                            "severity": "Low",
-                            "count": 2,
-                            "description": "Some resources don't follow consistent naming patterns"
-                        },
-                        {
-                            "practice": "Module usage",
-                            "severity": "Medium",
-                            "count": 1,
-                            "description": "Consider using modules for repeated security group configurations"
-                        },
-                        {
-                            "practice": "Variable usage",
-                            "severity": "Low",
-                            "count": 1,
-                            "description": "Some hardcoded values could be parameterized"
-                        }
-                    ]
-                },
-                "recommendations": [
-                    {
-                        "category": "Security",
-                        "priority": "High",
-                        "description": "Address Hardcoded Secrets: Hardcoded password in RDS configuration",
-                        "impact": "High"
-                    },
-                    {
-                        "category": "Security",
-                        "priority": "Medium",
-                        "description": "Address Public Resources: Security groups allow access from 0.0.0.0/0",
-                        "impact": "High"
-                    },
-                    {
-                        "category": "Cost Optimization",
-                        "priority": "High",
-                        "description": "EC2 Instance Optimization: Use t3.medium instead of t3.large (Save $200.00/month)",
-                        "impact": "Medium"
-                    },
-                    {
-                        "category": "Best Practices",
-                        "priority": "Medium",
-                        "description": "Fix Module usage: Consider using modules for repeated security group configurations",
-                        "impact": "Low"
-                    }
-                ]
-            }
+            "data": {"project_path": project_dir, **MOCK_ANALYSIS_DATA}
         }
         
+        _flush(out)
         report_result = generate_terraform_optimization_report(mock_analysis_results)
         
         if report_result["status"] == "success":
-            print("   ✅ Optimization report generated successfully")
-            print(f"   📊 Overall score: {report_result['data']['overall_score']}/100")
-            print(f"   💰 Potential savings: {report_result.get('cost_impact', 'N/A')}")
-            print(f"   📋 Recommendations: {len(report_result['data']['sections']['recommendations'])}")
+            p("   ✅ Optimization report generated successfully")
+            p(f"   📊 Overall score: {report_result['data']['overall_score']}/100")
+            p(f"   💰 Potential savings: {report_result.get('cost_impact', 'N/A')}")
+            lengths = report_result['data']['section_lengths']
+            p(f"   📋 Recommendations: {lengths['recommendations']}")
             
             # Display report sections
-            sections = report_result['data']['sections']
-            print()
-            print("   📋 REPORT SECTIONS:")
-            print(f"   • Executive Summary: {len(sections['executive_summary'])} characters")
-            print(f"   • Security Findings: {len(sections['security_findings'])} characters")
-            print(f"   • Cost Optimization: {len(sections['cost_optimization'])} characters")
-            print(f"   • Best Practices: {len(sections['best_practices'])} characters")
-            print(f"   • Recommendations: {len(sections['recommendations'])} characters")
-            print(f"   • Next Steps: {len(sections['next_steps'])} characters")
+            p("")
+            p("   📋 REPORT SECTIONS:")
+            p(f"   • Executive Summary: {lengths['executive_summary']} characters")
+            p(f"   • Security Findings: {lengths['security_findings']} characters")
+            p(f"   • Cost Optimization: {lengths['cost_optimization']} characters")
+            p(f"   • Best Practices: {lengths['best_practices']} characters")
+            p(f"   • Recommendations: {lengths['recommendations']} characters")
+            p(f"   • Next Steps: {lengths['next_steps']} characters")
         else:
-            print(f"   ⚠️  Report generation: {report_result['status']}")
-            print(f"   📝 Error: {report_result.get('error', 'Unknown error')}")
+            p(f"   ⚠️  Report generation: {report_result['status']}")
+            p(f"   📝 Error: {report_result.get('error', 'Unknown error')}")
         
-        print()
+        p("")
         
         # 6. Display Sample Report Content
-        print("📄 6. SAMPLE REPORT CONTENT")
-        print("-" * 25)
+        p("📄 6. SAMPLE REPORT CONTENT")
+        p(_DASH25)
         
         if report_result["status"] == "success":
             sections = report_result['data']['sections']
             
-            print("   📊 EXECUTIVE SUMMARY:")
-            print(f"   {sections['executive_summary'].strip()}")
-            print()
+            p("   📊 EXECUTIVE SUMMARY:")
+            p(f"   {sections['executive_summary'].strip()}")
+            p("")
             
-            print("   🔒 SECURITY FINDINGS:")
-            print(f"   {sections['security_findings'].strip()}")
-            print()
+            p("   🔒 SECURITY FINDINGS:")
+            p(f"   {sections['security_findings'].strip()}")
+            p("")
             
-            print("   💰 COST OPTIMIZATION:")
-            print(f"   {sections['cost_optimization'].strip()}")
-            print()
+            p("   💰 COST OPTIMIZATION:")
+            p(f"   {sections['cost_optimization'].strip()}")
+            p("")
             
-            print("   📋 RECOMMENDATIONS:")
-            print(f"   {sections['recommendations'].strip()}")
-            print()
+            p("   📋 RECOMMENDATIONS:")
+            p(f"   {sections['recommendations'].strip()}")
+            p("")
             
-            print("   🎯 NEXT STEPS:")
-            print(f"   {sections['next_steps'].strip()}")
+            p("   🎯 NEXT STEPS:")
+            p(f"   {sections['next_steps'].strip()}")
         
-        print()
+        p("")
         
         # 7. Summary
-        print("📊 7. DEMO SUMMARY")
-        print("-" * 15)
-        print("   ✅ Terraform project analysis completed")
-        print("   ✅ Configuration validation tested")
-        print("   ✅ Plan generation demonstrated")
-        print("   ✅ State analysis showcased")
-        print("   ✅ Optimization report generated")
-        print("   ✅ Security, cost, and best practices analysis provided")
-        print()
-        print("   🎯 KEY CAPABILITIES DEMONSTRATED:")
-        print("   • Comprehensive Terraform project analysis")
-        print("   • Security vulnerability detection")
-        print("   • Cost optimization recommendations")
-        print("   • Best practices validation")
-        print("   • Detailed reporting and recommendations")
-        print("   • Integration with AWS DevOps Agent")
+        p("📊 7. DEMO SUMMARY")
+        p(_DASH15)
+        p("   ✅ Terraform project analysis completed")
+        p("   ✅ Configuration validation tested")
+        p("   ✅ Plan generation demonstrated")
+        p("   ✅ State analysis showcased")
+        p("   ✅ Optimization report generated")
+        p("   ✅ Security, cost, and best practices analysis provided")
+        p("")
+        p("   🎯 KEY CAPABILITIES DEMONSTRATED:")
+        p("   • Comprehensive Terraform project analysis")
+        p("   • Security vulnerability detection")
+        p("   • Cost optimization recommendations")
+        p("   • Best practices validation")
+        p("   • Detailed reporting and recommendations")
+        p("   • Integration with AWS DevOps Agent")
         
     except Exception as e:
-        print(f"❌ Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # The exception line is enough for a demo; skip formatting every stack frame
+        p(f"❌ Demo failed: {''.join(traceback.format_exception_only(type(e), e)).strip()}")
     
     finally:
         # Cleanup
-        print()
-        print("🧹 Cleaning up demo project...")
-        shutil.rmtree(project_dir, ignore_errors=True)
-        print("   ✅ Demo project cleaned up")
+        p("")
+        p("🧹 Cleaning up demo project...")
+        remove_sample_terraform_project(project_dir, file_paths)
+        p("   ✅ Demo project cleaned up")
+        _flush(out)
 
 
 def main():
     """Main demo function"""
-    print("🚀 AWS DevOps Agent - Terraform Analysis Demo")
-    print("=" * 50)
-    print()
-    print("This demo showcases the Terraform analysis capabilities")
-    print("of the AWS DevOps Agent, including:")
-    print("• Project analysis and validation")
-    print("• Security vulnerability detection")
-    print("• Cost optimization recommendations")
-    print("• Best practices validation")
-    print("• Comprehensive reporting")
-    print()
+    if not USE_EMOJI and hasattr(sys.stdout, "reconfigure"):
+        # Anything the table misses (e.g. in tool output) degrades to '?' instead of raising
+        sys.stdout.reconfigure(errors="replace")
+    
+    out = []
+    p = out.append
+    p("🚀 AWS DevOps Agent - Terraform Analysis Demo")
+    p(_EQ50)
+    p("")
+    p("This demo showcases the Terraform analysis capabilities")
+    p("of the AWS DevOps Agent, including:")
+    p("• Project analysis and validation")
+    p("• Security vulnerability detection")
+    p("• Cost optimization recommendations")
+    p("• Best practices validation")
+    p("• Comprehensive reporting")
+    p("")
     
+    _flush(out)
     try:
         demo_terraform_analysis()
-        print()
-        print("🎉 Demo completed successfully!")
-        print()
-        print("💡 To use these capabilities in your own projects:")
-        print("   1. Install Terraform CLI: https://terraform.io/downloads")
-        print("   2. Run: python src/aws_devops_agent/main.py")
-        print("   3. Ask: 'Analyze my Terraform project at /path/to/project'")
-        print()
+        p("")
+        p("🎉 Demo completed successfully!")
+        p("")
+        p("💡 To use these capabilities in your own projects:")
+        p("   1. Install Terraform CLI: https://terraform.io/downloads")
+        p("   2. Run: python src/aws_devops_agent/main.py")
+        p("   3. Ask: 'Analyze my Terraform project at /path/to/project'")
+        p("")
         
     except KeyboardInterrupt:
-        print("\n\n⏹️  Demo interrupted by user")
+        p("\n\n⏹️  Demo interrupted by user")
     except Exception as e:
-        print(f"\n\n❌ Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+        p(f"\n\n❌ Demo failed: {''.join(traceback.format_exception_only(type(e), e)).strip()}")
+    _flush(out)
 
 
 if __name__ == "__main__":
@@ -7,11 +7,17 @@ Modern entry point following Python best practices
 import sys
 from pathlib import Path
 
-# Add src to Python path for development
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src to Python path for development, once per process
+SRC_PATH = str(Path(__file__).resolve().parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+
+def _entry() -> int:
+    """Import the agent only when the script runs, not when it is imported"""
+    from aws_devops_agent.main import main
+    return main()
 
-from aws_devops_agent.main import main
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(_entry())
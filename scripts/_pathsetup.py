@@ -0,0 +1,17 @@
+"""
+Shared path setup for the helper scripts
+Puts the project's src/ directory on sys.path once, however many scripts are imported
+"""
+
+import functools
+import os
+import sys
+
+SRC_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+@functools.cache
+def ensure_src_on_path() -> None:
+    """Add src/ to the front of sys.path if it is not already there"""
+    if SRC_PATH not in sys.path:
+        sys.path.insert(0, SRC_PATH)
@@ -16,11 +16,28 @@ pip install --upgrade pip
 pip install -r requirements-production.txt
 
 echo "📦 Installing AWS MCP servers..."
-uv tool install awslabs.cost-explorer-mcp-server@latest
-uv tool install awslabs.cloudwatch-mcp-server@latest
-uv tool install awslabs.aws-pricing-mcp-server@latest
-uv tool install awslabs.terraform-mcp-server@latest
-uv tool install awslabs.dynamodb-mcp-server@latest
+# Each install is an independent download, so run them concurrently
+# Output goes to a log per server so a failure can show uv's error without interleaving
+servers=(cost-explorer cloudwatch aws-pricing terraform dynamodb)
+logdir=$(mktemp -d)
+trap 'rm -rf "$logdir"' EXIT
+pids=()
+for server in "${servers[@]}"; do
+    uv tool install "awslabs.${server}-mcp-server@latest" >"$logdir/$server.log" 2>&1 &
+    pids+=("$!")
+done
+
+failed=0
+for i in "${!servers[@]}"; do
+    if wait "${pids[$i]}"; then
+        echo "✅ Installed ${servers[$i]}-mcp-server"
+    else
+        echo "❌ Failed to install ${servers[$i]}-mcp-server:"
+        cat "$logdir/${servers[$i]}.log"
+        failed=1
+    fi
+done
+[ "$failed" -eq 0 ] || exit 1
 # Note: GitHub MCP server requires Docker (ghcr.io/github/github-mcp-server)
 
 echo "✅ Setup complete! Run: source .venv/bin/activate"
\ No newline at end of file
@@ -2,30 +2,30 @@
 """Test GitHub connectivity using the GitHub MCP tools"""
 
 import sys
-import os
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 try:
-    from aws_devops_agent.tools.github.integration import check_repository_connectivity, get_repository_info
+    from aws_devops_agent.tools.github.integration import get_repository_info
     
     # Get repository from command line argument or use default
     repo = sys.argv[1] if len(sys.argv) > 1 else 'octocat/Hello-World'
     
     print(f"Testing connectivity to {repo}...")
     
-    # Test connectivity
-    result = check_repository_connectivity(repo)
+    # Test connectivity; the repository info call reads the repo root (the same
+    # access check check_repository_connectivity makes) and lists branches in one session
+    result = get_repository_info(repo)
     print('Connectivity:', '✅ Success' if result.get('status') == 'success' else '❌ Failed:', result.get('error', 'Unknown error'))
     
-    # Test repository info if connectivity succeeded
+    # Report repository info if connectivity succeeded
     if result.get('status') == 'success':
-        print('Repository Info:', '✅ Success' if result.get('status') == 'success' else '❌ Failed')
-        info = get_repository_info(repo)
-        print('Branches:', info.get('branch_count', 0), 'found')
+        print('Repository Info:', '✅ Success')
+        print('Branches:', result.get('branch_count', 0), 'found')
     else:
-        print('Repository Info: ❌ Skipped (connectivity failed)')
+        print('Repository Info: ❌ Failed')
         
 except Exception as e:
     print(f"❌ Error testing GitHub connectivity: {e}")
@@ -4,21 +4,18 @@ Environment Configuration Validation Script
 Validates environment configuration for AgentCore deployment
 """
 
-import sys
 import os
-from pathlib import Path
 
 # Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
-# Import only the env_config module directly
-sys.path.insert(0, str(src_path / "aws_devops_agent" / "config"))
-from env_config import load_env_file, get_env_config
+from _pathsetup import ensure_src_on_path
+ensure_src_on_path()
 
 def main():
     """Validate environment configuration"""
     try:
+        # Deferred so importing the script stays cheap
+        from aws_devops_agent.config.env_config import load_env_file, get_env_config
+        
         print("🔍 Validating environment configuration...")
         
         # Load environment file
@@ -3,7 +3,14 @@ AWS DevOps Agent - Main Package
 Production-ready AWS DevOps automation with Strands + Bedrock Agent Core
 """
 
-from .main import AWSDevOpsAgentV2
-
 __all__ = ["AWSDevOpsAgentV2"]
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    """Import the agent (and with it strands and boto3) on first access"""
+    if name == "AWSDevOpsAgentV2":
+        from .main import AWSDevOpsAgentV2
+        globals()[name] = AWSDevOpsAgentV2
+        return AWSDevOpsAgentV2
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
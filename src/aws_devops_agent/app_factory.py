@@ -0,0 +1,70 @@
+"""
+Agent factory for the AWS DevOps Agent
+Builds the Bedrock Agent Core agent from a model ID and a tool catalog
+"""
+
+from typing import Dict, Iterable
+
+from strands import Agent
+from strands.models import BedrockModel, CacheConfig
+
+from .prompts import load_prompt
+from .tools.batch import run_tools_batch
+from .tools.lazy_registry import LazyToolRegistry
+
+AGENT_NAME = "AWS DevOps Agent"
+AGENT_DESCRIPTION = (
+    "Production AWS DevOps agent for cost optimization, IaC analysis, "
+    "compliance validation, and automated infrastructure improvements"
+)
+
+
+class AgentFactory:
+    """Builds agents that share one Bedrock model and one set of discovery tools"""
+
+    def __init__(self, model_id: str, tool_categories: Dict[str, Iterable[str]]):
+        """
+        Args:
+            model_id: Bedrock model ID
+            tool_categories: Tool names by category, loaded on demand through get_tool_schema
+        """
+        self.registry = LazyToolRegistry(tool_categories)
+        # Bedrock caches the processed system prompt and tool definitions, so repeat invocations skip re-reading them
+        self.model = BedrockModel(
+            model_id=model_id,
+            cache_config=CacheConfig(strategy="auto", system_prompt_ttl=True, tools_ttl=True)
+        )
+        self.tools = [*self.registry.entry_tools(), run_tools_batch]
+        self.system_prompt = load_prompt("bedrock_agent_es")
+
+    def build(self) -> Agent:
+        """
+        Build a new agent over the shared model and tools
+
+        Each agent has its own tool registry and conversation, so schemas loaded
+        through get_tool_schema never leak into another agent.
+
+        Returns:
+            Agent exposing the catalog in two tiers plus batched reads
+        """
+        return Agent(
+            model=self.model,
+            tools=list(self.tools),
+            system_prompt=self.system_prompt,
+            name=AGENT_NAME,
+            description=AGENT_DESCRIPTION,
+        )
+
+
+def build_agent(model_id: str, tool_categories: Dict[str, Iterable[str]]) -> Agent:
+    """
+    Build the Strands agent with the tool discovery entry points
+
+    Args:
+        model_id: Bedrock model ID
+        tool_categories: Tool names by category, loaded on demand through get_tool_schema
+
+    Returns:
+        Agent exposing the catalog in two tiers plus batched reads
+    """
+    return AgentFactory(model_id, tool_categories).build()
@@ -0,0 +1,40 @@
+"""
+Shared AWS SDK clients for the AWS DevOps Agent tools
+One boto3 session and one pooled client per service/region, reused across tool calls
+"""
+
+import functools
+import threading
+from typing import Any, Optional
+
+import boto3
+from botocore.config import Config
+
+# Keep-alive pool shared by every client built from the session
+CLIENT_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+
+_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def aws_session() -> boto3.Session:
+    """Process-wide boto3 session"""
+    return boto3.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_client(service: str, region_name: Optional[str]) -> Any:
+    # boto3 sessions are not thread-safe, so client creation is serialized
+    with _lock:
+        return aws_session().client(service, region_name=region_name, config=CLIENT_CONFIG)
+
+
+def aws_client(service: str, region_name: Optional[str] = None) -> Any:
+    """Get the shared boto3 client for a service and region (clients are thread-safe)"""
+    return _cached_client(service, region_name)
+
+
+def clear_clients() -> None:
+    """Drop the cached session and clients so the next aws_client() call picks up AWS_PROFILE/region changes."""
+    _cached_client.cache_clear()
+    aws_session.cache_clear()
@@ -1,5 +1,5 @@
 """Configuration module for AWS DevOps Agent"""
 
-from .env_config import get_config, get_env_config, AWSDevOpsConfig, BedrockModelConfig, EnvironmentConfig
+from .env_config import get_config, get_env_config, clear_config_cache, AWSDevOpsConfig, BedrockModelConfig, EnvironmentConfig
 
-__all__ = ["get_config", "get_env_config", "AWSDevOpsConfig", "BedrockModelConfig", "EnvironmentConfig"]
+__all__ = ["get_config", "get_env_config", "clear_config_cache", "AWSDevOpsConfig", "BedrockModelConfig", "EnvironmentConfig"]
@@ -0,0 +1,46 @@
+"""
+Cached .env file parsing
+Parsed files are keyed by path, mtime and size so unchanged files are not re-parsed within a process
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+# In-process cache: resolved path -> ((st_mtime_ns, st_size), parsed values)
+_memo: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
+def parse_env_text(text: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines, skipping blanks and comments and stripping quotes"""
+    values = {}
+    for line in text.splitlines():
+        if not line or line[0] == "#":
+            continue
+        # partition is a single scan with no list allocation, unlike split
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if sep and key and key[0] != "#":
+            values[key] = value.strip().strip('"\'')
+    return values
+
+
+def load_env_cached(path: Union[str, Path]) -> Dict[str, str]:
+    """
+    Return the parsed contents of an env file, re-parsing only when it changes
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    resolved = str(Path(path).resolve())
+    stat = os.stat(resolved)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _memo.get(resolved)
+    if cached and cached[0] == key:
+        return dict(cached[1])
+
+    # Kept in memory only: values may hold tokens, which must not be copied to disk
+    values = parse_env_text(Path(resolved).read_text())
+    _memo[resolved] = (key, values)
+    return dict(values)
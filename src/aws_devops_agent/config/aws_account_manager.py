@@ -7,9 +7,56 @@ import boto3
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from ..clients import CLIENT_CONFIG
+
+# Caller identity per (region, profile, access key id), so rotated credentials are looked up again
+_IDENTITY_TTL_SECONDS = 900
+_identity_cache: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=None)
+def _cached_session(region: str, profile: Optional[str]) -> boto3.Session:
+    """boto3 session per (region, profile), so botocore data and credentials are resolved once"""
+    return boto3.Session(region_name=region, profile_name=profile)
+
+
+def _caller_identity(session: boto3.Session, region: str, profile: Optional[str]) -> Dict[str, Any]:
+    """STS caller identity for the session's credentials, reused for up to 15 minutes"""
+    credentials = session.get_credentials()
+    key = (region, profile, credentials.access_key if credentials else None)
+    now = time.monotonic()
+    cached = _identity_cache.get(key)
+    if cached and now - cached[0] < _IDENTITY_TTL_SECONDS:
+        return cached[1]
+    
+    identity = session.client('sts', config=CLIENT_CONFIG).get_caller_identity()
+    _identity_cache[key] = (now, identity)
+    return identity
+
+
+# Assumed-role credentials are refreshed once they are this close to expiring
+_ASSUMED_ROLE_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Cheap read call per service used to test permissions: service -> (display name, probe)
+# (no IAM probe: the caller identity already verifies the credentials, and iam:GetUser fails for roles)
+_PERMISSION_PROBES: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    'ce': ('Cost Explorer', lambda c: c.describe_cost_category_definition(CostCategoryArn='test')),
+    'cloudwatch': ('CloudWatch', lambda c: c.list_metrics(MaxRecords=1)),
+    'ec2': ('EC2', lambda c: c.describe_regions(MaxResults=1)),
+    's3': ('S3', lambda c: c.list_buckets()),
+    'organizations': ('Organizations', lambda c: c.describe_organization()),
+    'securityhub': ('Security Hub', lambda c: c.describe_hub()),
+    'config': ('Config', lambda c: c.describe_configuration_recorders()),
+    'inspector2': ('Inspector', lambda c: c.list_coverage()),
+    'pricing': ('Pricing', lambda c: c.describe_services()),
+}
 
 
 @dataclass
@@ -34,15 +81,25 @@ class AWSAccountManager:
         self.profile = profile
         self.accounts: Dict[str, AWSAccountInfo] = {}
         self.current_account: Optional[AWSAccountInfo] = None
-        self.session_cache: Dict[str, boto3.Session] = {}
+        # Assumed-role sessions per account with their credential expiry
+        self.session_cache: Dict[str, Tuple[datetime, boto3.Session]] = {}
+        # Clients per (session, service, region); keying on the session keeps it alive while cached
+        self._client_cache: Dict[Tuple[boto3.Session, str, Optional[str]], Any] = {}
+    
+    def _client(self, session: boto3.Session, service: str, region: Optional[str] = None) -> Any:
+        """Return a cached boto3 client, creating it on first use"""
+        key = (session, service, region)
+        client = self._client_cache.get(key)
+        if client is None:
+            client = self._client_cache[key] = session.client(service, region_name=region, config=CLIENT_CONFIG)
+        return client
         
     def detect_current_account(self) -> Optional[AWSAccountInfo]:
         """Detect the current AWS account from credentials"""
         try:
             # Try to get caller identity
-            session = boto3.Session(region_name=self.region, profile_name=self.profile)
-            sts = session.client('sts')
-            response = sts.get_caller_identity()
+            session = _cached_session(self.region, self.profile)
+            response = _caller_identity(session, self.region, self.profile)
             
             account_id = response['Account']
             user_id = response.get('UserId', 'unknown')
@@ -91,49 +148,29 @@ class AWSAccountManager:
         """Validate what permissions are available in the current account"""
         permissions = []
         
-        # Test common services
-        services_to_test = [
-            ('ce', 'Cost Explorer'),
-            ('cloudwatch', 'CloudWatch'),
-            ('ec2', 'EC2'),
-            ('s3', 'S3'),
-            ('iam', 'IAM'),
-            ('organizations', 'Organizations'),
-            ('securityhub', 'Security Hub'),
-            ('config', 'Config'),
-            ('inspector2', 'Inspector'),
-            ('pricing', 'Pricing')
-        ]
+        # Clients are created here because boto3 sessions are not thread-safe; the clients themselves are
+        clients = {}
+        for service_name in _PERMISSION_PROBES:
+            try:
+                clients[service_name] = self._client(session, service_name, self.region)
+            except Exception:
+                pass
         
-        for service_name, display_name in services_to_test:
+        def probe(service_name: str) -> bool:
             try:
-                client = session.client(service_name, region_name=self.region)
-                # Try a simple operation to test permissions
-                if service_name == 'ce':
-                    client.describe_cost_category_definition(CostCategoryArn='test')
-                elif service_name == 'cloudwatch':
-                    client.list_metrics(MaxRecords=1)
-                elif service_name == 'ec2':
-                    client.describe_regions(MaxResults=1)
-                elif service_name == 's3':
-                    client.list_buckets()
-                elif service_name == 'iam':
-                    client.get_user()
-                elif service_name == 'organizations':
-                    client.describe_organization()
-                elif service_name == 'securityhub':
-                    client.describe_hub()
-                elif service_name == 'config':
-                    client.describe_configuration_recorders()
-                elif service_name == 'inspector2':
-                    client.list_coverage()
-                elif service_name == 'pricing':
-                    client.describe_services()
-                
-                permissions.append(display_name)
+                _PERMISSION_PROBES[service_name][1](clients[service_name])
+                return True
             except Exception:
                 # Service not available or no permissions
-                pass
+                return False
+        
+        # The probes are independent network calls, so they run concurrently
+        with ThreadPoolExecutor(max_workers=len(_PERMISSION_PROBES)) as executor:
+            results = {service_name: executor.submit(probe, service_name) for service_name in clients}
+        
+        for service_name, (display_name, _) in _PERMISSION_PROBES.items():
+            if service_name in results and results[service_name].result():
+                permissions.append(display_name)
         
         return permissions
     
@@ -152,6 +189,35 @@ class AWSAccountManager:
         self.accounts[account_id] = account_info
         return account_info
     
+    def _assume_role_session(self, account: AWSAccountInfo) -> boto3.Session:
+        """Session on the account's role, reused until its credentials are close to expiry"""
+        cached = self.session_cache.get(account.account_id)
+        if cached and cached[0] - datetime.now(timezone.utc) > _ASSUMED_ROLE_REFRESH_MARGIN:
+            return cached[1]
+        
+        session = _cached_session(account.region, self.profile)
+        sts = self._client(session, 'sts')
+        response = sts.assume_role(
+            RoleArn=account.role_arn,
+            RoleSessionName='aws-devops-agent'
+        )
+        
+        # Create new session with assumed role credentials
+        credentials = response['Credentials']
+        assumed_session = boto3.Session(
+            aws_access_key_id=credentials['AccessKeyId'],
+            aws_secret_access_key=credentials['SecretAccessKey'],
+            aws_session_token=credentials['SessionToken'],
+            region_name=account.region
+        )
+        
+        if cached:
+            # Drop the clients bound to the expiring credentials
+            for key in [key for key in self._client_cache if key[0] is cached[1]]:
+                del self._client_cache[key]
+        self.session_cache[account.account_id] = (credentials['Expiration'], assumed_session)
+        return assumed_session
+    
     def validate_account_access(self, account_id: str) -> Tuple[bool, str]:
         """Validate if we can access a specific account"""
         if account_id not in self.accounts:
@@ -161,24 +227,11 @@ class AWSAccountManager:
         
         try:
             if account.role_arn:
-                # Try to assume role
-                session = boto3.Session(region_name=account.region, profile_name=self.profile)
-                sts = session.client('sts')
-                response = sts.assume_role(
-                    RoleArn=account.role_arn,
-                    RoleSessionName='aws-devops-agent'
-                )
-                
-                # Create new session with assumed role credentials
-                assumed_session = boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                    region_name=account.region
-                )
+                # Try to assume role (primes the session cache for get_session_for_account)
+                assumed_session = self._assume_role_session(account)
                 
                 # Test access
-                sts_assumed = assumed_session.client('sts')
+                sts_assumed = self._client(assumed_session, 'sts')
                 caller_identity = sts_assumed.get_caller_identity()
                 
                 if caller_identity['Account'] == account_id:
@@ -191,9 +244,8 @@ class AWSAccountManager:
             
             else:
                 # Use current credentials
-                session = boto3.Session(region_name=account.region, profile_name=self.profile)
-                sts = session.client('sts')
-                caller_identity = sts.get_caller_identity()
+                session = _cached_session(account.region, self.profile)
+                caller_identity = _caller_identity(session, account.region, self.profile)
                 
                 if caller_identity['Account'] == account_id:
                     account.status = "active"
@@ -214,35 +266,14 @@ class AWSAccountManager:
         
         account = self.accounts[account_id]
         
-        # Check cache first
-        if account_id in self.session_cache:
-            return self.session_cache[account_id]
-        
         try:
             if account.role_arn:
-                # Assume role
-                session = boto3.Session(region_name=account.region, profile_name=self.profile)
-                sts = session.client('sts')
-                response = sts.assume_role(
-                    RoleArn=account.role_arn,
-                    RoleSessionName='aws-devops-agent'
-                )
-                
-                assumed_session = boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                    region_name=account.region
-                )
-                
-                self.session_cache[account_id] = assumed_session
-                return assumed_session
+                # Assume role, or reuse credentials that are still fresh
+                return self._assume_role_session(account)
             
             else:
                 # Use current credentials
-                session = boto3.Session(region_name=account.region, profile_name=self.profile)
-                self.session_cache[account_id] = session
-                return session
+                return _cached_session(account.region, self.profile)
         
         except Exception as e:
             print(f"⚠️  Could not create session for account {account_id}: {e}")
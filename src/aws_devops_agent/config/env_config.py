@@ -4,12 +4,16 @@ Single source of truth for all environment variables across agentcore and strand
 """
 
 import os
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, Final, List, Mapping, Optional, Union
 from pathlib import Path
 
+from ._env_cache import load_env_cached
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BedrockModelConfig:
     """Configuration for Bedrock AI models."""
 
@@ -19,7 +23,7 @@ class BedrockModelConfig:
     region: str = "us-east-1"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AWSMCPConfig:
     """Configuration for AWS MCP Servers."""
     
@@ -35,7 +39,7 @@ class AWSMCPConfig:
     max_workers: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class AWSDevOpsConfig:
     """Configuration for AWS DevOps Agent."""
 
@@ -55,39 +59,46 @@ class AWSDevOpsConfig:
     iac_analysis_dir: str = "reports/iac-analysis"
     
     # Multi-account support
-    cross_account_roles: Dict[str, str] = None
+    cross_account_roles: Dict[str, str] = field(default_factory=dict)
 
     # Logging Configuration
     log_level: str = "INFO"
     debug_mode: bool = False
 
 
+# One "account:role" pair from CROSS_ACCOUNT_ROLES; the role may itself be an ARN containing colons
+_ROLE_RE = re.compile(r"([^:,\s]+):([^,\s]+)")
+
+
+# Friendly model names, shared by ConfigManager and EnvironmentConfig.get_model_id
+AVAILABLE_MODELS: Final[Mapping[str, BedrockModelConfig]] = {
+    "claude-4": BedrockModelConfig(
+        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+        max_tokens=4000,
+        temperature=0.1,
+    ),
+    "claude-3.5-sonnet": BedrockModelConfig(
+        model_id="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+        max_tokens=3000,
+        temperature=0.1,
+    ),
+    "nova-micro": BedrockModelConfig(
+        model_id="us.amazon.nova-micro-v1:0", 
+        max_tokens=2000, 
+        temperature=0.1
+    ),
+    "nova-lite": BedrockModelConfig(
+        model_id="us.amazon.nova-lite-v1:0", 
+        max_tokens=3000, 
+        temperature=0.1
+    ),
+}
+
+
 class ConfigManager:
     """Manages AWS DevOps Agent configuration."""
 
-    AVAILABLE_MODELS = {
-        "claude-4": BedrockModelConfig(
-            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-            max_tokens=4000,
-            temperature=0.1,
-        ),
-        "claude-3.5-sonnet": BedrockModelConfig(
-            model_id="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            max_tokens=3000,
-            temperature=0.1,
-        ),
-        "nova-micro": BedrockModelConfig(
-            model_id="us.amazon.nova-micro-v1:0", 
-            max_tokens=2000, 
-            temperature=0.1
-        ),
-        "nova-lite": BedrockModelConfig(
-            model_id="us.amazon.nova-lite-v1:0", 
-            max_tokens=3000, 
-            temperature=0.1
-        ),
-    }
-
+    AVAILABLE_MODELS = AVAILABLE_MODELS
     DEFAULT_MODEL = "claude-3.5-sonnet"
 
     def load_config(self) -> AWSDevOpsConfig:
@@ -96,7 +107,7 @@ class ConfigManager:
         env_config = get_env_config(strict_validation=False)  # Allow defaults for interactive mode
         
         # Map to legacy config structure
-        model_name = os.getenv("STRANDS_MODEL", self.DEFAULT_MODEL)
+        model_name = os.environ.get("STRANDS_MODEL", self.DEFAULT_MODEL)
         model_config = self.AVAILABLE_MODELS.get(model_name, self.AVAILABLE_MODELS[self.DEFAULT_MODEL])
 
         return AWSDevOpsConfig(
@@ -109,7 +120,7 @@ class ConfigManager:
             aws_profile=env_config.aws_profile,
             log_level=env_config.log_level,
             debug_mode=env_config.debug_mode,
-            cross_account_roles=env_config.cross_account_roles or None,
+            cross_account_roles=env_config.cross_account_roles,
         )
 
 
@@ -153,6 +164,7 @@ class EnvironmentConfig:
     @classmethod
     def from_env(cls, strict_validation: bool = True) -> 'EnvironmentConfig':
         """Load configuration from environment variables"""
+        get = os.environ.get
         
         # Required variables (no defaults)
         required_vars = {
@@ -165,7 +177,7 @@ class EnvironmentConfig:
         # Validate required variables
         missing_vars = []
         for var, description in required_vars.items():
-            if not os.getenv(var):
+            if not get(var):
                 missing_vars.append(f"  - {var}: {description}")
         
         if missing_vars and strict_validation:
@@ -178,40 +190,36 @@ class EnvironmentConfig:
         # Load configuration
         config = cls(
             # Required
-            aws_region=os.getenv('AWS_REGION', 'us-east-1'),
-            bedrock_model_id=os.getenv('BEDROCK_MODEL_ID', 'claude-3.5-sonnet'),
-            port=int(os.getenv('PORT', '8080')),
-            host=os.getenv('HOST', '0.0.0.0'),
+            aws_region=get('AWS_REGION', 'us-east-1'),
+            bedrock_model_id=get('BEDROCK_MODEL_ID', 'claude-3.5-sonnet'),
+            port=int(get('PORT', '8080')),
+            host=get('HOST', '0.0.0.0'),
             
             # Optional with defaults
-            aws_profile=os.getenv('AWS_PROFILE', 'default'),
-            bedrock_region=os.getenv('BEDROCK_REGION'),
-            debug_mode=os.getenv('DEBUG_MODE', 'false').lower() == 'true',
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
+            aws_profile=get('AWS_PROFILE', 'default'),
+            bedrock_region=get('BEDROCK_REGION'),
+            debug_mode=get('DEBUG_MODE', 'false').lower() == 'true',
+            log_level=get('LOG_LEVEL', 'INFO'),
             
             # MCP Configuration
-            mcp_timeout=int(os.getenv('MCP_TIMEOUT', '30')),
-            mcp_max_workers=int(os.getenv('MCP_MAX_WORKERS', '10')),
+            mcp_timeout=int(get('MCP_TIMEOUT', '30')),
+            mcp_max_workers=int(get('MCP_MAX_WORKERS', '10')),
             
             # Security
-            github_token=os.getenv('GITHUB_TOKEN'),
-            github_repo=os.getenv('GITHUB_REPO'),
+            github_token=get('GITHUB_TOKEN'),
+            github_repo=get('GITHUB_REPO'),
             
             # AWS Account
-            aws_account_id=os.getenv('AWS_ACCOUNT_ID'),
-            aws_account_name=os.getenv('AWS_ACCOUNT_NAME'),
-            aws_role_arn=os.getenv('AWS_ROLE_ARN'),
+            aws_account_id=get('AWS_ACCOUNT_ID'),
+            aws_account_name=get('AWS_ACCOUNT_NAME'),
+            aws_role_arn=get('AWS_ROLE_ARN'),
             
             # Advanced
-            aws_default_region=os.getenv('AWS_DEFAULT_REGION')
+            aws_default_region=get('AWS_DEFAULT_REGION')
         )
         
-        # Parse cross-account roles
-        if os.getenv('CROSS_ACCOUNT_ROLES'):
-            for account_role in os.getenv('CROSS_ACCOUNT_ROLES', '').split(','):
-                if ':' in account_role:
-                    account, role = account_role.strip().split(':', 1)
-                    config.cross_account_roles[account] = role
+        # Parse cross-account roles ("account:role,account:role")
+        config.cross_account_roles.update(_ROLE_RE.findall(get('CROSS_ACCOUNT_ROLES', '')))
         
         # Set bedrock_region to aws_region if not specified
         if not config.bedrock_region:
@@ -225,14 +233,8 @@ class EnvironmentConfig:
     
     def get_model_id(self) -> str:
         """Get the actual model ID, resolving friendly names"""
-        model_mapping = {
-            "claude-4": "us.anthropic.claude-sonnet-4-20250514-v1:0",
-            "claude-3.5-sonnet": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "nova-micro": "us.amazon.nova-micro-v1:0",
-            "nova-lite": "us.amazon.nova-lite-v1:0"
-        }
-        
-        return model_mapping.get(self.bedrock_model_id, self.bedrock_model_id)
+        model = AVAILABLE_MODELS.get(self.bedrock_model_id)
+        return model.model_id if model else self.bedrock_model_id
     
     def get_aws_env(self) -> Dict[str, str]:
         """Get AWS environment variables for MCP servers"""
@@ -304,19 +306,12 @@ def load_env_file(env_file_path: Optional[Path] = None) -> None:
     
     if env_file_path and env_file_path.exists():
         try:
-            with open(env_file_path, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip('"\'')
-                        
-                        # Only set if not already in environment (system env takes precedence)
-                        if key not in os.environ:
-                            os.environ[key] = value
-                        else:
-                            print(f"💡 Skipping {key} from .env (already set in system environment)")
+            for key, value in load_env_cached(env_file_path).items():
+                # Only set if not already in environment (system env takes precedence)
+                if key not in os.environ:
+                    os.environ[key] = value
+                else:
+                    print(f"💡 Skipping {key} from .env (already set in system environment)")
             
             print(f"✅ Loaded .env file from {env_file_path}")
         except Exception as e:
@@ -331,7 +326,24 @@ def get_env_config(strict_validation: bool = True) -> EnvironmentConfig:
     return EnvironmentConfig.from_env(strict_validation=strict_validation)
 
 
+# Environment variables ConfigManager.load_config reads; a change to any of them rebuilds the config
+_CONFIG_ENV_VARS: Final = (
+    "STRANDS_MODEL", "AWS_REGION", "AWS_PROFILE", "AWS_DEFAULT_REGION", "BEDROCK_MODEL_ID",
+    "BEDROCK_REGION", "PORT", "HOST", "DEBUG_MODE", "LOG_LEVEL", "MCP_TIMEOUT",
+    "MCP_MAX_WORKERS", "CROSS_ACCOUNT_ROLES",
+)
+
+
+@lru_cache(maxsize=1)
+def _load_config(env_snapshot: tuple) -> AWSDevOpsConfig:
+    return ConfigManager().load_config()
+
+
 def get_config() -> AWSDevOpsConfig:
-    """Get configuration using the legacy interface for backward compatibility."""
-    config_manager = ConfigManager()
-    return config_manager.load_config()
+    """Get configuration using the legacy interface for backward compatibility (cached until the environment changes)."""
+    return _load_config(tuple(map(os.environ.get, _CONFIG_ENV_VARS)))
+
+
+def clear_config_cache() -> None:
+    """Drop the cached configuration so the next get_config() call rebuilds it."""
+    _load_config.cache_clear()
@@ -5,6 +5,7 @@ Integrates all AWS DevOps tools with Strands + MCP Servers
 """
 
 import asyncio
+import functools
 import os
 import sys
 import readline
@@ -12,36 +13,162 @@ import atexit
 import uuid
 import time
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NoReturn, TYPE_CHECKING
 
-# Import Strands and configuration
-from strands import Agent
-from strands.session.file_session_manager import FileSessionManager
+# Import configuration (Strands and the tool modules are imported lazily below)
 from .config import get_config
 from .config.safety_config import get_safety_config, requires_consent, get_consent_message
-from .config.aws_account_manager import get_aws_account_manager
-
-# Import all our AWS DevOps tools
-from .tools import *
-
-# Import security tools specifically
-from .tools.aws_security import (
-    analyze_security_hub_findings,
-    get_security_insights,
-    analyze_security_posture,
-    analyze_config_compliance,
-    get_compliance_details,
-    check_resource_compliance,
-    analyze_inspector_findings,
-    get_vulnerability_assessment,
-    check_security_vulnerabilities,
-    get_trusted_advisor_checks,
-    analyze_trusted_advisor_recommendations,
-    get_security_recommendations,
-    perform_comprehensive_security_analysis,
-    generate_security_report
-)
+from .prompts import load_prompt
+
+if TYPE_CHECKING:
+    from strands import Agent
+
+# Interactive-mode commands (checked once per prompt)
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+_HELP_COMMANDS = frozenset({"help", "?"})
+
+# Interactive-mode help text, printed as-is by _show_help
+_HELP_TEXT = """
+🤖 AWS DevOps Agent v2 - Help
+========================================
+Available Commands:
+  accounts        - Show all managed AWS accounts
+  switch-account  - Switch to a different AWS account
+  account-status  - Show current account status
+  help, ?         - Show this help message
+  exit, quit, q   - Exit the application
+
+Multi-line Input:
+  Type "'''" to enter multi-line mode for complex queries
+
+AWS DevOps Capabilities:
+  💰 Cost optimization and analysis
+  🏗️  Infrastructure as Code (Terraform, CloudFormation, CDK)
+  🔒 Security and compliance analysis
+  🌐 Multi-account operations
+  📊 Real-time AWS resource monitoring
+  📄 Automated report generation
+
+Example Queries:
+  'Analyze costs for the last 30 days'
+  'Review security findings in this account'
+  'Optimize EC2 instances for cost savings'
+  'Generate a compliance report for SOC2'
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _all_tools() -> tuple:
+    """All AWS DevOps tools registered with the agent, imported and collected once per process"""
+    # Deferred so --query and --help don't pay for boto3/tool imports up front
+    from . import tools
+    
+    return (
+        # Cost Optimization Tools
+        tools.get_real_aws_pricing,
+        tools.analyze_price_optimization_opportunities,
+        tools.generate_cost_comparison_report,
+        tools.calculate_reserved_instance_savings,
+        
+        # Real AWS Cost Explorer Tools (via MCP Servers)
+        tools.get_actual_aws_costs,
+        tools.get_cost_trends,
+        tools.get_organization_costs,
+        tools.get_rightsizing_recommendations,
+        tools.get_reserved_instance_recommendations,
+        tools.analyze_cost_anomalies,
+        tools.get_cost_dashboard_bundle,
+        tools.analyze_usage_based_optimization,
+        
+        # Live AWS Resources Tools  
+        tools.get_unused_resources,
+        tools.calculate_resource_utilization,
+        tools.analyze_resource_costs,
+        
+        # Infrastructure as Code Tools
+        tools.analyze_terraform_configuration,
+        tools.validate_cloudformation_template,
+        tools.scan_infrastructure_drift,
+        tools.generate_iac_best_practices_report,
+        
+        # CDK Analysis Tools
+        tools.analyze_cdk_project,
+        tools.synthesize_cdk_project,
+        tools.analyze_cdk_synthesized_output,
+        tools.generate_cdk_optimization_report,
+        
+        # Terraform Analysis Tools
+        tools.analyze_terraform_project,
+        tools.validate_terraform_configuration,
+        tools.plan_terraform_changes,
+        tools.analyze_terraform_state,
+        tools.generate_terraform_optimization_report,
+        
+        # Compliance and Security Tools
+        tools.validate_security_policies,
+        tools.check_compliance_standards,
+        tools.generate_compliance_report,
+        tools.scan_security_vulnerabilities,
+        
+        # Real AWS Security Analysis Tools
+        tools.analyze_security_hub_findings,
+        tools.get_security_insights,
+        tools.analyze_security_posture,
+        tools.analyze_config_compliance,
+        tools.get_compliance_details,
+        tools.check_resource_compliance,
+        tools.analyze_inspector_findings,
+        tools.get_vulnerability_assessment,
+        tools.check_security_vulnerabilities,
+        tools.get_trusted_advisor_checks,
+        tools.analyze_trusted_advisor_recommendations,
+        tools.get_security_recommendations,
+        tools.perform_comprehensive_security_analysis,
+        tools.generate_security_report,
+        
+        # Multi-Account Management Tools
+        tools.generate_multi_account_report,
+        
+        # GitHub Integration Tools
+        tools.check_repository_connectivity,
+        tools.create_branch_simple, 
+        tools.get_repository_info,
+        tools.list_repository_branches,
+        tools.create_optimization_pull_request,
+        tools.update_iac_via_github,
+        tools.list_infrastructure_repositories,
+        tools.monitor_infrastructure_prs,
+        
+        # Document Generation Tools
+        tools.generate_document,
+        tools.generate_cost_analysis_document,
+        tools.generate_security_compliance_document,
+        tools.generate_infrastructure_document,
+        tools.generate_cdk_analysis_document,
+        tools.generate_terraform_analysis_document,
+        tools.list_generated_documents,
+        tools.get_document_info,
+        tools.run_tools_batch,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _build_agent(session_id: str, sessions_dir: str, **agent_kwargs) -> "Agent":
+    """Create the session-backed Strands agent, reusing it when the same session is set up again"""
+    from strands import Agent
+    from strands.session.file_session_manager import FileSessionManager
+    
+    # Check if FileSessionManager supports custom base directory
+    try:
+        # Try with base_dir parameter first
+        session_manager = FileSessionManager(session_id=session_id, base_dir=sessions_dir)
+    except TypeError:
+        # Fall back to default behavior if base_dir is not supported
+        session_manager = FileSessionManager(session_id=session_id)
+    
+    return Agent(session_manager=session_manager, **agent_kwargs)
 
 
 class KeyboardInterruptHandler:
@@ -80,7 +207,8 @@ class AWSDevOpsAgentV2:
         # Load configuration
         self.config = get_config()
         
-        # Setup AWS account management
+        # Setup AWS account management (boto3 is loaded here rather than at import, keeping --help fast)
+        from .config.aws_account_manager import get_aws_account_manager
         self.account_manager = get_aws_account_manager(
             region=self.config.aws_region, 
             profile=self.config.aws_profile
@@ -116,6 +244,9 @@ class AWSDevOpsAgentV2:
             print(f"   🏢 Account: Using environment variables")
         print(f"   🔒 Safety: Explicit consent required for all dangerous actions")
         
+        # Event loop shared by every synchronous entry point (interactive, demo, --query)
+        self._loop = None
+        
         # Initialize agent
         self.agent = None
         self._setup_agent()
@@ -209,32 +340,7 @@ class AWSDevOpsAgentV2:
     
     def _show_help(self):
         """Show help information and available commands"""
-        print("\n🤖 AWS DevOps Agent v2 - Help")
-        print("=" * 40)
-        print("Available Commands:")
-        print("  accounts        - Show all managed AWS accounts")
-        print("  switch-account  - Switch to a different AWS account")
-        print("  account-status  - Show current account status")
-        print("  help, ?         - Show this help message")
-        print("  exit, quit, q   - Exit the application")
-        print()
-        print("Multi-line Input:")
-        print("  Type \"'''\" to enter multi-line mode for complex queries")
-        print()
-        print("AWS DevOps Capabilities:")
-        print("  💰 Cost optimization and analysis")
-        print("  🏗️  Infrastructure as Code (Terraform, CloudFormation, CDK)")
-        print("  🔒 Security and compliance analysis")
-        print("  🌐 Multi-account operations")
-        print("  📊 Real-time AWS resource monitoring")
-        print("  📄 Automated report generation")
-        print()
-        print("Example Queries:")
-        print("  'Analyze costs for the last 30 days'")
-        print("  'Review security findings in this account'")
-        print("  'Optimize EC2 instances for cost savings'")
-        print("  'Generate a compliance report for SOC2'")
-        print()
+        print(_HELP_TEXT)
     
     def _setup_agent(self):
         """Setup the main Strands agent with all AWS DevOps tools and session management"""
@@ -244,197 +350,25 @@ class AWSDevOpsAgentV2:
         sessions_dir = self._get_project_sessions_dir()
         os.makedirs(sessions_dir, exist_ok=True)
         
-        # Check if FileSessionManager supports custom base directory
-        try:
-            # Try with base_dir parameter first
-            session_manager = FileSessionManager(session_id=self.session_id, base_dir=sessions_dir)
-        except TypeError:
-            # Fall back to default behavior if base_dir is not supported
-            session_manager = FileSessionManager(session_id=self.session_id)
-            
         print(f"   📝 Session: {self.session_id}")
         print(f"   📂 Session dir: {os.path.join(sessions_dir, self.session_id)}")
         
-        # All available tools
-        all_tools = [
-            # Cost Optimization Tools
-            get_real_aws_pricing,
-            analyze_price_optimization_opportunities,
-            generate_cost_comparison_report,
-            calculate_reserved_instance_savings,
-            
-            # Real AWS Cost Explorer Tools (via MCP Servers)
-            get_actual_aws_costs,
-            get_cost_trends,
-            get_organization_costs,
-            get_rightsizing_recommendations,
-            get_reserved_instance_recommendations,
-            analyze_cost_anomalies,
-            analyze_usage_based_optimization,
-            
-            # Live AWS Resources Tools  
-            get_unused_resources,
-            calculate_resource_utilization,
-            analyze_resource_costs,
-            
-            # Infrastructure as Code Tools
-            analyze_terraform_configuration,
-            validate_cloudformation_template,
-            scan_infrastructure_drift,
-            generate_iac_best_practices_report,
-            
-            # CDK Analysis Tools
-            analyze_cdk_project,
-            synthesize_cdk_project,
-            analyze_cdk_synthesized_output,
-            generate_cdk_optimization_report,
-            
-            # Terraform Analysis Tools
-            analyze_terraform_project,
-            validate_terraform_configuration,
-            plan_terraform_changes,
-            analyze_terraform_state,
-            generate_terraform_optimization_report,
-            
-            # Compliance and Security Tools
-            validate_security_policies,
-            check_compliance_standards,
-            generate_compliance_report,
-            scan_security_vulnerabilities,
-            
-            # Real AWS Security Analysis Tools
-            analyze_security_hub_findings,
-            get_security_insights,
-            analyze_security_posture,
-            analyze_config_compliance,
-            get_compliance_details,
-            check_resource_compliance,
-            analyze_inspector_findings,
-            get_vulnerability_assessment,
-            check_security_vulnerabilities,
-            get_trusted_advisor_checks,
-            analyze_trusted_advisor_recommendations,
-            get_security_recommendations,
-            perform_comprehensive_security_analysis,
-            generate_security_report,
-            
-            # Multi-Account Management Tools
-            generate_multi_account_report,
-            
-            # GitHub Integration Tools
-            check_repository_connectivity,
-            create_branch_simple, 
-            get_repository_info,
-            list_repository_branches,
-            create_optimization_pull_request,
-            update_iac_via_github,
-            list_infrastructure_repositories,
-            monitor_infrastructure_prs,
-            
-            # Document Generation Tools
-            generate_document,
-            generate_cost_analysis_document,
-            generate_security_compliance_document,
-            generate_infrastructure_document,
-            generate_cdk_analysis_document,
-            generate_terraform_analysis_document,
-            list_generated_documents,
-            get_document_info,
-        ]
-        
-        # Create the agent with session management
-        self.agent = Agent(
+        # Agent settings shared by the session agent and per-scenario demo agents
+        # (kept hashable so _build_agent can cache on them)
+        self._agent_kwargs = dict(
             model=self.config.model.model_id,
-            tools=all_tools,
+            tools=_all_tools(),
             name="AWS DevOps Agent v2",
-            session_manager=session_manager,
-            system_prompt="""Eres un especialista en AWS DevOps con acceso completo a herramientas de producción.
-
-TUS CAPACIDADES PRINCIPALES:
-💰 OPTIMIZACIÓN DE COSTOS:
-- Análisis de precios en tiempo real via AWS Pricing API
-- Acceso REAL a AWS Cost Explorer con datos de facturación actuales
-- Análisis de tendencias y breakdowns multi-cuenta via Cost Explorer API
-- Recomendaciones de rightsizing y Reserved Instances basadas en datos reales
-
-🎯 ANÁLISIS INTELIGENTE DE TERRAFORM:
-Cuando analices proyectos Terraform, usa toda la información disponible del plan real:
-- Lee TODOS los recursos específicos del terraform_resources_detail
-- Considera las preferencias del usuario (ej: "no T-family instances", "production environment", "use reserved instances")
-- Calcula ahorros específicos con precios reales de AWS
-- Sugiere alternativas técnicas concretas (ej: "t3.large → m5.large")
-- Considera restricciones de producción vs desarrollo
-- Analiza configuraciones reales (instance types, storage, networking)
-
-⚠️ CRÍTICO - MOSTRAR TABLA DE RECURSOS:
-- Cuando uses analyze_terraform_project, muestra la tabla ASCII completa tal como viene en el resultado de "resource_summary_display" 
-- Debe ser lo PRIMERO que muestres al usuario
-
-
-🏗️ ANÁLISIS DE INFRAESTRUCTURA COMO CÓDIGO (IaC):
-- Validación de configuraciones Terraform y CloudFormation
-- Análisis completo de proyectos AWS CDK (síntesis y optimización)
-- Análisis completo de proyectos Terraform (validación, planificación y optimización)
-- Detección de drift entre código y estado real
-- Best practices y recomendaciones de seguridad
-- Análisis de cumplimiento de estándares
-
-🔒 SEGURIDAD Y COMPLIANCE (REAL AWS APIs):
-- Análisis REAL de Security Hub con findings de seguridad en tiempo real
-- Compliance REAL con AWS Config y reglas de configuración
-- Vulnerabilidades REALES con Amazon Inspector
-- Recomendaciones REALES de AWS Trusted Advisor
-- Análisis integral de postura de seguridad combinando todos los servicios
-- Validación contra estándares SOC2, HIPAA, PCI-DSS, ISO27001
-- Reportes de compliance ejecutivos con datos reales de AWS
-
-🌐 GESTIÓN MULTI-CUENTA:
-- Operaciones cross-account en organizaciones AWS
-- Inventario de recursos en múltiples cuentas y regiones
-- Análisis de costos organizacional
-- Monitoreo de compliance centralizado
-
-📱 INTEGRACIÓN GITHUB:
-- Análisis de repositorios de infraestructura
-- Preparación de cambios para Pull Requests (SOLO CON CONSENTIMIENTO EXPLÍCITO)
-- Monitoring de PRs de infraestructura
-- Gestión de repositorios (solo lectura por defecto)
-
-📄 GENERACIÓN DE DOCUMENTOS:
-- Creación automática de reportes en carpeta 'reports/'
-- Documentos en formato Markdown, JSON, CSV, Excel
-- Reportes de costos, seguridad, infraestructura, CDK
-- Organización automática por tipo de reporte
-
-FLUJO DE TRABAJO CONVERSACIONAL:
-1. Analiza la consulta del usuario en español/inglés
-2. Determina qué herramientas usar y en qué secuencia
-3. Ejecuta análisis usando datos reales de AWS via MCP
-4. Combina resultados en una respuesta integral
-5. NUNCA crea PRs automáticamente - SIEMPRE pide consentimiento explícito
-6. Proporciona next steps accionables y seguros
-
-EJEMPLOS DE USO:
-- "Analiza mi infraestructura Terraform y optimiza costos"
-- "Valida compliance SOC2 y crea PR con mejoras"
-- "Compara costos entre regiones para mi aplicación"
-- "Encuentra recursos sin usar en todas mis cuentas"
-
-IMPORTANTE - REGLAS DE SEGURIDAD CRÍTICAS:
-- NUNCA crees PRs, commits, o pushes sin consentimiento explícito del usuario
-- SIEMPRE pregunta antes de realizar cualquier acción que modifique código o infraestructura
-- Solo proporciona análisis, recomendaciones y preparación de cambios
-- Los usuarios deben aprobar explícitamente cualquier acción antes de ejecutarla
-- Siempre especifica que los datos provienen de APIs reales de AWS
-- Incluye números específicos y ahorros en dólares
-- Proporciona executive summaries para stakeholders
-- Mantén foco en ROI y value delivery
-
-Responde de manera concisa pero completa, integrando múltiples fuentes de datos en un análisis coherente.""",
-            description="Comprehensive AWS DevOps automation with cost optimization, security compliance, and infrastructure management"
+            system_prompt=load_prompt("aws_devops_es"),
+            description="Comprehensive AWS DevOps automation with cost optimization, security compliance, and infrastructure management",
+            # Output is printed by chat()/stream_chat() rather than Strands' default stdout handler
+            callback_handler=None
         )
         
-        print(f"✅ Agent ready with {len(all_tools)} AWS DevOps tools")
+        # Create the agent with session management
+        self.agent = _build_agent(self.session_id, sessions_dir, **self._agent_kwargs)
+        
+        print(f"✅ Agent ready with {len(self._agent_kwargs['tools'])} AWS DevOps tools")
     
     def _check_message_safety(self, message: str) -> Dict[str, Any]:
         """Check if a message contains dangerous actions that require consent"""
@@ -475,23 +409,66 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
             "message": "Message appears safe to process"
         }
     
-    async def chat(self, message: str) -> str:
-        """Process a chat message through the agent"""
-        if not self.agent:
+    async def chat(self, message: str, agent: "Agent" = None) -> str:
+        """Process a chat message through the agent (defaults to the session agent)"""
+        agent = agent or self.agent
+        if not agent:
             return "❌ Agent not initialized properly"
         
         try:
             # Safety check for dangerous actions
-            safety_check = self._check_message_safety(message)
-            if not safety_check["safe"]:
-                return f"🔒 SAFETY CHECK FAILED\n\n{safety_check['message']}\n\n{safety_check['recommendation']}\n\nPlease explicitly confirm this action if you want to proceed."
+            refusal = self._safety_refusal(message)
+            if refusal:
+                return refusal
             
             print(f"🗣️  Processing: {message}")
-            response = self.agent(message)
+            # Agent calls block for the whole LLM/MCP round trip, so keep them off the event loop
+            response = await asyncio.to_thread(agent, message)
             return str(response)
         except Exception as e:
             return f"❌ Error processing message: {str(e)}"
     
+    async def stream_chat(self, message: str) -> None:
+        """Process a chat message, printing the response as it streams in"""
+        if not hasattr(self.agent, "stream_async"):
+            print(f"🤖 {await self.chat(message)}\n")
+            return
+        
+        try:
+            refusal = self._safety_refusal(message)
+            if refusal:
+                print(f"🤖 {refusal}\n")
+                return
+            
+            print("🤖 ", end="", flush=True)
+            async for event in self.agent.stream_async(message):
+                if "data" in event:
+                    sys.stdout.write(event["data"])
+                    sys.stdout.flush()
+            print("\n")
+        except Exception as e:
+            print(f"\n❌ Error processing message: {str(e)}\n")
+    
+    def _safety_refusal(self, message: str) -> str:
+        """Return the refusal text for messages that need explicit consent, or an empty string"""
+        safety_check = self._check_message_safety(message)
+        if safety_check["safe"]:
+            return ""
+        return f"🔒 SAFETY CHECK FAILED\n\n{safety_check['message']}\n\n{safety_check['recommendation']}\n\nPlease explicitly confirm this action if you want to proceed."
+    
+    def _run(self, coro):
+        """Run a coroutine on the agent's long-lived event loop"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            # Room for concurrent demo scenarios in chat()'s worker threads
+            self._loop.set_default_executor(ThreadPoolExecutor(max_workers=8))
+        return self._loop.run_until_complete(coro)
+    
+    def close(self):
+        """Close the shared event loop"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+    
     def _get_multiline_input(self) -> str:
         """Get multi-line input from user"""
         print("📝 Multi-line input mode activated. Type your text, then type \"'''\" on a new line to finish:")
@@ -565,21 +542,22 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
             try:
                 user_input = self._handle_input_with_fallback()
                 
-                if user_input.lower() in ['exit', 'quit', 'q']:
+                cmd = user_input.lower()
+                if cmd in _EXIT_COMMANDS:
                     print("👋 Goodbye!")
                     break
                 
                 # Handle special commands
-                if user_input.lower() == 'accounts':
+                if cmd == 'accounts':
                     self._show_accounts()
                     continue
-                elif user_input.lower() == 'switch-account':
+                elif cmd == 'switch-account':
                     self._switch_account()
                     continue
-                elif user_input.lower() == 'account-status':
+                elif cmd == 'account-status':
                     self._show_account_status()
                     continue
-                elif user_input.lower() in ['help', '?']:
+                elif cmd in _HELP_COMMANDS:
                     self._show_help()
                     continue
                 
@@ -593,8 +571,7 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
                     continue
                 
                 print("🤖 Thinking...")
-                response = asyncio.run(self.chat(user_input))
-                print(f"🤖 {response}\n")
+                self._run(self.stream_chat(user_input))
                 
             except KeyboardInterrupt:
                 # Handle smart Ctrl+C logic
@@ -612,8 +589,16 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
         
         print("\n👋 AWS DevOps Agent v2 session ended")
     
-    def demo_mode(self):
-        """Run demo scenarios"""
+    async def _run_all_demos(self, scenarios: List[Dict[str, str]]) -> List[Any]:
+        """Run demo scenarios concurrently, each on its own session-less agent"""
+        from strands import Agent
+        
+        # A Strands agent handles one invocation at a time, so scenarios can't share self.agent
+        tasks = [self.chat(s['query'], agent=Agent(**self._agent_kwargs)) for s in scenarios]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def demo_mode(self, parallel: bool = False):
+        """Run demo scenarios (concurrently when parallel=True)"""
         print("\n🎯 AWS DevOps Agent v2 - Demo Mode")
         print("=" * 50)
         
@@ -636,13 +621,27 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
             }
         ]
         
+        if parallel:
+            print(f"⚡ Running {len(scenarios)} scenarios in parallel...")
+            results = self._run(self._run_all_demos(scenarios))
+            for i, (scenario, response) in enumerate(zip(scenarios, results), 1):
+                print(f"\n📋 Demo {i}: {scenario['name']}")
+                print(f"Query: {scenario['query']}")
+                print("-" * 50)
+                if isinstance(response, Exception):
+                    print(f"❌ Error in demo: {response}")
+                else:
+                    print(f"🤖 Response:\n{response}")
+                print("=" * 50)
+            return
+        
         for i, scenario in enumerate(scenarios, 1):
             print(f"\n📋 Demo {i}: {scenario['name']}")
             print(f"Query: {scenario['query']}")
             print("-" * 50)
             
             try:
-                response = asyncio.run(self.chat(scenario['query']))
+                response = self._run(self.chat(scenario['query']))
                 print(f"🤖 Response:\n{response}")
             except Exception as e:
                 print(f"❌ Error in demo: {e}")
@@ -684,6 +683,7 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
                 
             # Try to create FileSessionManager with the session_id
             # This will work whether the session exists or not
+            from strands.session.file_session_manager import FileSessionManager
             session_manager = FileSessionManager(session_id=session_id)
             
             # Test session manager by creating a small marker file
@@ -820,7 +820,7 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
             "agent_ready": self.agent is not None,
             "model": self.config.model.model_id,
             "aws_region": self.config.aws_region,
-            "tools_count": 65,  # Total tools available (20 + 11 MCP AWS tools + 4 CDK tools + 5 Terraform tools + 8 reporting tools + 17 security tools)
+            "tools_count": len(_all_tools()),
             "capabilities": [
                 "Cost optimization",
                 "IaC analysis (Terraform, CloudFormation, CDK)", 
@@ -831,36 +831,78 @@ Responde de manera concisa pero completa, integrando múltiples fuentes de datos
         }
 
 
+_USAGE = """usage: aws-devops-agent [-h] [--mode {interactive,demo}] [--query QUERY] [--parallel]
+                        [--session-id SESSION_ID] [--no-account-selection]
+
+AWS DevOps Agent v2
+
+options:
+  -h, --help              show this help message and exit
+  --mode {interactive,demo}
+                          Run mode: interactive chat or demo scenarios
+  --query QUERY           Single query to process
+  --parallel              Run demo scenarios concurrently (demo mode only)
+  --session-id SESSION_ID
+                          Session ID ('new' for new session)
+  --no-account-selection  Skip interactive account selection (use environment variables only)"""
+
+_VALUE_FLAGS = {"--mode": "mode", "--query": "query", "--session-id": "session_id"}
+_SWITCH_FLAGS = {"--parallel": "parallel", "--no-account-selection": "no_account_selection"}
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print the full usage and the error to stderr, then exit with argparse's status 2"""
+    print(f"{_USAGE}\nerror: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_args(argv: List[str]) -> Dict[str, Any]:
+    """Parse the handful of CLI flags without loading argparse"""
+    args = {"mode": "interactive", "query": None, "session_id": None,
+            "parallel": False, "no_account_selection": False}
+    it = iter(argv)
+    for arg in it:
+        flag, has_value, value = arg.partition("=")
+        if flag in ("-h", "--help"):
+            print(_USAGE)
+            sys.exit(0)
+        elif flag in _SWITCH_FLAGS and not has_value:
+            args[_SWITCH_FLAGS[flag]] = True
+        elif flag in _VALUE_FLAGS:
+            if not has_value:
+                value = next(it, None)
+                if value is None:
+                    _usage_error(f"argument {flag}: expected one argument")
+            args[_VALUE_FLAGS[flag]] = value
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+    
+    if args["mode"] not in ("interactive", "demo"):
+        _usage_error(f"argument --mode: invalid choice: '{args['mode']}' (choose from 'interactive', 'demo')")
+    return args
+
+
 def main():
     """Main entry point"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="AWS DevOps Agent v2")
-    parser.add_argument("--mode", choices=["interactive", "demo"], default="interactive",
-                       help="Run mode: interactive chat or demo scenarios")
-    parser.add_argument("--query", type=str, help="Single query to process")
-    parser.add_argument("--session-id", type=str, help="Session ID ('new' for new session)")
-    parser.add_argument("--no-account-selection", action="store_true",
-                       help="Skip interactive account selection (use environment variables only)")
-    
-    args = parser.parse_args()
+    args = _parse_args(sys.argv[1:])
     
+    agent = None
     try:
         # Initialize agent with session management
-        interactive_account_selection = not args.no_account_selection
+        interactive_account_selection = not args["no_account_selection"]
         agent = AWSDevOpsAgentV2(
-            session_id=args.session_id, 
+            session_id=args["session_id"], 
             interactive_account_selection=interactive_account_selection
         )
         
-        if args.query:
+        if args["query"]:
             # Single query mode
-            print(f"🗣️  Query: {args.query}")
-            response = asyncio.run(agent.chat(args.query))
+            print(f"🗣️  Query: {args['query']}")
+            response = agent._run(agent.chat(args["query"]))
             print(f"🤖 Response:\n{response}")
-        elif args.mode == "demo":
+        elif args["mode"] == "demo":
             # Demo mode
-            agent.demo_mode()
+            agent.demo_mode(parallel=args["parallel"])
         else:
             # Interactive mode (default)
             agent.interactive_mode()
@@ -870,6 +912,9 @@ def main():
     except Exception as e:
         print(f"❌ Failed to start agent: {e}")
         return 1
+    finally:
+        if agent is not None:
+            agent.close()
     
     return 0
 
@@ -21,6 +21,26 @@ except ImportError:
     stdio_client = None
 
 
+# Passed through to MCP server subprocesses when set: every AWS_* variable (static keys,
+# container/IRSA credential providers, CA bundle, STS endpoints), HOME for the launcher's
+# caches, and the proxy/CA settings needed to reach AWS (region/profile/PATH are set explicitly)
+_FORWARDED_ENV_PREFIX = "AWS_"
+_FORWARDED_ENV_VARS = frozenset({
+    "HOME",
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY",
+    "http_proxy", "https_proxy", "no_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE",
+})
+
+
+def _forwarded_env() -> Dict[str, str]:
+    """The subset of os.environ MCP servers need to authenticate and reach AWS"""
+    return {
+        key: value for key, value in os.environ.items()
+        if key.startswith(_FORWARDED_ENV_PREFIX) or key in _FORWARDED_ENV_VARS
+    }
+
+
 class AWSMCPClient:
     """
     Official MCP Client for AWS MCP Servers
@@ -32,65 +52,64 @@ class AWSMCPClient:
         self.aws_profile = os.getenv("AWS_PROFILE", "default")
         self.sessions: Dict[str, Any] = {}
         self._transports: Dict[str, Any] = {}
+        # Tool catalogs are static per server, so list_tools() is only called once
+        self._tool_cache: Dict[str, List[Any]] = {}
+        # Upper bound for a cold server's initialize handshake
+        self.connect_timeout = int(os.getenv("MCP_TIMEOUT", "30"))
         
-        # Configure environment for MCP servers
-        self.env = os.environ.copy()
+        # Configure environment for MCP servers (only what they need, not a copy of os.environ)
+        self.env = _forwarded_env()
         self.env.update({
             "AWS_REGION": self.aws_region,
             "AWS_PROFILE": self.aws_profile,
             "AWS_DEFAULT_REGION": self.aws_region,
-            "PATH": f"/root/.local/bin:{self.env.get('PATH', '')}"
+            "PATH": f"/root/.local/bin:{os.environ.get('PATH', '')}"
         })
     
+    async def _open_session(self, name: str, command: str, args: Optional[List[str]] = None) -> Optional[ClientSession]:
+        """Spawn an MCP server and initialize its session without blocking the event loop"""
+        try:
+            # stdio_client spawns the server over async (non-blocking) pipes
+            transport = stdio_client(StdioServerParameters(command=command, args=args or [], env=self.env))
+            read, write = await transport.__aenter__()
+        except Exception as e:
+            print(f"❌ Failed to start {name} MCP server: {e}")
+            return None
+        
+        session = ClientSession(read, write)
+        try:
+            # Entering the session starts its receive loop; only the handshake is time-bounded
+            await session.__aenter__()
+            await asyncio.wait_for(session.initialize(), timeout=self.connect_timeout)
+        except Exception as e:
+            print(f"❌ Failed to initialize {name} MCP session: {e!r}")
+            await self._close_transport(name, session, transport)
+            return None
+        
+        self.sessions[name] = session
+        # Store transport for cleanup
+        self._transports[name] = transport
+        return session
+    
+    async def _close_transport(self, name: str, session: ClientSession, transport: Any) -> None:
+        """Exit a session and its stdio transport, in that order"""
+        for context in (session, transport):
+            try:
+                await context.__aexit__(None, None, None)
+            except Exception as e:
+                print(f"⚠️  Error closing {name} session: {e}")
+    
     async def get_cost_explorer_session(self) -> Optional[ClientSession]:
         """Get or create Cost Explorer MCP session"""
         if "cost_explorer" not in self.sessions:
-            try:
-                # Create stdio server parameters for Cost Explorer MCP
-                server_params = StdioServerParameters(
-                    command="/root/.local/bin/awslabs.cost-explorer-mcp-server",
-                    env=self.env
-                )
-                
-                # Create client session - stdio_client returns async context manager
-                transport = stdio_client(server_params)
-                read, write = await transport.__aenter__()
-                session = ClientSession(read, write)
-                await session.initialize()
-                self.sessions["cost_explorer"] = session
-                # Store transport for cleanup
-                self._transports["cost_explorer"] = transport
-                
-            except Exception as e:
-                print(f"❌ Failed to create Cost Explorer MCP session: {e}")
-                return None
-        
-        return self.sessions.get("cost_explorer")
+            return await self._open_session("cost_explorer", "/root/.local/bin/awslabs.cost-explorer-mcp-server")
+        return self.sessions["cost_explorer"]
     
     async def get_cloudwatch_session(self) -> Optional[ClientSession]:
         """Get or create CloudWatch MCP session"""
         if "cloudwatch" not in self.sessions:
-            try:
-                # Create stdio server parameters for CloudWatch MCP
-                server_params = StdioServerParameters(
-                    command="/root/.local/bin/awslabs.cloudwatch-mcp-server",
-                    env=self.env
-                )
-                
-                # Create client session - stdio_client returns async context manager
-                transport = stdio_client(server_params)
-                read, write = await transport.__aenter__()
-                session = ClientSession(read, write)
-                await session.initialize()
-                self.sessions["cloudwatch"] = session
-                # Store transport for cleanup
-                self._transports["cloudwatch"] = transport
-                
-            except Exception as e:
-                print(f"❌ Failed to create CloudWatch MCP session: {e}")
-                return None
-        
-        return self.sessions.get("cloudwatch")
+            return await self._open_session("cloudwatch", "/root/.local/bin/awslabs.cloudwatch-mcp-server")
+        return self.sessions["cloudwatch"]
     
     async def call_cost_explorer_tool(self, tool_name: str, arguments: Dict = None) -> Dict[str, Any]:
         """
@@ -362,7 +381,7 @@ class AWSMCPClient:
                 }
             
             # List tools available in the session
-            tools = session.list_tools()
+            tools = await self._get_cached_tools(server_type, session)
             
             return {
                 "status": "success",
@@ -377,18 +396,21 @@ class AWSMCPClient:
                 "error": f"Failed to list tools from {server_type}: {str(e)}"
             }
     
+    async def _get_cached_tools(self, server_type: str, session: ClientSession) -> List[Any]:
+        """Return the server's tool list, calling list_tools() only on first use"""
+        if server_type not in self._tool_cache:
+            result = await session.list_tools()
+            self._tool_cache[server_type] = result.tools
+        return self._tool_cache[server_type]
+    
     async def close_sessions(self):
         """Close all MCP sessions"""
         for session_name, session in self.sessions.items():
-            try:
-                if hasattr(session, 'close'):
-                    await session.close()
-                elif hasattr(session, '__aexit__'):
-                    await session.__aexit__(None, None, None)
-            except Exception as e:
-                print(f"⚠️  Error closing {session_name} session: {e}")
+            await self._close_transport(session_name, session, self._transports[session_name])
         
         self.sessions.clear()
+        self._transports.clear()
+        self._tool_cache.clear()
         print("✅ All MCP sessions closed")
 
 
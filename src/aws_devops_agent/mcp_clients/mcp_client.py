@@ -3,10 +3,14 @@ Unified MCP Client for AWS DevOps Agent
 Follows Strands SDK best practices and naming conventions
 """
 
+import atexit
 import os
+import threading
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from ..config._env_cache import load_env_cached
+
 # Import Strands MCP SDK - this is the recommended approach
 try:
     from mcp import stdio_client, StdioServerParameters
@@ -26,7 +30,26 @@ class DevOpsMCPClient:
     def __init__(self):
         self.aws_region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
         self.aws_profile = os.getenv("AWS_PROFILE", "default")
+        # Server environment is built once and shared by every AWS MCP server
+        self.aws_env = {
+            "AWS_REGION": self.aws_region,
+            "AWS_PROFILE": self.aws_profile,
+            "AWS_DEFAULT_REGION": self.aws_region,
+            "FASTMCP_LOG_LEVEL": "ERROR"
+        }
+        # Bounds only the cold server start; calls on a resident session carry no extra timer
+        self.connect_timeout = int(os.getenv("MCP_TIMEOUT", "30"))
         self.clients: Dict[str, MCPClient] = {}
+        self.server_params: Dict[str, StdioServerParameters] = {}
+        # Clients whose stdio session has been started and is kept open
+        self._started: set = set()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._getters = {
+            "cost_explorer": self.get_cost_explorer_client,
+            "cloudwatch": self.get_cloudwatch_client,
+            "pricing": self.get_pricing_client,
+            "github": self.get_github_client,
+        }
         
         if not MCP_AVAILABLE:
             raise ImportError("Strands MCP SDK not available")
@@ -36,20 +59,15 @@ class DevOpsMCPClient:
         if "cost_explorer" not in self.clients:
             try:
                 # Follow Strands documentation pattern exactly
-                mcp_client = MCPClient(lambda: stdio_client(
-                    StdioServerParameters(
-                        command="uvx",
-                        args=["awslabs.cost-explorer-mcp-server@latest"],
-                        env={
-                            "AWS_REGION": self.aws_region,
-                            "AWS_PROFILE": self.aws_profile,
-                            "AWS_DEFAULT_REGION": self.aws_region,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
-                    )
-                ))
+                params = StdioServerParameters(
+                    command="uvx",
+                    args=["awslabs.cost-explorer-mcp-server@latest"],
+                    env=self.aws_env
+                )
+                mcp_client = MCPClient(lambda: stdio_client(params), startup_timeout=self.connect_timeout)
                 
                 self.clients["cost_explorer"] = mcp_client
+                self.server_params["cost_explorer"] = params
                 print("✅ Cost Explorer MCP client created")
                 
             except Exception as e:
@@ -62,20 +80,15 @@ class DevOpsMCPClient:
         """Get or create CloudWatch MCP client using Strands pattern"""
         if "cloudwatch" not in self.clients:
             try:
-                mcp_client = MCPClient(lambda: stdio_client(
-                    StdioServerParameters(
-                        command="uvx",
-                        args=["awslabs.cloudwatch-mcp-server@latest"],
-                        env={
-                            "AWS_REGION": self.aws_region,
-                            "AWS_PROFILE": self.aws_profile,
-                            "AWS_DEFAULT_REGION": self.aws_region,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
-                    )
-                ))
+                params = StdioServerParameters(
+                    command="uvx",
+                    args=["awslabs.cloudwatch-mcp-server@latest"],
+                    env=self.aws_env
+                )
+                mcp_client = MCPClient(lambda: stdio_client(params), startup_timeout=self.connect_timeout)
                 
                 self.clients["cloudwatch"] = mcp_client
+                self.server_params["cloudwatch"] = params
                 print("✅ CloudWatch MCP client created")
                 
             except Exception as e:
@@ -88,20 +101,15 @@ class DevOpsMCPClient:
         """Get or create AWS Pricing MCP client using Strands pattern"""
         if "pricing" not in self.clients:
             try:
-                mcp_client = MCPClient(lambda: stdio_client(
-                    StdioServerParameters(
-                        command="uvx",
-                        args=["awslabs.aws-pricing-mcp-server@latest"],
-                        env={
-                            "AWS_REGION": self.aws_region,
-                            "AWS_PROFILE": self.aws_profile,
-                            "AWS_DEFAULT_REGION": self.aws_region,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
-                    )
-                ))
+                params = StdioServerParameters(
+                    command="uvx",
+                    args=["awslabs.aws-pricing-mcp-server@latest"],
+                    env=self.aws_env
+                )
+                mcp_client = MCPClient(lambda: stdio_client(params), startup_timeout=self.connect_timeout)
                 
                 self.clients["pricing"] = mcp_client
+                self.server_params["pricing"] = params
                 print("✅ AWS Pricing MCP client created")
                 
             except Exception as e:
@@ -119,14 +127,8 @@ class DevOpsMCPClient:
                 if not github_token:
                     # Try to read from config file
                     try:
-                        config_path = "src/aws_devops_agent/config/.env"
-                        if os.path.exists(config_path):
-                            with open(config_path, 'r') as f:
-                                for line in f:
-                                    if line.startswith("GITHUB_PERSONAL_ACCESS_TOKEN="):
-                                        github_token = line.split("=", 1)[1].strip()
-                                        break
-                    except Exception:
+                        github_token = load_env_cached("src/aws_devops_agent/config/.env").get("GITHUB_PERSONAL_ACCESS_TOKEN")
+                    except FileNotFoundError:
                         pass
                 
                 if not github_token:
@@ -134,18 +136,18 @@ class DevOpsMCPClient:
                     return None
                 
                 # Use our compiled GitHub MCP server
-                mcp_client = MCPClient(lambda: stdio_client(
-                    StdioServerParameters(
-                        command="./github-mcp-server/github-mcp-server",
-                        args=["stdio"],
-                        env={
-                            "GITHUB_PERSONAL_ACCESS_TOKEN": github_token,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
-                    )
-                ))
+                params = StdioServerParameters(
+                    command="./github-mcp-server/github-mcp-server",
+                    args=["stdio"],
+                    env={
+                        "GITHUB_PERSONAL_ACCESS_TOKEN": github_token,
+                        "FASTMCP_LOG_LEVEL": "ERROR"
+                    }
+                )
+                mcp_client = MCPClient(lambda: stdio_client(params), startup_timeout=self.connect_timeout)
                 
                 self.clients["github"] = mcp_client
+                self.server_params["github"] = params
                 print("✅ GitHub MCP client created")
                 
             except Exception as e:
@@ -154,6 +156,55 @@ class DevOpsMCPClient:
         
         return self.clients.get("github")
     
+    def get_session(self, name: str) -> Optional[MCPClient]:
+        """Get an MCP client with its server session started once and kept open for reuse"""
+        with self._locks.setdefault(name, threading.Lock()):
+            client = self._getters[name]()
+            if client and name not in self._started:
+                client.start()
+                self._started.add(name)
+        return client
+    
+    def get_github_session(self) -> Optional[MCPClient]:
+        """Get the GitHub MCP client with its server session started once and kept open"""
+        return self.get_session("github")
+    
+    def call_tools(self, name: str, calls: List[Dict[str, Any]]) -> Optional[List[Any]]:
+        """
+        Run several MCP tool calls over a single resident server session
+        
+        Args:
+            name: Server name (cost_explorer, cloudwatch, pricing or github)
+            calls: List of dicts with tool_use_id, name and optional arguments
+            
+        Returns:
+            List of tool results in the same order as calls, or None if the client is unavailable
+        """
+        client = self.get_session(name)
+        if not client:
+            return None
+        
+        return [
+            client.call_tool_sync(
+                tool_use_id=call["tool_use_id"],
+                name=call["name"],
+                arguments=call.get("arguments", {})
+            )
+            for call in calls
+        ]
+    
+    def call_github_tools(self, calls: List[Dict[str, Any]]) -> Optional[List[Any]]:
+        """Run several GitHub MCP tool calls over a single server session"""
+        return self.call_tools("github", calls)
+    
+    def list_tools(self, name: str) -> List[Any]:
+        """List a server's tools, using the on-disk catalog cache when warm (empty if the client is unavailable)"""
+        from ..tools._mcp_discovery_cache import cached_list_tools
+        client = self.get_session(name)
+        if not client:
+            return []
+        return cached_list_tools(client, self.server_params[name])
+    
     def get_all_clients(self) -> Dict[str, MCPClient]:
         """Get all available MCP clients"""
         return {
@@ -168,13 +219,19 @@ class DevOpsMCPClient:
         for name, client in self.clients.items():
             if client:
                 try:
-                    client.close()
+                    if name in self._started:
+                        client.stop(None, None, None)
+                    else:
+                        client.close()
                     print(f"✅ Closed {name} MCP client")
                 except Exception as e:
                     print(f"⚠️  Error closing {name} MCP client: {e}")
         
         self.clients.clear()
+        self.server_params.clear()
+        self._started.clear()
 
 
 # Create a singleton instance following Strands patterns
 mcp_client = DevOpsMCPClient()
+atexit.register(mcp_client.close_all_clients)
@@ -26,6 +26,13 @@ class StrandsMCPClient:
     def __init__(self):
         self.aws_region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
         self.aws_profile = os.getenv("AWS_PROFILE", "default")
+        # Server environment is built once and shared by every AWS MCP server
+        self.aws_env = {
+            "AWS_REGION": self.aws_region,
+            "AWS_PROFILE": self.aws_profile,
+            "AWS_DEFAULT_REGION": self.aws_region,
+            "FASTMCP_LOG_LEVEL": "ERROR"
+        }
         self.clients: Dict[str, MCPClient] = {}
         
         if not MCP_AVAILABLE:
@@ -40,12 +47,7 @@ class StrandsMCPClient:
                     StdioServerParameters(
                         command="uvx",
                         args=["awslabs.cost-explorer-mcp-server@latest"],
-                        env={
-                            "AWS_REGION": self.aws_region,
-                            "AWS_PROFILE": self.aws_profile,
-                            "AWS_DEFAULT_REGION": self.aws_region,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
+                        env=self.aws_env
                     )
                 ))
                 
@@ -69,12 +71,7 @@ class StrandsMCPClient:
                     StdioServerParameters(
                         command="uvx",
                         args=["awslabs.cloudwatch-mcp-server@latest"],
-                        env={
-                            "AWS_REGION": self.aws_region,
-                            "AWS_PROFILE": self.aws_profile,
-                            "AWS_DEFAULT_REGION": self.aws_region,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
+                        env=self.aws_env
                     )
                 ))
                 
@@ -98,12 +95,7 @@ class StrandsMCPClient:
                     StdioServerParameters(
                         command="uvx",
                         args=["awslabs.terraform-mcp-server@latest"],
-                        env={
-                            "AWS_REGION": self.aws_region,
-                            "AWS_PROFILE": self.aws_profile,
-                            "AWS_DEFAULT_REGION": self.aws_region,
-                            "FASTMCP_LOG_LEVEL": "ERROR"
-                        }
+                        env=self.aws_env
                     )
                 ))
                 
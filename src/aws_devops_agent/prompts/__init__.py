@@ -0,0 +1,13 @@
+"""System prompts for the AWS DevOps agents, stored as package data"""
+
+from functools import lru_cache
+from importlib import resources
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """Load a system prompt by name (e.g. "aws_devops_es"), reading the file only once"""
+    return resources.files(__package__).joinpath(f"{name}.md").read_text(encoding="utf-8").rstrip("\n")
+
+
+__all__ = ["load_prompt"]
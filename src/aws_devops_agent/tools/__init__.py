@@ -1,106 +1,157 @@
-"""AWS DevOps Tools - Organized by domain"""
+"""AWS DevOps Tools - Organized by domain
 
-# Import all tools for easy access
-from .aws_pricing import *
-from .aws_cost import *
-from .aws_iac import *
-from .aws_cdk import *
-from .aws_terraform import *
-from .aws_security import *
-from .aws_compliance import *
-from .github import *
-from .reporting import *
+Tools are resolved lazily (PEP 562): a domain subpackage is only imported
+the first time one of its tools is accessed.
+"""
 
-__all__ = [
+import importlib
+
+# Exported tools, keyed by the domain subpackage that defines them
+_EXPORTS = {
     # Pricing tools (AWS Pricing API)
-    "get_real_aws_pricing",
-    "calculate_reserved_instance_savings", 
-    "get_service_pricing_overview",
-    "generate_cost_comparison_report",
-    "compare_instance_types",
-    "compare_pricing_models",
-    "compare_regions_pricing",
-    "analyze_price_optimization_opportunities",
-    "suggest_cost_effective_alternatives",
-    "calculate_savings_potential",
-    "optimize_terraform_plan_costs",
+    "aws_pricing": (
+        "get_real_aws_pricing",
+        "calculate_reserved_instance_savings",
+        "get_service_pricing_overview",
+        "generate_cost_comparison_report",
+        "compare_instance_types",
+        "compare_pricing_models",
+        "compare_regions_pricing",
+        "analyze_price_optimization_opportunities",
+        "suggest_cost_effective_alternatives",
+        "calculate_savings_potential",
+        "optimize_terraform_plan_costs",
+    ),
     
     # Cost tools (AWS Cost Explorer)
-    "get_actual_aws_costs",
-    "get_cost_by_service",
-    "get_cost_trends",
-    "get_rightsizing_recommendations", 
-    "get_reserved_instance_recommendations",
-    "analyze_cost_anomalies",
-    "analyze_usage_based_optimization",
-    "get_underutilized_resources",
-    "calculate_wasted_spend",
-    "generate_cost_optimization_report",
-    "analyze_resource_costs",
-    "get_unused_resources",
-    "calculate_resource_utilization",
-    "get_organization_costs",
-    "analyze_account_costs",
-    "generate_multi_account_report",
-    "get_cost_forecast_mcp",
-    "compare_cost_periods_mcp",
-    "scan_live_aws_resources",
-    "analyze_unused_resources",
-    "get_resource_utilization_metrics",
-    "discover_cross_account_resources",
-    "list_cross_account_resources",
-    "execute_cross_account_operation",
-    "monitor_cross_account_compliance",
+    "aws_cost": (
+        "get_actual_aws_costs",
+        "get_cost_by_service",
+        "get_cost_trends",
+        "get_rightsizing_recommendations",
+        "get_reserved_instance_recommendations",
+        "analyze_cost_anomalies",
+        "get_cost_dashboard_bundle",
+        "analyze_usage_based_optimization",
+        "get_underutilized_resources",
+        "calculate_wasted_spend",
+        "generate_cost_optimization_report",
+        "analyze_resource_costs",
+        "get_unused_resources",
+        "calculate_resource_utilization",
+        "get_organization_costs",
+        "analyze_account_costs",
+        "generate_multi_account_report",
+        "get_cost_forecast_mcp",
+        "compare_cost_periods_mcp",
+        "scan_live_aws_resources",
+        "analyze_unused_resources",
+        "get_resource_utilization_metrics",
+        "discover_cross_account_resources",
+        "list_cross_account_resources",
+        "execute_cross_account_operation",
+        "monitor_cross_account_compliance",
+    ),
     
     # IaC tools
-    "analyze_terraform_configuration",
-    "validate_cloudformation_template",
-    "scan_infrastructure_drift",
-    "generate_iac_best_practices_report",
+    "aws_iac": (
+        "analyze_terraform_configuration",
+        "validate_cloudformation_template",
+        "scan_infrastructure_drift",
+        "generate_iac_best_practices_report",
+    ),
     
     # CDK tools
-    "analyze_cdk_project",
-    "synthesize_cdk_project",
-    "analyze_cdk_synthesized_output",
-    "generate_cdk_optimization_report",
+    "aws_cdk": (
+        "analyze_cdk_project",
+        "synthesize_cdk_project",
+        "analyze_cdk_synthesized_output",
+        "generate_cdk_optimization_report",
+    ),
     
     # Terraform tools
-    "analyze_terraform_project",
-    "validate_terraform_configuration",
-    "plan_terraform_changes",
-    "analyze_terraform_state",
-    "generate_terraform_optimization_report",
+    "aws_terraform": (
+        "analyze_terraform_project",
+        "validate_terraform_configuration",
+        "plan_terraform_changes",
+        "analyze_terraform_state",
+        "generate_terraform_optimization_report",
+    ),
     
     # Compliance tools
-    "validate_security_policies",
-    "check_compliance_standards",
-    "generate_compliance_report",
-    "scan_security_vulnerabilities",
-    "analyze_security_hub_findings",
-    "get_security_insights",
-    "analyze_security_posture",
-    "analyze_config_compliance",
-    "get_compliance_details",
-    "check_resource_compliance",
-    "analyze_inspector_findings",
+    "aws_compliance": (
+        "validate_security_policies",
+        "check_compliance_standards",
+        "generate_compliance_report",
+        "scan_security_vulnerabilities",
+    ),
+    
+    # Security tools (Security Hub, Config, Inspector)
+    "aws_security": (
+        "analyze_security_hub_findings",
+        "get_security_insights",
+        "analyze_security_posture",
+        "analyze_config_compliance",
+        "get_compliance_details",
+        "check_resource_compliance",
+        "analyze_inspector_findings",
+        "get_vulnerability_assessment",
+        "check_security_vulnerabilities",
+        "get_trusted_advisor_checks",
+        "analyze_trusted_advisor_recommendations",
+        "get_security_recommendations",
+        "perform_comprehensive_security_analysis",
+        "generate_security_report",
+    ),
     
     # GitHub tools
-    "check_repository_connectivity",
-    "create_branch_simple", 
-    "get_repository_info",
-    "list_repository_branches",
-    "create_optimization_pull_request",
-    "update_iac_via_github",
-    "list_infrastructure_repositories",
-    "monitor_infrastructure_prs",
+    "github": (
+        "check_repository_connectivity",
+        "create_branch_simple",
+        "get_repository_info",
+        "list_repository_branches",
+        "create_optimization_pull_request",
+        "update_iac_via_github",
+        "list_infrastructure_repositories",
+        "monitor_infrastructure_prs",
+    ),
     
     # Reporting tools
-    "generate_document",
-    "generate_cost_analysis_document",
-    "generate_security_compliance_document", 
-    "generate_infrastructure_document",
-    "generate_cdk_analysis_document",
-    "generate_terraform_analysis_document",
-    "list_generated_documents",
-    "get_document_info"
-]
+    "reporting": (
+        "generate_document",
+        "generate_cost_analysis_document",
+        "generate_security_compliance_document",
+        "generate_infrastructure_document",
+        "generate_cdk_analysis_document",
+        "generate_terraform_analysis_document",
+        "list_generated_documents",
+        "get_document_info",
+    ),
+    
+    # Batch tools
+    "batch": (
+        "run_tools_batch",
+    ),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    """Import a tool's domain subpackage on first access"""
+    if name in _MODULE_OF:
+        value = getattr(importlib.import_module(f".{_MODULE_OF[name]}", __name__), name)
+    elif name in _EXPORTS:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        # Unknown names fail fast rather than importing every domain to look for them
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
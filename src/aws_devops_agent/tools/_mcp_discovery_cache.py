@@ -0,0 +1,81 @@
+"""
+On-disk cache of MCP server tool catalogs
+Lets warm processes skip the list_tools() round-trip for servers already discovered
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+# Only these env vars change what a server exposes; secrets never enter the key
+_ENV_ALLOWLIST = ("AWS_REGION", "AWS_DEFAULT_REGION", "AWS_PROFILE", "FASTMCP_LOG_LEVEL")
+
+CACHE_DIR = Path(os.getenv("MCP_CATALOG_CACHE_DIR", Path.home() / ".cache" / "aws-devops-agent" / "mcp-catalogs"))
+
+# Servers launch as "uvx <package>@latest", so neither the command nor the launcher binary
+# changes when the package updates; catalogs are refetched once they are a day old
+CATALOG_TTL_SECONDS = int(os.getenv("MCP_CATALOG_TTL_SECONDS", str(24 * 60 * 60)))
+
+
+def _binary_mtime(command: str) -> float:
+    """Modification time of the server executable (0 if it cannot be resolved)"""
+    path = shutil.which(command)
+    try:
+        return os.path.getmtime(path) if path else 0.0
+    except OSError:
+        return 0.0
+
+
+def catalog_key(server_params: Any) -> str:
+    """Cache key from server command, args, allowlisted env and binary mtime"""
+    env = server_params.env or {}
+    material = json.dumps([
+        server_params.command,
+        list(server_params.args),
+        sorted((key, env[key]) for key in _ENV_ALLOWLIST if key in env),
+        _binary_mtime(server_params.command),
+    ])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def load_cached_catalog(server_params: Any) -> Optional[List[Any]]:
+    """Return the cached MCP Tool definitions for a server, or None on a miss"""
+    from mcp.types import Tool
+
+    try:
+        cached = json.loads((CACHE_DIR / f"{catalog_key(server_params)}.json").read_text())
+        if not isinstance(cached, dict) or time.time() - cached["cached_at"] >= CATALOG_TTL_SECONDS:
+            return None
+        return [Tool.model_validate(entry) for entry in cached["tools"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_catalog(server_params: Any, mcp_tools: List[Any]) -> None:
+    """Persist MCP Tool definitions for a server (best effort)"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({
+            "cached_at": time.time(),
+            "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in mcp_tools],
+        })
+        (CACHE_DIR / f"{catalog_key(server_params)}.json").write_text(payload)
+    except OSError as e:
+        print(f"⚠️  Could not save MCP tool catalog: {e}")
+
+
+def cached_list_tools(client: Any, server_params: Any) -> List[Any]:
+    """list_tools_sync() for a started MCPClient, served from the on-disk catalog when warm"""
+    from strands.tools.mcp.mcp_agent_tool import MCPAgentTool
+
+    mcp_tools = load_cached_catalog(server_params)
+    if mcp_tools is not None:
+        return [MCPAgentTool(mcp_tool, client) for mcp_tool in mcp_tools]
+
+    tools = client.list_tools_sync()
+    save_catalog(server_params, [tool.mcp_tool for tool in tools])
+    return tools
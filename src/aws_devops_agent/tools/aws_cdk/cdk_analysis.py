@@ -3,15 +3,18 @@ AWS CDK Analysis Tools
 CDK project analysis, synthesis, and optimization recommendations
 """
 
+import functools
 import json
 import os
 import subprocess
 import tempfile
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from strands import tool
 
+from ...clients import aws_client
+
 
 @tool
 def analyze_cdk_project(project_path: str, environment: str = "production") -> Dict[str, Any]:
@@ -425,6 +428,13 @@ def _analyze_cloudformation_template_file(template_file: Path) -> Dict[str, Any]
         
         resources = template.get("Resources", {})
         
+        # Price every EC2 instance type in the template with a single Pricing API lookup
+        ec2_costs = _estimate_ec2_costs([
+            resource_config.get("Properties", {}).get("InstanceType", "")
+            for resource_config in resources.values()
+            if resource_config.get("Type") == "AWS::EC2::Instance"
+        ])
+        
         # Analyze each resource
         for resource_name, resource_config in resources.items():
             resource_type = resource_config.get("Type", "")
@@ -442,7 +452,7 @@ def _analyze_cloudformation_template_file(template_file: Path) -> Dict[str, Any]
                 instance_type = properties.get("InstanceType", "")
                 resource_analysis.update({
                     "instance_type": instance_type,
-                    "estimated_monthly_cost": _estimate_ec2_cost(instance_type)
+                    "estimated_monthly_cost": ec2_costs[instance_type]
                 })
             
             # RDS Instance analysis
@@ -503,30 +513,52 @@ def _analyze_cloudformation_template_file(template_file: Path) -> Dict[str, Any]
 
 def _estimate_ec2_cost(instance_type: str, region: str = "us-east-1") -> float:
     """Estimate monthly cost for EC2 instance type using real AWS pricing data"""
+    return _estimate_ec2_costs([instance_type], region)[instance_type]
+
+
+def _estimate_ec2_costs(instance_types: List[str], region: str = "us-east-1") -> Dict[str, float]:
+    """Estimate monthly costs for several EC2 instance types with one Pricing API query"""
+    unique_types = tuple(sorted(set(instance_types)))
+    if not unique_types:
+        return {}
+    
     try:
-        # Import AWS pricing tools
-        from ..aws_pricing.pricing import get_real_aws_pricing
-        
-        # Get real pricing data for EC2 instances
-        pricing_result = get_real_aws_pricing(
-            service="AmazonEC2",
-            instance_type=instance_type,
-            region=region
-        )
-        
-        if pricing_result.get("status") == "success":
-            pricing_data = pricing_result.get("data", {})
-            # Calculate monthly cost (assuming 24/7 usage)
-            hourly_rate = pricing_data.get("price", 0)
-            monthly_cost = hourly_rate * 24 * 30  # 24 hours * 30 days
-            return round(monthly_cost, 2)
-        else:
-            # Fallback to conservative estimate if pricing API fails
-            return _get_fallback_ec2_cost(instance_type)
-            
+        hourly_rates = dict(_get_ec2_hourly_rates(unique_types, region))
     except Exception as e:
-        print(f"Warning: Could not get real pricing for {instance_type}: {e}")
-        return _get_fallback_ec2_cost(instance_type)
+        print(f"Warning: Could not get real pricing for {', '.join(unique_types)}: {e}")
+        hourly_rates = {}
+    
+    return {
+        instance_type: round(hourly_rates[instance_type] * 24 * 30, 2)
+        if instance_type in hourly_rates else _get_fallback_ec2_cost(instance_type)
+        for instance_type in unique_types
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _get_ec2_hourly_rates(instance_types: Tuple[str, ...], region: str) -> Tuple[Tuple[str, float], ...]:
+    """On-demand Linux hourly rates for the given instance types (failed lookups are not cached)"""
+    # The Pricing API is only served from a few regions; us-east-1 covers prices for all of them
+    paginator = aws_client("pricing", region_name="us-east-1").get_paginator("get_products")
+    filters = [
+        {"Type": "ANY_OF", "Field": "instanceType", "Value": ",".join(instance_types)},
+        {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
+        {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": "Linux"},
+        {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
+        {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
+        {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+    ]
+    
+    rates = {}
+    for page in paginator.paginate(ServiceCode="AmazonEC2", Filters=filters):
+        for price_item in page.get("PriceList", []):
+            product = json.loads(price_item)
+            instance_type = product["product"]["attributes"]["instanceType"]
+            for term in product.get("terms", {}).get("OnDemand", {}).values():
+                for dimension in term.get("priceDimensions", {}).values():
+                    rates.setdefault(instance_type, float(dimension["pricePerUnit"]["USD"]))
+    
+    return tuple(rates.items())
 
 
 def _get_fallback_ec2_cost(instance_type: str) -> float:
@@ -553,48 +585,49 @@ def _get_fallback_ec2_cost(instance_type: str) -> float:
     return cost_map.get(instance_type, 50.0)  # Default estimate
 
 
+# Map CDK resource types to AWS services
+_PRICING_SERVICE_CODES = {
+    "AWS::RDS::DBInstance": "AmazonRDS",
+    "AWS::S3::Bucket": "AmazonS3",
+    "AWS::Lambda::Function": "AWSLambda",
+    "AWS::ElasticLoadBalancingV2::LoadBalancer": "AWSELB",
+    "AWS::ElastiCache::CacheCluster": "AmazonElastiCache",
+    "AWS::DynamoDB::Table": "AmazonDynamoDB",
+    "AWS::CloudFront::Distribution": "AmazonCloudFront",
+    "AWS::ApiGateway::RestApi": "AmazonApiGateway"
+}
+
+
 def _estimate_aws_service_cost(service_name: str, resource_type: str, properties: Dict[str, Any], region: str = "us-east-1") -> float:
     """Estimate monthly cost for various AWS services using real pricing data"""
     try:
-        # Import AWS pricing tools
-        from ..aws_pricing.pricing import get_real_aws_pricing
-        
-        # Map CDK resource types to AWS services
-        service_mapping = {
-            "AWS::RDS::DBInstance": "AmazonRDS",
-            "AWS::S3::Bucket": "AmazonS3",
-            "AWS::Lambda::Function": "AWSLambda",
-            "AWS::ElasticLoadBalancingV2::LoadBalancer": "AWSELB",
-            "AWS::ElastiCache::CacheCluster": "AmazonElastiCache",
-            "AWS::DynamoDB::Table": "AmazonDynamoDB",
-            "AWS::CloudFront::Distribution": "AmazonCloudFront",
-            "AWS::ApiGateway::RestApi": "AmazonApiGateway"
-        }
-        
-        aws_service = service_mapping.get(resource_type, "AmazonEC2")
+        aws_service = _PRICING_SERVICE_CODES.get(resource_type, "AmazonEC2")
+        base_price = _get_service_base_price(aws_service, region)
         
-        # Get real pricing data
-        pricing_result = get_real_aws_pricing(
-            service=aws_service,
-            region=region
-        )
+        # Calculate cost based on service type and properties
+        monthly_cost = _calculate_service_specific_cost(resource_type, properties, base_price)
+        return round(monthly_cost, 2)
         
-        if pricing_result.get("status") == "success":
-            pricing_data = pricing_result.get("data", {})
-            base_price = pricing_data.get("price", 0)
-            
-            # Calculate cost based on service type and properties
-            monthly_cost = _calculate_service_specific_cost(resource_type, properties, base_price)
-            return round(monthly_cost, 2)
-        else:
-            # Fallback to conservative estimate
-            return _get_fallback_service_cost(resource_type, properties)
-            
+    except LookupError:
+        # Fallback to conservative estimate
+        return _get_fallback_service_cost(resource_type, properties)
     except Exception as e:
         print(f"Warning: Could not get real pricing for {resource_type}: {e}")
         return _get_fallback_service_cost(resource_type, properties)
 
 
+@functools.lru_cache(maxsize=64)
+def _get_service_base_price(aws_service: str, region: str) -> float:
+    """Base price for a service, looked up once per process (failed lookups are not cached)"""
+    from ..aws_pricing.pricing import get_real_aws_pricing
+    
+    pricing_result = get_real_aws_pricing(service=aws_service, region=region)
+    if pricing_result.get("status") != "success":
+        raise LookupError(pricing_result.get("error", "Pricing query failed"))
+    
+    return pricing_result.get("data", {}).get("price", 0)
+
+
 def _calculate_service_specific_cost(resource_type: str, properties: Dict[str, Any], base_price: float) -> float:
     """Calculate cost based on service-specific properties"""
     if resource_type == "AWS::RDS::DBInstance":
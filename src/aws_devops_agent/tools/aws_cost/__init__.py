@@ -15,7 +15,8 @@ from .explorer import (
     get_cost_trends,
     get_rightsizing_recommendations,
     get_reserved_instance_recommendations,
-    analyze_cost_anomalies
+    analyze_cost_anomalies,
+    get_cost_dashboard_bundle
 )
 
 from .optimization import (
@@ -53,6 +54,7 @@ __all__ = [
     'get_rightsizing_recommendations',
     'get_reserved_instance_recommendations',
     'analyze_cost_anomalies',
+    'get_cost_dashboard_bundle',
     'analyze_usage_based_optimization',
     'get_underutilized_resources',
     'calculate_wasted_spend',
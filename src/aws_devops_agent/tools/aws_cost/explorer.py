@@ -3,8 +3,10 @@ AWS Cost Explorer Integration
 Real AWS Cost Explorer data access via MCP servers
 """
 
+import asyncio
 import json
 import os
+from ...clients import aws_client
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from strands import tool
@@ -43,30 +45,29 @@ def get_actual_aws_costs(
         
         if mcp_client:
             # Use real MCP client for Cost Explorer data
-            cost_client = mcp_client.get_cost_explorer_client()
+            cost_client = mcp_client.get_session("cost_explorer")
             if cost_client:
-                with cost_client:
-                    # Use Cost Explorer MCP pattern to get cost data
-                    tools = cost_client.list_tools_sync()
+                # Use Cost Explorer MCP pattern to get cost data
+                tools = mcp_client.list_tools("cost_explorer")
                     
-                    # Find cost and usage tool
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'cost_and_usage' in tool.name.lower():
-                            result = cost_client.call_tool_sync(
-                                tool_use_id="cost-query",
-                                name=tool.name,
-                                arguments={
-                                    "time_period": {
-                                        "start": start_date.strftime("%Y-%m-%d"),
-                                        "end": end_date.strftime("%Y-%m-%d")
-                                    },
-                                    "granularity": granularity,
-                                    "metrics": ["BlendedCost", "UnblendedCost", "UsageQuantity"],
-                                    "group_by": group_by or [],
-                                    "account_id": account_id
-                                }
-                            )
-                            break
+                # Find cost and usage tool
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'cost_and_usage' in tool.name.lower():
+                        result = cost_client.call_tool_sync(
+                            tool_use_id="cost-query",
+                            name=tool.name,
+                            arguments={
+                                "time_period": {
+                                    "start": start_date.strftime("%Y-%m-%d"),
+                                    "end": end_date.strftime("%Y-%m-%d")
+                                },
+                                "granularity": granularity,
+                                "metrics": ["BlendedCost", "UnblendedCost", "UsageQuantity"],
+                                "group_by": group_by or [],
+                                "account_id": account_id
+                            }
+                        )
+                        break
             
             if result and result.get("status") == "success":
                 return {
@@ -238,26 +239,25 @@ def get_rightsizing_recommendations() -> Dict[str, Any]:
     try:
         if mcp_client:
             # Use real MCP client for rightsizing recommendations
-            cost_client = mcp_client.get_cost_explorer_client()
+            cost_client = mcp_client.get_session("cost_explorer")
             if cost_client:
-                with cost_client:
-                    tools = cost_client.list_tools_sync()
+                tools = mcp_client.list_tools("cost_explorer")
                     
-                    # Find rightsizing recommendations tool
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'rightsizing' in tool.name.lower():
-                            result = cost_client.call_tool_sync(
-                                tool_use_id="rightsizing-query",
-                                name=tool.name,
-                                arguments={
-                                    "service": "EC2-Instance",
-                                    "configuration": {
-                                        "benefits_considered": True,
-                                        "recommendation_target": "SAME_INSTANCE_FAMILY"
-                                    }
+                # Find rightsizing recommendations tool
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'rightsizing' in tool.name.lower():
+                        result = cost_client.call_tool_sync(
+                            tool_use_id="rightsizing-query",
+                            name=tool.name,
+                            arguments={
+                                "service": "EC2-Instance",
+                                "configuration": {
+                                    "benefits_considered": True,
+                                    "recommendation_target": "SAME_INSTANCE_FAMILY"
                                 }
-                            )
-                            break
+                            }
+                        )
+                        break
             
             if result and result.get("status") == "success":
                 recommendations = result.get("recommendations", [])
@@ -311,26 +311,25 @@ def get_reserved_instance_recommendations() -> Dict[str, Any]:
     try:
         if mcp_client:
             # Use real MCP client for RI recommendations
-            cost_client = mcp_client.get_cost_explorer_client()
+            cost_client = mcp_client.get_session("cost_explorer")
             if cost_client:
-                with cost_client:
-                    tools = cost_client.list_tools_sync()
+                tools = mcp_client.list_tools("cost_explorer")
                     
-                    # Find RI recommendations tool
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'reserved_instance' in tool.name.lower():
-                            result = cost_client.call_tool_sync(
-                                tool_use_id="ri-recommendations-query",
-                                name=tool.name,
-                                arguments={
-                                    "service": "EC2-Instance",
-                                    "account_scope": "PAYER",
-                                    "lookback_period": "SEVEN_DAYS",
-                                    "term_in_years": "ONE_YEAR",
-                                    "payment_option": "PARTIAL_UPFRONT"
-                                }
-                            )
-                            break
+                # Find RI recommendations tool
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'reserved_instance' in tool.name.lower():
+                        result = cost_client.call_tool_sync(
+                            tool_use_id="ri-recommendations-query",
+                            name=tool.name,
+                            arguments={
+                                "service": "EC2-Instance",
+                                "account_scope": "PAYER",
+                                "lookback_period": "SEVEN_DAYS",
+                                "term_in_years": "ONE_YEAR",
+                                "payment_option": "PARTIAL_UPFRONT"
+                            }
+                        )
+                        break
             
             if result and result.get("status") == "success":
                 recommendations = result.get("recommendations", [])
@@ -397,26 +396,25 @@ def analyze_cost_anomalies(
         
         if mcp_client:
             # Use real MCP client for anomaly detection
-            cost_client = mcp_client.get_cost_explorer_client()
+            cost_client = mcp_client.get_session("cost_explorer")
             if cost_client:
-                with cost_client:
-                    tools = cost_client.list_tools_sync()
+                tools = mcp_client.list_tools("cost_explorer")
                     
-                    # Find anomaly detection tool
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'anomal' in tool.name.lower():
-                            result = cost_client.call_tool_sync(
-                                tool_use_id="anomaly-query",
-                                name=tool.name,
-                                arguments={
-                                    "date_interval": {
-                                        "start_date": start_date.strftime("%Y-%m-%d"),
-                                        "end_date": end_date.strftime("%Y-%m-%d")
-                                    },
-                                    "total_impact_threshold": total_impact_threshold
-                                }
-                            )
-                            break
+                # Find anomaly detection tool
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'anomal' in tool.name.lower():
+                        result = cost_client.call_tool_sync(
+                            tool_use_id="anomaly-query",
+                            name=tool.name,
+                            arguments={
+                                "date_interval": {
+                                    "start_date": start_date.strftime("%Y-%m-%d"),
+                                    "end_date": end_date.strftime("%Y-%m-%d")
+                                },
+                                "total_impact_threshold": total_impact_threshold
+                            }
+                        )
+                        break
             
             if result and result.get("status") == "success":
                 anomalies = result.get("anomalies", [])
@@ -463,6 +461,121 @@ def analyze_cost_anomalies(
         return {"status": "error", "error": f"Failed to analyze cost anomalies: {str(e)}"}
 
 
+@tool
+def get_cost_dashboard_bundle(
+    time_period_days: int = 30,
+    forecast_days: int = 30
+) -> Dict[str, Any]:
+    """
+    Get costs by service, cost forecast and rightsizing recommendations in one call
+    
+    The three Cost Explorer requests are issued concurrently, so the bundle takes
+    about as long as the slowest of them instead of their sum.
+    
+    Args:
+        time_period_days: Number of days of historical costs to retrieve
+        forecast_days: Number of days ahead to forecast
+    
+    Returns:
+        Dict containing cost, forecast and rightsizing sections
+    """
+    try:
+        today = datetime.now().date()
+        start_date = (today - timedelta(days=time_period_days)).strftime("%Y-%m-%d")
+        end_date = today.strftime("%Y-%m-%d")
+        forecast_end = (today + timedelta(days=forecast_days)).strftime("%Y-%m-%d")
+        
+        costs, forecast, rightsizing = asyncio.run(
+            _fetch_cost_dashboard(start_date, end_date, forecast_end)
+        )
+        
+        sections = {}
+        errors = {}
+        
+        if isinstance(costs, Exception):
+            errors["costs"] = str(costs)
+        else:
+            service_costs = {}
+            for period in costs.get("ResultsByTime", []):
+                for group in period.get("Groups", []):
+                    service = group["Keys"][0]
+                    amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
+                    service_costs[service] = service_costs.get(service, 0) + amount
+            sections["costs"] = {
+                "total_cost": round(sum(service_costs.values()), 2),
+                "by_service": {
+                    service: round(cost, 2)
+                    for service, cost in sorted(service_costs.items(), key=lambda x: x[1], reverse=True)
+                }
+            }
+        
+        if isinstance(forecast, Exception):
+            errors["forecast"] = str(forecast)
+        else:
+            sections["forecast"] = {
+                "forecast_end": forecast_end,
+                "total_forecast": round(float(forecast.get("Total", {}).get("Amount", 0)), 2)
+            }
+        
+        if isinstance(rightsizing, Exception):
+            errors["rightsizing"] = str(rightsizing)
+        else:
+            recommendations = rightsizing.get("RightsizingRecommendations", [])
+            summary = rightsizing.get("Summary", {})
+            sections["rightsizing"] = {
+                "total_recommendations": len(recommendations),
+                "estimated_monthly_savings": round(float(summary.get("EstimatedTotalMonthlySavingsAmount", 0) or 0), 2),
+                "recommendations": [
+                    {
+                        "resource_id": rec.get("CurrentInstance", {}).get("ResourceId"),
+                        "action": rec.get("RightsizingType")
+                    }
+                    for rec in recommendations
+                ]
+            }
+        
+        if not sections:
+            return {"status": "error", "error": "All Cost Explorer requests failed", "errors": errors}
+        
+        return {
+            "status": "success" if not errors else "partial",
+            "time_period": {"start": start_date, "end": end_date, "days": time_period_days},
+            **sections,
+            "errors": errors,
+            "currency": "USD",
+            "analysis_timestamp": datetime.now().isoformat(),
+            "source": "AWS Cost Explorer API"
+        }
+        
+    except Exception as e:
+        return {"status": "error", "error": f"Failed to get cost dashboard bundle: {str(e)}"}
+
+
+async def _fetch_cost_dashboard(start_date: str, end_date: str, forecast_end: str) -> List[Any]:
+    """Run the dashboard's Cost Explorer requests concurrently (boto3 clients are thread-safe)"""
+    ce_client = aws_client('ce')
+    return await asyncio.gather(
+        asyncio.to_thread(
+            ce_client.get_cost_and_usage,
+            TimePeriod={"Start": start_date, "End": end_date},
+            Granularity="MONTHLY",
+            Metrics=["UnblendedCost"],
+            GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}]
+        ),
+        asyncio.to_thread(
+            ce_client.get_cost_forecast,
+            TimePeriod={"Start": end_date, "End": forecast_end},
+            Metric="UNBLENDED_COST",
+            Granularity="MONTHLY"
+        ),
+        asyncio.to_thread(
+            ce_client.get_rightsizing_recommendation,
+            Service="AmazonEC2"
+        ),
+        return_exceptions=True
+    )
+
+
 # Helper functions for mock data
 def _get_mock_cost_data(time_period_days: int, granularity: str, group_by: List[str]) -> Dict[str, Any]:
     """Mock cost data for testing"""
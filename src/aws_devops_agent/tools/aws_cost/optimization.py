@@ -4,19 +4,12 @@ Access to actual AWS Cost Explorer data using the official MCP Python SDK
 """
 
 import json
-import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from strands import tool
+from ...clients import aws_client
 
-# Import the official MCP client
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-import sys
-from pathlib import Path
-# MCP clients are now in the same package structure
-
+# Import the official MCP client (package-relative, no sys.path changes needed)
 try:
     from ...mcp_clients.mcp_client import mcp_client
 except ImportError:
@@ -131,7 +124,7 @@ def analyze_cost_trends_real(
         Dict containing cost trend analysis with real data
     """
     try:
-        ce_client = boto3.client('ce')
+        ce_client = aws_client('ce')
         
         # Get cost data for trend analysis
         end_date = datetime.now().date()
@@ -193,8 +186,8 @@ def get_multi_account_cost_breakdown(
     """
     try:
         # Initialize clients
-        ce_client = boto3.client('ce')
-        orgs_client = boto3.client('organizations')
+        ce_client = aws_client('ce')
+        orgs_client = aws_client('organizations')
         
         # Get organization accounts if not provided
         if organization_accounts is None:
@@ -254,7 +247,7 @@ def get_rightsizing_recommendations() -> Dict[str, Any]:
         Dict containing actual AWS rightsizing recommendations
     """
     try:
-        ce_client = boto3.client('ce')
+        ce_client = aws_client('ce')
         
         # Get rightsizing recommendations
         response = ce_client.get_rightsizing_recommendation(
@@ -304,7 +297,7 @@ def get_reserved_instance_recommendations() -> Dict[str, Any]:
         Dict containing real RI recommendations from AWS
     """
     try:
-        ce_client = boto3.client('ce')
+        ce_client = aws_client('ce')
         
         # Get RI recommendations
         response = ce_client.get_reservation_purchase_recommendation(
@@ -764,28 +757,27 @@ def get_underutilized_resources(
         
         if mcp_client:
             # Use real MCP client for CloudWatch metrics
-            cost_client = mcp_client.get_cost_explorer_client()
+            cost_client = mcp_client.get_session("cost_explorer")
             if cost_client:
-                with cost_client:
-                    tools = cost_client.list_tools_sync()
+                tools = mcp_client.list_tools("cost_explorer")
                     
-                    # Find resource utilization tool
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'utilization' in tool.name.lower():
-                            result = cost_client.call_tool_sync(
-                                tool_use_id="utilization-query",
-                                name=tool.name,
-                                arguments={
-                                    "time_period": {
-                                        "start": start_date.strftime("%Y-%m-%d"),
-                                        "end": end_date.strftime("%Y-%m-%d")
-                                    },
-                                    "threshold": utilization_threshold,
-                                    "metrics": ["CPUUtilization", "MemoryUtilization", "NetworkIn", "NetworkOut"],
-                                    "account_id": account_id
-                                }
-                            )
-                            break
+                # Find resource utilization tool
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'utilization' in tool.name.lower():
+                        result = cost_client.call_tool_sync(
+                            tool_use_id="utilization-query",
+                            name=tool.name,
+                            arguments={
+                                "time_period": {
+                                    "start": start_date.strftime("%Y-%m-%d"),
+                                    "end": end_date.strftime("%Y-%m-%d")
+                                },
+                                "threshold": utilization_threshold,
+                                "metrics": ["CPUUtilization", "MemoryUtilization", "NetworkIn", "NetworkOut"],
+                                "account_id": account_id
+                            }
+                        )
+                        break
             
             if result and result.get("status") == "success":
                 resources = result.get("underutilized_resources", [])
@@ -5,19 +5,12 @@ Access to actual running AWS resources using the official MCP Python SDK
 
 import json
 import os
-import boto3
+from ...clients import aws_client, aws_session
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from strands import tool
 
-# Import the official MCP client
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-import sys
-from pathlib import Path
-# MCP clients are now in the same package structure
-
+# Import the official MCP client (package-relative, no sys.path changes needed)
 try:
     from ...mcp_clients.mcp_client import mcp_client
 except ImportError:
@@ -115,7 +108,7 @@ def analyze_unused_resources(regions: List[str] = None) -> Dict[str, Any]:
     """
     try:
         if regions is None:
-            regions = [boto3.Session().region_name or 'us-east-1']
+            regions = [aws_session().region_name or 'us-east-1']
         
         unused_resources = {
             "scan_timestamp": datetime.now().isoformat(),
@@ -186,7 +179,7 @@ def get_resource_utilization_metrics(
         Dict containing real utilization data from CloudWatch
     """
     try:
-        cloudwatch = boto3.client('cloudwatch')
+        cloudwatch = aws_client('cloudwatch')
         
         if resource_type.upper() == 'EC2':
             return _get_ec2_utilization_metrics(cloudwatch, resource_ids, days_back)
@@ -222,7 +215,7 @@ def discover_cross_account_resources(
     """
     try:
         # Get organization accounts
-        orgs_client = boto3.client('organizations')
+        orgs_client = aws_client('organizations')
         accounts_response = orgs_client.list_accounts()
         active_accounts = [acc for acc in accounts_response['Accounts'] if acc['Status'] == 'ACTIVE']
         
@@ -286,7 +279,7 @@ def _scan_region_resources(region: str, resource_types: List[str]) -> Dict[str,
     try:
         # EC2 instances
         if 'EC2' in resource_types:
-            ec2 = boto3.client('ec2', region_name=region)
+            ec2 = aws_client('ec2', region_name=region)
             instances_response = ec2.describe_instances()
             
             instances = []
@@ -304,7 +297,7 @@ def _scan_region_resources(region: str, resource_types: List[str]) -> Dict[str,
         
         # RDS instances
         if 'RDS' in resource_types:
-            rds = boto3.client('rds', region_name=region)
+            rds = aws_client('rds', region_name=region)
             db_instances = rds.describe_db_instances()
             
             databases = []
@@ -322,7 +315,7 @@ def _scan_region_resources(region: str, resource_types: List[str]) -> Dict[str,
         
         # Lambda functions
         if 'Lambda' in resource_types:
-            lambda_client = boto3.client('lambda', region_name=region)
+            lambda_client = aws_client('lambda', region_name=region)
             functions_response = lambda_client.list_functions()
             
             functions = []
@@ -345,7 +338,7 @@ def _scan_region_resources(region: str, resource_types: List[str]) -> Dict[str,
 def _find_unused_ebs_volumes(region: str) -> List[Dict]:
     """Find unattached EBS volumes"""
     try:
-        ec2 = boto3.client('ec2', region_name=region)
+        ec2 = aws_client('ec2', region_name=region)
         volumes_response = ec2.describe_volumes(
             Filters=[{'Name': 'status', 'Values': ['available']}]
         )
@@ -378,7 +371,7 @@ def _find_unused_ebs_volumes(region: str) -> List[Dict]:
 def _find_unused_elastic_ips(region: str) -> List[Dict]:
     """Find unassociated Elastic IPs"""
     try:
-        ec2 = boto3.client('ec2', region_name=region)
+        ec2 = aws_client('ec2', region_name=region)
         addresses_response = ec2.describe_addresses()
         
         unused_eips = []
@@ -400,7 +393,7 @@ def _find_unused_elastic_ips(region: str) -> List[Dict]:
 def _find_stopped_instances(region: str) -> List[Dict]:
     """Find stopped EC2 instances"""
     try:
-        ec2 = boto3.client('ec2', region_name=region)
+        ec2 = aws_client('ec2', region_name=region)
         instances_response = ec2.describe_instances(
             Filters=[{'Name': 'instance-state-name', 'Values': ['stopped']}]
         )
@@ -447,7 +440,7 @@ def _get_ec2_utilization_metrics(cloudwatch, resource_ids: List[str], days_back:
         
         # If no specific instances, get all running instances
         if not resource_ids:
-            ec2 = boto3.client('ec2')
+            ec2 = aws_client('ec2')
             instances_response = ec2.describe_instances(
                 Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
             )
@@ -978,7 +971,7 @@ def _identify_cost_optimizations(cost_analysis: Dict[str, Any]) -> List[Dict[str
 def _find_old_rds_snapshots(region: str, age_threshold_days: int) -> List[Dict]:
     """Find old RDS snapshots"""
     try:
-        rds = boto3.client('rds', region_name=region)
+        rds = aws_client('rds', region_name=region)
         snapshots_response = rds.describe_db_snapshots(SnapshotType='manual')
         
         old_snapshots = []
@@ -1009,7 +1002,7 @@ def _find_old_rds_snapshots(region: str, age_threshold_days: int) -> List[Dict]:
 def _find_old_stopped_instances(region: str, age_threshold_days: int) -> List[Dict]:
     """Find EC2 instances that have been stopped for a long time"""
     try:
-        ec2 = boto3.client('ec2', region_name=region)
+        ec2 = aws_client('ec2', region_name=region)
         instances_response = ec2.describe_instances(
             Filters=[{'Name': 'instance-state-name', 'Values': ['stopped']}]
         )
@@ -1117,21 +1110,28 @@ def _analyze_ebs_utilization(resource_ids: List[str], days: int) -> Dict[str, An
     }
 
 
-def _generate_rightsizing_recommendations(utilization_data: Dict[str, Any], resource_type: str) -> List[Dict[str, str]]:
-    """Generate rightsizing recommendations"""
-    recommendations = []
-    
+# Fields shared by every rightsizing recommendation (built once, not per resource)
+_RIGHTSIZING_DEFAULTS = {
+    "current_type": "unknown",
+    "recommended_action": "downsize",
+    "potential_savings": "$25/month"
+}
+
+
+def _iter_rightsizing_recommendations(utilization_data: Dict[str, Any], resource_type: str) -> Iterator[Dict[str, str]]:
+    """Yield rightsizing recommendations one resource at a time"""
     underutilized = utilization_data.get('utilization_distribution', {}).get('underutilized', [])
     
     for resource in underutilized:
-        recommendations.append({
+        yield {
             "resource_id": resource.get('instance_id') or resource.get('db_instance') or resource.get('volume_id'),
-            "current_type": "unknown",
-            "recommended_action": "downsize",
-            "potential_savings": "$25/month"
-        })
-    
-    return recommendations
+            **_RIGHTSIZING_DEFAULTS
+        }
+
+
+def _generate_rightsizing_recommendations(utilization_data: Dict[str, Any], resource_type: str) -> List[Dict[str, str]]:
+    """Generate rightsizing recommendations"""
+    return list(_iter_rightsizing_recommendations(utilization_data, resource_type))
 
 
 def _calculate_potential_savings(recommendations: List[Dict[str, str]]) -> float:
@@ -38,23 +38,22 @@ def get_real_aws_pricing(service: str, instance_type: str = None, region: str =
     try:
         if mcp_client:
             # Use real MCP client for live AWS pricing
-            pricing_client = mcp_client.get_pricing_client()
+            pricing_client = mcp_client.get_session("pricing")
             if pricing_client:
-                with pricing_client:
-                    # Use Strands MCP pattern to get pricing data
-                    tools = pricing_client.list_tools_sync()
-                    # Find pricing tool and call it
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'pricing' in tool.name.lower():
-                            result = pricing_client.call_tool_sync(
-                                tool_use_id="pricing-query",
-                                name=tool.name,
-                                arguments={
-                                    "service": service,
-                                    "instance_type": instance_type,
-                                    "region": region
-                                }
-                            )
+                # Use Strands MCP pattern to get pricing data
+                tools = mcp_client.list_tools("pricing")
+                # Find pricing tool and call it
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'pricing' in tool.name.lower():
+                        result = pricing_client.call_tool_sync(
+                            tool_use_id="pricing-query",
+                            name=tool.name,
+                            arguments={
+                                "service": service,
+                                "instance_type": instance_type,
+                                "region": region
+                            }
+                        )
             
             if result.get("status") == "success":
                 return {
@@ -160,20 +159,19 @@ def get_service_pricing_overview(service: str, region: str = "us-east-1") -> Dic
     try:
         if mcp_client:
             # Use real MCP client for service pricing overview
-            pricing_client = mcp_client.get_pricing_client()
+            pricing_client = mcp_client.get_session("pricing")
             if pricing_client:
-                with pricing_client:
-                    tools = pricing_client.list_tools_sync()
-                    for tool in tools:
-                        if hasattr(tool, 'name') and 'service_pricing' in tool.name.lower():
-                            result = pricing_client.call_tool_sync(
-                                tool_use_id="service-pricing-overview",
-                                name=tool.name,
-                                arguments={
-                                    "service": service,
-                                    "region": region
-                                }
-                            )
+                tools = mcp_client.list_tools("pricing")
+                for tool in tools:
+                    if hasattr(tool, 'name') and 'service_pricing' in tool.name.lower():
+                        result = pricing_client.call_tool_sync(
+                            tool_use_id="service-pricing-overview",
+                            name=tool.name,
+                            arguments={
+                                "service": service,
+                                "region": region
+                            }
+                        )
             
             if result.get("status") == "success":
                 return {
@@ -3,7 +3,7 @@ AWS Config Compliance Analysis Tools
 Real compliance analysis using AWS Config APIs
 """
 
-import boto3
+from ...clients import aws_client
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
@@ -49,7 +49,7 @@ def analyze_config_compliance(
         Dict containing compliance analysis
     """
     try:
-        config = boto3.client('config')
+        config = aws_client('config')
         
         # Get compliance details
         if config_rule_names:
@@ -114,7 +114,7 @@ def get_compliance_details(
         Dict containing detailed compliance information
     """
     try:
-        config = boto3.client('config')
+        config = aws_client('config')
         
         # Get compliance details for the rule
         response = config.get_compliance_details_by_config_rule(
@@ -170,7 +170,7 @@ def check_resource_compliance(
         Dict containing resource compliance information
     """
     try:
-        config = boto3.client('config')
+        config = aws_client('config')
         
         # Get compliance details for all rules
         response = config.get_compliance_details_by_config_rule(
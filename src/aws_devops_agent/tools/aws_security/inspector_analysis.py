@@ -3,7 +3,7 @@ Amazon Inspector Analysis Tools
 Real vulnerability analysis using Amazon Inspector APIs
 """
 
-import boto3
+from ...clients import aws_client
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
@@ -49,7 +49,7 @@ def analyze_inspector_findings(
         Dict containing vulnerability analysis
     """
     try:
-        inspector = boto3.client('inspector2')
+        inspector = aws_client('inspector2')
         
         # Build filters
         filters = {}
@@ -125,7 +125,7 @@ def get_vulnerability_assessment(
         Dict containing vulnerability assessment
     """
     try:
-        inspector = boto3.client('inspector2')
+        inspector = aws_client('inspector2')
         
         # Build filters
         filters = {}
@@ -191,7 +191,7 @@ def check_security_vulnerabilities(
         Dict containing vulnerability check results
     """
     try:
-        inspector = boto3.client('inspector2')
+        inspector = aws_client('inspector2')
         
         # Build filters
         filters = {}
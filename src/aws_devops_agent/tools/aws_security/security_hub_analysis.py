@@ -3,8 +3,9 @@ AWS Security Hub Analysis Tools
 Real security analysis using AWS Security Hub APIs
 """
 
-import boto3
+from ...clients import aws_client
 import json
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from strands import tool
@@ -63,7 +64,7 @@ def analyze_security_hub_findings(
     """
     try:
         # Initialize Security Hub client
-        security_hub = boto3.client('securityhub')
+        security_hub = aws_client('securityhub')
         
         # Calculate time range
         end_time = datetime.now()
@@ -132,7 +133,7 @@ def get_security_insights(
         Dict containing security insights
     """
     try:
-        security_hub = boto3.client('securityhub')
+        security_hub = aws_client('securityhub')
         
         if insight_arn:
             # Get specific insight
@@ -186,7 +187,7 @@ def analyze_security_posture(
         Dict containing security posture analysis
     """
     try:
-        security_hub = boto3.client('securityhub')
+        security_hub = aws_client('securityhub')
         
         # Get all active findings
         response = security_hub.get_findings(
@@ -321,10 +322,11 @@ def _analyze_security_posture(findings: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     # Calculate security score
     total_findings = len(findings)
-    critical_count = sum(1 for f in findings if f.get('Severity', {}).get('Label') == 'CRITICAL')
-    high_count = sum(1 for f in findings if f.get('Severity', {}).get('Label') == 'HIGH')
-    medium_count = sum(1 for f in findings if f.get('Severity', {}).get('Label') == 'MEDIUM')
-    low_count = sum(1 for f in findings if f.get('Severity', {}).get('Label') == 'LOW')
+    severity_counts = Counter(f.get('Severity', {}).get('Label') for f in findings)
+    critical_count = severity_counts['CRITICAL']
+    high_count = severity_counts['HIGH']
+    medium_count = severity_counts['MEDIUM']
+    low_count = severity_counts['LOW']
     
     # Calculate score (100 - weighted penalties)
     score = 100 - (critical_count * 20) - (high_count * 10) - (medium_count * 5) - (low_count * 1)
@@ -3,15 +3,15 @@ AWS Trusted Advisor Analysis Tools
 Real best practices analysis using AWS Trusted Advisor APIs
 """
 
-import boto3
+from ...clients import aws_client
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 from strands import tool
 
 # Rate limiting decorator
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 
 def rate_limit(calls_per_second=1):
     """Rate limiting decorator for AWS API calls"""
@@ -47,7 +47,7 @@ def get_trusted_advisor_checks(
         Dict containing Trusted Advisor checks
     """
     try:
-        support = boto3.client('support')
+        support = aws_client('support')
         
         # Get all checks
         response = support.describe_trusted_advisor_checks(
@@ -108,7 +108,7 @@ def analyze_trusted_advisor_recommendations(
         Dict containing Trusted Advisor recommendations analysis
     """
     try:
-        support = boto3.client('support')
+        support = aws_client('support')
         
         if check_id:
             # Get specific check result
@@ -181,7 +181,6 @@ def analyze_trusted_advisor_recommendations(
 
 
 @tool
-@rate_limit(calls_per_second=2)
 def get_security_recommendations() -> Dict[str, Any]:
     """
     Get security-specific recommendations from Trusted Advisor
@@ -190,29 +189,9 @@ def get_security_recommendations() -> Dict[str, Any]:
         Dict containing security recommendations
     """
     try:
-        support = boto3.client('support')
-        
-        # Get security checks
-        response = support.describe_trusted_advisor_checks(
-            language='en'
-        )
-        
-        all_checks = response.get('checks', [])
-        security_checks = [check for check in all_checks if check.get('category') == 'security']
-        
-        # Get check summaries
-        check_ids = [check['id'] for check in security_checks]
-        
-        if check_ids:
-            summaries_response = support.describe_trusted_advisor_check_summaries(
-                checkIds=check_ids
-            )
-            summaries = summaries_response.get('summaries', [])
-        else:
-            summaries = []
-        
-        # Analyze security recommendations
-        analysis = _analyze_security_recommendations(security_checks, summaries)
+        # Trusted Advisor refreshes its check summaries at most a few times a day,
+        # so repeat calls on the same day reuse the first result
+        security_checks, summaries, analysis, last_updated = _fetch_security_recommendations(date.today().isoformat())
         
         return {
             "status": "success",
@@ -221,7 +200,7 @@ def get_security_recommendations() -> Dict[str, Any]:
             "analysis": analysis,
             "security_checks": security_checks,
             "summaries": summaries,
-            "last_updated": datetime.now().isoformat()
+            "last_updated": last_updated
         }
         
     except Exception as e:
@@ -232,6 +211,37 @@ def get_security_recommendations() -> Dict[str, Any]:
         }
 
 
+@lru_cache(maxsize=8)
+@rate_limit(calls_per_second=2)
+def _fetch_security_recommendations(date_key: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any], str]:
+    """Security checks, their summaries and analysis for a day (raises on failure, so errors are not cached)"""
+    support = aws_client('support')
+    
+    # Get security checks
+    response = support.describe_trusted_advisor_checks(
+        language='en'
+    )
+    
+    all_checks = response.get('checks', [])
+    security_checks = [check for check in all_checks if check.get('category') == 'security']
+    
+    # Get check summaries
+    check_ids = [check['id'] for check in security_checks]
+    
+    if check_ids:
+        summaries_response = support.describe_trusted_advisor_check_summaries(
+            checkIds=check_ids
+        )
+        summaries = summaries_response.get('summaries', [])
+    else:
+        summaries = []
+    
+    # Analyze security recommendations
+    analysis = _analyze_security_recommendations(security_checks, summaries)
+    
+    return security_checks, summaries, analysis, datetime.now().isoformat()
+
+
 def _analyze_trusted_advisor_checks(checks: List[Dict[str, Any]], sample_result: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze Trusted Advisor checks"""
     if not checks:
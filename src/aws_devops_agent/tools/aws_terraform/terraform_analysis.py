@@ -397,6 +397,7 @@ def generate_terraform_optimization_report(analysis_results: Dict[str, Any]) ->
                 "report_timestamp": datetime.now().isoformat(),
                 "overall_score": overall_score,
                 "sections": report_sections,
+                "section_lengths": {name: len(text) for name, text in report_sections.items()},
                 "project_path": data.get("project_path"),
                 "environment": data.get("environment")
             },
@@ -428,10 +429,12 @@ def generate_terraform_optimization_report(analysis_results: Dict[str, Any]) ->
 def _initialize_terraform(project_path: str) -> Dict[str, Any]:
     """Initialize Terraform project if needed."""
     try:
+        # Only stderr is reported, so init's provider download log is discarded rather than buffered
         result = subprocess.run(
-            ["terraform", "init"],
+            ["terraform", "init", "-input=false"],
             cwd=project_path,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -0,0 +1,64 @@
+"""
+Batch Tools
+Run several read-only tools concurrently in a single agent tool call
+"""
+
+import asyncio
+from typing import Dict, List, Any
+from strands import tool
+
+# Only tools that read state may be batched
+READ_ONLY_PREFIXES = ("get_", "analyze_", "list_", "scan_")
+
+
+@tool
+def run_tools_batch(ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run several read-only tools concurrently and return their results together
+
+    Prefer this over separate calls when a request needs multiple independent reads
+    (e.g. costs by service + Security Hub findings + infrastructure repositories).
+
+    Args:
+        ops: List of {"tool": name, "arguments": {...}} using get_*, analyze_*, list_* or scan_* tools
+
+    Returns:
+        Dict with one {index, tool, ok, result | error} entry per op, in order
+    """
+    from .. import tools
+
+    def resolve(op: Dict[str, Any]):
+        name = op.get("tool", "")
+        if not name.startswith(READ_ONLY_PREFIXES) or name not in tools.__all__:
+            raise ValueError(f"'{name}' is not an available read-only tool")
+        return getattr(tools, name)
+
+    def run(op: Dict[str, Any]) -> Any:
+        return resolve(op)(**op.get("arguments", {}))
+
+    async def run_all() -> List[Any]:
+        return await asyncio.gather(
+            *(asyncio.to_thread(run, op) for op in ops),
+            return_exceptions=True
+        )
+
+    try:
+        outcomes = asyncio.run(run_all())
+    except Exception as e:
+        return {"status": "error", "error": f"Batch execution failed: {str(e)}"}
+
+    results = []
+    for index, (op, outcome) in enumerate(zip(ops, outcomes)):
+        entry = {"index": index, "tool": op.get("tool")}
+        if isinstance(outcome, Exception):
+            entry.update(ok=False, error=str(outcome))
+        else:
+            entry.update(ok=not (isinstance(outcome, dict) and outcome.get("status") == "error"), result=outcome)
+        results.append(entry)
+
+    failed = sum(not entry["ok"] for entry in results)
+    return {
+        "status": "success" if not failed else "error" if failed == len(results) else "partial",
+        "results": results,
+        "failed": failed
+    }
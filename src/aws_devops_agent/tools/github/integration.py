@@ -48,55 +48,46 @@ def check_repository_connectivity(repository: str) -> Dict[str, Any]:
                 "recommendation": "Ensure GitHub MCP server is configured and running"
             }
         
-        with github_client:
-            # Test connectivity by getting basic repo info
-            result = github_client.call_tool_sync(
-                tool_use_id="test-repo-access",
-                name="get_file_contents", 
-                arguments={
-                    "owner": owner,
-                    "repo": repo,
-                    "path": "/"
-                }
-            )
-            
-            # Also get user info to verify authentication
-            user_info = github_client.call_tool_sync(
-                tool_use_id="test-auth",
-                name="get_me", 
-                arguments={}
-            )
-            
-            # Parse MCP response format
-            if result and result.get("status") == "success":
-                # Extract user info
-                user_login = "unknown"
-                if user_info and user_info.get("status") == "success" and user_info.get("content"):
-                    try:
-                        import json
-                        user_data = json.loads(user_info["content"][0]["text"])
-                        user_login = user_data.get("login", "unknown")
-                    except:
-                        pass
-                
-                return {
-                    "status": "success",
-                    "repository": repository,
-                    "accessible": True,
-                    "authenticated_user": user_login,
-                    "repository_exists": True,
-                    "test_timestamp": datetime.now().isoformat(),
-                    "mcp_server": "GitHub MCP Server"
-                }
-            else:
-                return {
-                    "status": "error",
-                    "repository": repository,
-                    "accessible": False,
-                    "error": "Cannot access repository",
-                    "recommendation": "Check repository name and permissions"
-                }
+        # Test repo access and authentication over a single MCP session
+        result, user_info = mcp_client.call_github_tools([
+            {
+                "tool_use_id": "test-repo-access",
+                "name": "get_file_contents",
+                "arguments": {"owner": owner, "repo": repo, "path": "/"}
+            },
+            {"tool_use_id": "test-auth", "name": "get_me"}
+        ])
+        
+        # Parse MCP response format
+        if result and result.get("status") == "success":
+            # Extract user info
+            user_login = "unknown"
+            if user_info and user_info.get("status") == "success" and user_info.get("content"):
+                try:
+                    import json
+                    user_data = json.loads(user_info["content"][0]["text"])
+                    user_login = user_data.get("login", "unknown")
+                except:
+                    pass
             
+            return {
+                "status": "success",
+                "repository": repository,
+                "accessible": True,
+                "authenticated_user": user_login,
+                "repository_exists": True,
+                "test_timestamp": datetime.now().isoformat(),
+                "mcp_server": "GitHub MCP Server"
+            }
+        else:
+            return {
+                "status": "error",
+                "repository": repository,
+                "accessible": False,
+                "error": "Cannot access repository",
+                "recommendation": "Check repository name and permissions"
+            }
+        
     except Exception as e:
         return {
             "status": "error", 
@@ -143,35 +134,34 @@ def create_branch_simple(
                 "error": "GitHub MCP client not available"
             }
         
-        with github_client:
-            result = github_client.call_tool_sync(
-                tool_use_id="create-branch",
-                name="create_branch", 
-                arguments={
-                    "owner": owner,
-                    "repo": repo,
-                    "branch": branch_name,
-                    "from_branch": from_branch
-                }
-            )
-            
-            if result and result.get("status") == "success":
-                return {
-                    "status": "success",
-                    "repository": repository,
-                    "branch_name": branch_name,
-                    "from_branch": from_branch,
-                    "branch_url": f"https://github.com/{repository}/tree/{branch_name}",
-                    "created_timestamp": datetime.now().isoformat()
-                }
-            else:
-                return {
-                    "status": "error",
-                    "repository": repository,
-                    "branch_name": branch_name,
-                    "error": "Failed to create branch"
-                }
-            
+        result, = mcp_client.call_github_tools([{
+            "tool_use_id": "create-branch",
+            "name": "create_branch",
+            "arguments": {
+                "owner": owner,
+                "repo": repo,
+                "branch": branch_name,
+                "from_branch": from_branch
+            }
+        }])
+        
+        if result and result.get("status") == "success":
+            return {
+                "status": "success",
+                "repository": repository,
+                "branch_name": branch_name,
+                "from_branch": from_branch,
+                "branch_url": f"https://github.com/{repository}/tree/{branch_name}",
+                "created_timestamp": datetime.now().isoformat()
+            }
+        else:
+            return {
+                "status": "error",
+                "repository": repository,
+                "branch_name": branch_name,
+                "error": "Failed to create branch"
+            }
+        
     except Exception as e:
         return {
             "status": "error",
@@ -213,57 +203,49 @@ def get_repository_info(repository: str) -> Dict[str, Any]:
                 "error": "GitHub MCP client not available"
             }
         
-        with github_client:
-            # Get repository root to check basic info
-            repo_result = github_client.call_tool_sync(
-                tool_use_id="get-repo-info",
-                name="get_file_contents", 
-                arguments={
-                    "owner": owner,
-                    "repo": repo,
-                    "path": "/"
-                }
-            )
-            
-            # Get branches list
-            branches_result = github_client.call_tool_sync(
-                tool_use_id="list-branches",
-                name="list_branches", 
-                arguments={
-                    "owner": owner,
-                    "repo": repo
-                }
-            )
-            
-            if repo_result and repo_result.get("status") == "success":
-                branches = []
-                if branches_result and branches_result.get("status") == "success" and branches_result.get("content"):
-                    try:
-                        import json
-                        branches_data = json.loads(branches_result["content"][0]["text"])
-                        branches = branches_data if isinstance(branches_data, list) else []
-                    except:
-                        branches = []
-                
-                return {
-                    "status": "success",
-                    "repository": repository,
-                    "owner": owner,
-                    "repo": repo,
-                    "accessible": True,
-                    "branches": [branch.get("name", "") for branch in branches] if branches else [],
-                    "branch_count": len(branches),
-                    "scan_timestamp": datetime.now().isoformat(),
-                    "repository_url": f"https://github.com/{repository}"
-                }
-            else:
-                return {
-                    "status": "error",
-                    "repository": repository,
-                    "error": "Cannot access repository",
-                    "accessible": False
-                }
+        # Fetch repository root and branches over a single MCP session
+        repo_result, branches_result = mcp_client.call_github_tools([
+            {
+                "tool_use_id": "get-repo-info",
+                "name": "get_file_contents",
+                "arguments": {"owner": owner, "repo": repo, "path": "/"}
+            },
+            {
+                "tool_use_id": "list-branches",
+                "name": "list_branches",
+                "arguments": {"owner": owner, "repo": repo}
+            }
+        ])
+        
+        if repo_result and repo_result.get("status") == "success":
+            branches = []
+            if branches_result and branches_result.get("status") == "success" and branches_result.get("content"):
+                try:
+                    import json
+                    branches_data = json.loads(branches_result["content"][0]["text"])
+                    branches = branches_data if isinstance(branches_data, list) else []
+                except:
+                    branches = []
             
+            return {
+                "status": "success",
+                "repository": repository,
+                "owner": owner,
+                "repo": repo,
+                "accessible": True,
+                "branches": [branch.get("name", "") for branch in branches] if branches else [],
+                "branch_count": len(branches),
+                "scan_timestamp": datetime.now().isoformat(),
+                "repository_url": f"https://github.com/{repository}"
+            }
+        else:
+            return {
+                "status": "error",
+                "repository": repository,
+                "error": "Cannot access repository",
+                "accessible": False
+            }
+        
     except Exception as e:
         return {
             "status": "error",
@@ -306,52 +288,51 @@ def list_repository_branches(repository: str, page: int = 1, per_page: int = 30)
                 "error": "GitHub MCP client not available"
             }
         
-        with github_client:
-            # List branches using MCP
-            result = github_client.call_tool_sync(
-                tool_use_id="list-repo-branches",
-                name="list_branches", 
-                arguments={
-                    "owner": owner,
-                    "repo": repo,
-                    "page": page,
-                    "perPage": min(per_page, 100)
-                }
-            )
-            
-            if result and result.get("status") == "success" and result.get("content"):
-                try:
-                    import json
-                    branches = json.loads(result["content"][0]["text"])
-                    if not isinstance(branches, list):
-                        branches = []
-                except:
+        # List branches using MCP
+        result, = mcp_client.call_github_tools([{
+            "tool_use_id": "list-repo-branches",
+            "name": "list_branches",
+            "arguments": {
+                "owner": owner,
+                "repo": repo,
+                "page": page,
+                "perPage": min(per_page, 100)
+            }
+        }])
+        
+        if result and result.get("status") == "success" and result.get("content"):
+            try:
+                import json
+                branches = json.loads(result["content"][0]["text"])
+                if not isinstance(branches, list):
                     branches = []
-                
-                return {
-                    "status": "success",
-                    "repository": repository,
-                    "page": page,
-                    "per_page": per_page,
-                    "total_branches": len(branches),
-                    "branches": [
-                        {
-                            "name": branch.get("name", "") if isinstance(branch, dict) else str(branch),
-                            "protected": branch.get("protected", False) if isinstance(branch, dict) else False,
-                            "commit_sha": branch.get("commit", {}).get("sha", "unknown") if isinstance(branch, dict) else "unknown"
-                        }
-                        for branch in branches
-                    ],
-                    "branch_names": [branch.get("name", "") if isinstance(branch, dict) else str(branch) for branch in branches],
-                    "scan_timestamp": datetime.now().isoformat()
-                }
-            else:
-                return {
-                    "status": "error",
-                    "repository": repository,
-                    "error": "Failed to list branches"
-                }
+            except:
+                branches = []
             
+            return {
+                "status": "success",
+                "repository": repository,
+                "page": page,
+                "per_page": per_page,
+                "total_branches": len(branches),
+                "branches": [
+                    {
+                        "name": branch.get("name", "") if isinstance(branch, dict) else str(branch),
+                        "protected": branch.get("protected", False) if isinstance(branch, dict) else False,
+                        "commit_sha": branch.get("commit", {}).get("sha", "unknown") if isinstance(branch, dict) else "unknown"
+                    }
+                    for branch in branches
+                ],
+                "branch_names": [branch.get("name", "") if isinstance(branch, dict) else str(branch) for branch in branches],
+                "scan_timestamp": datetime.now().isoformat()
+            }
+        else:
+            return {
+                "status": "error",
+                "repository": repository,
+                "error": "Failed to list branches"
+            }
+        
     except Exception as e:
         return {
             "status": "error",
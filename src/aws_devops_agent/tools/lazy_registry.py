@@ -0,0 +1,84 @@
+"""
+Two-tier tool registry for the AWS DevOps Agent
+The model starts with category summaries and loads full tool schemas on demand
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from strands import tool, ToolContext
+
+CATEGORY_SUMMARIES = {
+    "aws_cost": "AWS pricing, Cost Explorer spend, rightsizing, forecasts and multi-account costs",
+    "iac": "Terraform, CloudFormation and CDK analysis, validation, planning and drift",
+    "security": "Security Hub, Inspector, Config compliance and security policy validation",
+    "github": "Infrastructure repositories, optimization pull requests and PR monitoring",
+    "docs": "Generate, list and inspect cost, security and infrastructure documents",
+}
+
+
+class LazyToolRegistry:
+    """Keeps the tool catalog by name and exposes it to an agent in two tiers"""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            category: tuple(names) for category, names in categories.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self.categories.values())
+
+    def resolve(self, category: str, name: str) -> Optional[Any]:
+        """Return a catalog tool, importing its domain subpackage on first use"""
+        if name not in self.categories.get(category, ()):
+            return None
+        from .. import tools
+        return getattr(tools, name)
+
+    def entry_tools(self) -> List[Any]:
+        """The two discovery tools registered on the agent up front"""
+        categories = self.categories
+        resolve = self.resolve
+
+        @tool
+        def list_tool_categories() -> Dict[str, Any]:
+            """
+            List the available tool categories with a summary and the tool names in each
+
+            Call get_tool_schema for a tool before using it.
+
+            Returns:
+                Dict mapping category to its summary and tool names
+            """
+            return {
+                category: {"summary": CATEGORY_SUMMARIES.get(category, ""), "tools": sorted(names)}
+                for category, names in categories.items()
+            }
+
+        @tool(context=True)
+        def get_tool_schema(category: str, name: str, tool_context: ToolContext) -> Dict[str, Any]:
+            """
+            Load a tool's full schema and make it callable for the rest of the conversation
+
+            Args:
+                category: Category returned by list_tool_categories
+                name: Tool name within that category
+
+            Returns:
+                Dict containing the tool's JSON schema
+            """
+            agent_tool = resolve(category, name)
+            if agent_tool is None:
+                return {
+                    "status": "error",
+                    "error": f"Unknown tool '{name}' in category '{category}'",
+                    "available_tools": sorted(categories.get(category, ()))
+                }
+
+            registry = tool_context.agent.tool_registry
+            if name in registry.registry:
+                # The schema is already in the tool config sent with every request
+                return {"status": "success", "category": category, "message": f"'{name}' is already loaded; call it directly"}
+
+            registry.register_tool(agent_tool)
+            return {"status": "success", "category": category, "schema": agent_tool.tool_spec}
+
+        return [list_tool_categories, get_tool_schema]
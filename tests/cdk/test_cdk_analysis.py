@@ -309,6 +309,44 @@ export class TestStack extends Stack {
         assert result["status"] == "error"
         assert "Synthesis failed" in result["error"]
 
+    @patch('aws_devops_agent.tools.aws_cdk.cdk_analysis.aws_client')
+    def test_estimate_ec2_costs_single_pricing_query(self, mock_client):
+        """Test EC2 instance types are priced with one batched Pricing API query"""
+        from aws_devops_agent.tools.aws_cdk.cdk_analysis import _estimate_ec2_costs, _get_ec2_hourly_rates
+
+        def price_item(instance_type, usd):
+            return json.dumps({
+                "product": {"attributes": {"instanceType": instance_type}},
+                "terms": {"OnDemand": {"sku": {"priceDimensions": {"dim": {"pricePerUnit": {"USD": usd}}}}}}
+            })
+
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"PriceList": [price_item("t3.medium", "0.0416"), price_item("m5.large", "0.096")]}]
+        mock_client.return_value.get_paginator.return_value = paginator
+        _get_ec2_hourly_rates.cache_clear()
+
+        costs = _estimate_ec2_costs(["t3.medium", "m5.large", "t3.medium", "x9.unknown"])
+
+        assert costs == {"m5.large": 69.12, "t3.medium": 29.95, "x9.unknown": 50.0}
+        paginator.paginate.assert_called_once()
+        assert paginator.paginate.call_args.kwargs["Filters"][0]["Value"] == "m5.large,t3.medium,x9.unknown"
+
+    @patch('aws_devops_agent.tools.aws_pricing.pricing.get_real_aws_pricing')
+    def test_service_price_looked_up_once(self, mock_pricing):
+        """Test repeated service estimates reuse the cached price and only retry failed lookups"""
+        from aws_devops_agent.tools.aws_cdk.cdk_analysis import _estimate_aws_service_cost, _get_service_base_price
+
+        _get_service_base_price.cache_clear()
+        mock_pricing.return_value = {"status": "error", "error": "throttled"}
+        assert _estimate_aws_service_cost("RDS", "AWS::RDS::DBInstance", {}) == 50.0
+
+        mock_pricing.return_value = {"status": "success", "data": {"price": 0.1}}
+        for storage in (20, 100):
+            _estimate_aws_service_cost("RDS", "AWS::RDS::DBInstance", {"AllocatedStorage": storage})
+
+        assert _estimate_aws_service_cost("RDS", "AWS::RDS::DBInstance", {"AllocatedStorage": 20}) == 74.3
+        assert mock_pricing.call_count == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -7,22 +7,22 @@ Demonstrates the full cycle: Terraform Analysis → Security Findings → GitHub
 from mcp import stdio_client, StdioServerParameters
 from strands import Agent
 from strands.tools.mcp import MCPClient
+from aws_devops_agent.config._env_cache import load_env_cached
 import os
 
 def load_github_config():
     """Load GitHub configuration"""
-    config = {}
     try:
-        with open('config/.env.github', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    config[key] = value
-        return config
+        return load_env_cached('config/.env.github')
     except Exception as e:
         print(f"❌ Error loading GitHub config: {e}")
         return {}
 
+def _head(x, n=1500):
+    """Return the first n characters of x, with an ellipsis if truncated"""
+    s = x if isinstance(x, str) else str(x)
+    return s if len(s) <= n else s[:n] + "..."
+
 print("🚀 COMPLETE DEVOPS AGENT WORKFLOW TEST")
 print("=" * 60)
 
@@ -38,24 +38,22 @@ if not github_token:
     import pytest
     pytest.skip("GitHub configuration not available", allow_module_level=True)
 
-# Prepare environment
-aws_env = os.environ.copy()
-aws_env.update({
+# Prepare environment (only the variables uvx/docker and the MCP servers need)
+aws_env = {
     "AWS_PROFILE": os.getenv("AWS_PROFILE", "default"),
     "AWS_DEFAULT_REGION": os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
     "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
-    "GITHUB_PERSONAL_ACCESS_TOKEN": github_token
-})
+    "GITHUB_PERSONAL_ACCESS_TOKEN": github_token,
+    "PATH": os.environ.get("PATH", ""),
+    "HOME": os.environ.get("HOME", "")
+}
 
 print(f"🎯 Target Repository: {repo}")
 print(f"👤 GitHub User: {github_config.get('GITHUB_USERNAME', 'Unknown')}")
 
 try:
-    print("\n" + "="*60)
-    print("🏗️ STEP 1: TERRAFORM ANALYSIS")
-    print("="*60)
-    
-    # Create Terraform MCP client
+    # Create both MCP clients up front; each server subprocess is spawned once
+    # and reused by every step of the workflow
     terraform_client = MCPClient(lambda: stdio_client(
         StdioServerParameters(
             command="uvx",
@@ -63,8 +61,21 @@ try:
             env=aws_env
         )
     ))
+    github_client = MCPClient(lambda: stdio_client(
+        StdioServerParameters(
+            command="docker",
+            args=["run", "-i", "--rm", 
+                  "-e", f"GITHUB_PERSONAL_ACCESS_TOKEN={github_token}",
+                  "ghcr.io/github/github-mcp-server"],
+            env=aws_env
+        )
+    ))
 
-    with terraform_client:
+    with terraform_client, github_client:
+        print("\n" + "="*60)
+        print("🏗️ STEP 1: TERRAFORM ANALYSIS")
+        print("="*60)
+        
         print("✅ Terraform MCP client connected")
         terraform_tools = terraform_client.list_tools_sync()
         print(f"🛠️  Terraform tools available: {len(terraform_tools)}")
@@ -85,24 +96,12 @@ try:
         """)
         
         print("🔒 Terraform Analysis Result:")
-        print(str(terraform_analysis)[:500] + "...")
-
-    print("\n" + "="*60)  
-    print("🐙 STEP 2: GITHUB INTEGRATION")
-    print("="*60)
-    
-    # Create GitHub MCP client
-    github_client = MCPClient(lambda: stdio_client(
-        StdioServerParameters(
-            command="docker",
-            args=["run", "-i", "--rm", 
-                  "-e", f"GITHUB_PERSONAL_ACCESS_TOKEN={github_token}",
-                  "ghcr.io/github/github-mcp-server"],
-            env=aws_env
-        )
-    ))
+        print(_head(terraform_analysis, 500))
 
-    with github_client:
+        print("\n" + "="*60)  
+        print("🐙 STEP 2: GITHUB INTEGRATION")
+        print("="*60)
+        
         print("✅ GitHub MCP client connected")
         github_tools = github_client.list_tools_sync()
         print(f"🛠️  GitHub tools available: {len(github_tools)}")
@@ -121,21 +120,15 @@ try:
         """)
         
         print("📁 Repository Analysis:")
-        print(str(repo_analysis)[:300] + "...")
-
-    print("\n" + "="*60)
-    print("🎯 STEP 3: COMPLETE WORKFLOW SIMULATION")  
-    print("="*60)
-    
-    # Create combined agent with both toolsets
-    print("🤝 Creating unified DevOps agent with all tools...")
-    
-    # Combine both Terraform and GitHub in one agent
-    with terraform_client, github_client:
-        terraform_tools = terraform_client.list_tools_sync()
-        github_tools = github_client.list_tools_sync()
+        print(_head(repo_analysis, 300))
+
+        print("\n" + "="*60)
+        print("🎯 STEP 3: COMPLETE WORKFLOW SIMULATION")  
+        print("="*60)
         
-        # Combine all tools
+        # Combine both Terraform and GitHub in one agent, reusing the tool lists
+        # already fetched over the open sessions
+        print("🤝 Creating unified DevOps agent with all tools...")
         all_tools = terraform_tools + github_tools
         unified_agent = Agent(tools=all_tools)
         
@@ -171,7 +164,7 @@ try:
         print("="*60)
         
         print("📊 Complete Workflow Result:")
-        print(str(complete_workflow)[:800] + "...")
+        print(_head(complete_workflow, 800))
 
 except Exception as e:
     print(f"\n❌ Workflow test failed: {e}")
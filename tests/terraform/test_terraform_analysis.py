@@ -14,6 +14,7 @@ import os
 import sys
 import tempfile
 import shutil
+import subprocess
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -114,6 +115,7 @@ output "instance_id" {
         assert result["status"] == "success"
         assert result["data"]["validation_passed"] is True
         assert "configuration is valid" in result["data"]["message"].lower()
+        assert mock_run.call_args_list[0].kwargs["stdout"] == subprocess.DEVNULL
     
     @patch('subprocess.run')
     def test_validate_terraform_configuration_validation_error(self, mock_run):
@@ -262,6 +264,9 @@ output "instance_id" {
         assert "best_practices" in result["data"]["sections"]
         assert "recommendations" in result["data"]["sections"]
         assert "next_steps" in result["data"]["sections"]
+        assert result["data"]["section_lengths"] == {
+            name: len(text) for name, text in result["data"]["sections"].items()
+        }
 
 
 class TestTerraformHelperFunctions:
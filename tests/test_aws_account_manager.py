@@ -116,6 +116,154 @@ def test_model_id_mapping():
     print("✅ Model ID mapping works correctly")
 
 
+def test_caller_identity_reused_within_ttl():
+    """Test the STS caller identity is fetched once per region/profile/credentials within the TTL"""
+    print("🧪 Testing caller identity caching...")
+    
+    import time
+    from unittest.mock import Mock
+    from aws_devops_agent.config import aws_account_manager
+    
+    session = Mock()
+    session.get_credentials.return_value = Mock(access_key="AKIAFIRST")
+    session.client.return_value.get_caller_identity.return_value = {
+        "Account": "123456789012", "Arn": "arn:aws:iam::123456789012:user/devops"
+    }
+    aws_account_manager._identity_cache.clear()
+    try:
+        first = aws_account_manager._caller_identity(session, "us-east-1", "default")
+        second = aws_account_manager._caller_identity(session, "us-east-1", "default")
+        assert first is second
+        assert session.client.return_value.get_caller_identity.call_count == 1
+        
+        # Expired entries are fetched again
+        fetched_at = time.monotonic() - aws_account_manager._IDENTITY_TTL_SECONDS - 1
+        aws_account_manager._identity_cache[("us-east-1", "default", "AKIAFIRST")] = (fetched_at, first)
+        aws_account_manager._caller_identity(session, "us-east-1", "default")
+        assert session.client.return_value.get_caller_identity.call_count == 2
+        
+        # New credentials under the same profile are looked up again
+        session.get_credentials.return_value = Mock(access_key="AKIASECOND")
+        aws_account_manager._caller_identity(session, "us-east-1", "default")
+        assert session.client.return_value.get_caller_identity.call_count == 3
+    finally:
+        aws_account_manager._identity_cache.clear()
+    
+    print("✅ Caller identity caching works correctly")
+
+
+def test_session_reused_per_region_and_profile():
+    """Test boto3 sessions are built once per region/profile and shared by the manager"""
+    print("🧪 Testing session caching...")
+    
+    from unittest.mock import patch
+    from aws_devops_agent.config import aws_account_manager
+    
+    aws_account_manager._cached_session.cache_clear()
+    try:
+        with patch.object(aws_account_manager.boto3, "Session", side_effect=lambda **kwargs: object()) as session_cls:
+            manager = AWSAccountManager(region="us-east-1", profile="default")
+            manager.add_account("123456789012", "Test Account 1")
+            manager.add_account("987654321098", "Test Account 2")
+            
+            first = manager.get_session_for_account("123456789012")
+            second = manager.get_session_for_account("987654321098")
+            other_region = aws_account_manager._cached_session("eu-west-1", "default")
+        
+        assert first is second
+        assert other_region is not first
+        assert session_cls.call_count == 2
+    finally:
+        aws_account_manager._cached_session.cache_clear()
+    
+    print("✅ Session caching works correctly")
+
+
+def test_clients_reused_per_session():
+    """Test boto3 clients are created once per session, service and region"""
+    print("🧪 Testing client caching...")
+    
+    from unittest.mock import Mock
+    
+    manager = AWSAccountManager()
+    session = Mock()
+    session.client.side_effect = lambda service, **kwargs: Mock()
+    
+    sts = manager._client(session, "sts")
+    assert manager._client(session, "sts") is sts
+    assert manager._client(session, "ec2", "us-east-1") is not manager._client(session, "ec2", "eu-west-1")
+    assert manager._client(Mock(), "sts") is not sts
+    assert session.client.call_count == 3
+    
+    # Every client shares the pooled keep-alive config
+    from aws_devops_agent.clients import CLIENT_CONFIG
+    assert all(call.kwargs["config"] is CLIENT_CONFIG for call in session.client.call_args_list)
+    
+    print("✅ Client caching works correctly")
+
+
+def test_permission_probes_run_concurrently():
+    """Test service permission probes run in parallel and failed probes are left out"""
+    print("🧪 Testing concurrent permission probes...")
+    
+    import time
+    from unittest.mock import Mock
+    
+    def make_client(service, **kwargs):
+        client = Mock()
+        client.list_metrics.side_effect = lambda **kwargs: time.sleep(0.2)
+        client.describe_regions.side_effect = lambda **kwargs: time.sleep(0.2)
+        client.describe_hub.side_effect = Exception("AccessDenied")
+        return client
+    
+    session = Mock()
+    session.client.side_effect = make_client
+    
+    started = time.monotonic()
+    permissions = AWSAccountManager()._validate_permissions(session)
+    elapsed = time.monotonic() - started
+    
+    # Every probe but Security Hub succeeds; results keep the declared service order
+    assert permissions == ["Cost Explorer", "CloudWatch", "EC2", "S3", "Organizations",
+                           "Config", "Inspector", "Pricing"]
+    assert session.client.call_count == 9  # no IAM client
+    assert elapsed < 0.35
+    
+    print("✅ Permission probes run concurrently")
+
+
+def test_assumed_role_session_reused_until_near_expiry():
+    """Test role credentials are assumed once and refreshed only when close to expiry"""
+    print("🧪 Testing assumed-role session caching...")
+    
+    from datetime import datetime, timedelta, timezone
+    from unittest.mock import Mock, patch
+    from aws_devops_agent.config import aws_account_manager
+    
+    base_session = Mock()
+    assume_role = base_session.client.return_value.assume_role
+    assume_role.side_effect = lambda **kwargs: {"Credentials": {
+        "AccessKeyId": "AKIA", "SecretAccessKey": "secret", "SessionToken": "token",
+        "Expiration": datetime.now(timezone.utc) + timedelta(hours=1)
+    }}
+    
+    with patch.object(aws_account_manager, "_cached_session", return_value=base_session), \
+         patch.object(aws_account_manager.boto3, "Session", side_effect=lambda **kwargs: Mock()):
+        manager = AWSAccountManager()
+        manager.add_account("987654321098", "Test Account 2", "arn:aws:iam::987654321098:role/DevOpsRole")
+        
+        first = manager.get_session_for_account("987654321098")
+        assert manager.get_session_for_account("987654321098") is first
+        assert assume_role.call_count == 1
+        
+        # Credentials within the refresh margin are assumed again
+        manager.session_cache["987654321098"] = (datetime.now(timezone.utc) + timedelta(minutes=1), first)
+        assert manager.get_session_for_account("987654321098") is not first
+        assert assume_role.call_count == 2
+    
+    print("✅ Assumed-role session caching works correctly")
+
+
 def run_tests():
     """Run all tests"""
     print("🚀 Running AWS Account Manager Tests")
@@ -127,6 +275,11 @@ def run_tests():
         test_add_account()
         test_account_summary()
         test_model_id_mapping()
+        test_caller_identity_reused_within_ttl()
+        test_session_reused_per_region_and_profile()
+        test_clients_reused_per_session()
+        test_permission_probes_run_concurrently()
+        test_assumed_role_session_reused_until_near_expiry()
         
         print("\n✅ All tests passed!")
         return True
@@ -31,7 +31,7 @@ project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-from aws_devops_agent.config import get_config, get_env_config
+from aws_devops_agent.config import clear_config_cache, get_config, get_env_config
 from aws_devops_agent.tools.aws_pricing.pricing import (
     get_real_aws_pricing,
     calculate_reserved_instance_savings
@@ -39,6 +39,7 @@ from aws_devops_agent.tools.aws_pricing.pricing import (
 from aws_devops_agent.tools.aws_cost.optimization import (
     get_reserved_instance_recommendations
 )
+from aws_devops_agent.tools.aws_cost.explorer import get_cost_dashboard_bundle
 from aws_devops_agent.tools.aws_iac.terraform import (
     analyze_terraform_configuration,
     validate_cloudformation_template
@@ -88,6 +89,56 @@ class TestConfigurationManagement:
         assert hasattr(config, 'mcp')
         assert hasattr(config, 'aws_region')
 
+    def test_get_config_cached_until_environment_changes(self, monkeypatch):
+        """Test get_config reuses the parsed config until a config variable changes"""
+        clear_config_cache()
+        monkeypatch.setenv('STRANDS_MODEL', 'nova-lite')
+
+        with patch('aws_devops_agent.config.env_config.get_env_config', wraps=get_env_config) as loader:
+            first = get_config()
+            assert get_config() is first
+            monkeypatch.setenv('STRANDS_MODEL', 'nova-micro')
+            second = get_config()
+
+        assert loader.call_count == 2
+        assert first.model.model_id == "us.amazon.nova-lite-v1:0"
+        assert second.model.model_id == "us.amazon.nova-micro-v1:0"
+        assert second.cross_account_roles == {}
+
+    def test_model_configs_are_immutable(self):
+        """Test the shared model and MCP settings cannot be mutated through a cached config"""
+        from dataclasses import FrozenInstanceError
+
+        config = get_config()
+        with pytest.raises(FrozenInstanceError):
+            config.model.max_tokens = 1
+        with pytest.raises(FrozenInstanceError):
+            config.mcp.timeout = 1
+
+    @patch.dict('os.environ', {'CROSS_ACCOUNT_ROLES': ' 111:arn:aws:iam::111:role/Audit, 222:ReadOnly,bogus'})
+    def test_cross_account_roles_parsed(self):
+        """Test CROSS_ACCOUNT_ROLES pairs are parsed, keeping colons inside role ARNs"""
+        config = get_env_config(strict_validation=False)
+        assert config.cross_account_roles == {"111": "arn:aws:iam::111:role/Audit", "222": "ReadOnly"}
+
+    def test_env_file_parsed_once_until_modified(self, tmp_path):
+        """Test .env files are only re-parsed when their mtime or size changes"""
+        from aws_devops_agent.config import _env_cache
+
+        env_file = tmp_path / ".env.github"
+        env_file.write_text('# GitHub\nGITHUB_PERSONAL_ACCESS_TOKEN="ghp_test"\nGITHUB_DEFAULT_REPO=org/repo\n')
+
+        with patch.object(_env_cache, "parse_env_text", wraps=_env_cache.parse_env_text) as parser:
+            first = _env_cache.load_env_cached(env_file)
+            second = _env_cache.load_env_cached(env_file)
+            env_file.write_text("GITHUB_DEFAULT_REPO=org/other-repo\n")
+            third = _env_cache.load_env_cached(env_file)
+
+        assert first == second == {"GITHUB_PERSONAL_ACCESS_TOKEN": "ghp_test", "GITHUB_DEFAULT_REPO": "org/repo"}
+        assert third == {"GITHUB_DEFAULT_REPO": "org/other-repo"}
+        assert parser.call_count == 2
+        assert list(tmp_path.iterdir()) == [env_file]
+
 
 class TestAWSCostTools:
     """Test AWS cost optimization tools"""
@@ -142,6 +193,240 @@ class TestAWSCostTools:
         if result["status"] == "success":
             assert "recommendations" in result
 
+    @patch('aws_devops_agent.tools.aws_cost.explorer.aws_client')
+    def test_get_cost_dashboard_bundle_partial_failure(self, mock_client):
+        """Test cost dashboard bundle combines Cost Explorer responses and tolerates a failed call"""
+        ce_client = Mock()
+        ce_client.get_cost_and_usage.return_value = {
+            "ResultsByTime": [{
+                "Groups": [
+                    {"Keys": ["Amazon EC2"], "Metrics": {"UnblendedCost": {"Amount": "120.5"}}},
+                    {"Keys": ["Amazon S3"], "Metrics": {"UnblendedCost": {"Amount": "9.5"}}}
+                ]
+            }]
+        }
+        ce_client.get_cost_forecast.return_value = {"Total": {"Amount": "140.0"}}
+        ce_client.get_rightsizing_recommendation.side_effect = Exception("AccessDenied")
+        mock_client.return_value = ce_client
+        
+        result = get_cost_dashboard_bundle(time_period_days=30, forecast_days=30)
+        
+        assert result["status"] == "partial"
+        assert result["costs"]["total_cost"] == 130.0
+        assert list(result["costs"]["by_service"]) == ["Amazon EC2", "Amazon S3"]
+        assert result["forecast"]["total_forecast"] == 140.0
+        assert "rightsizing" not in result
+        assert "AccessDenied" in result["errors"]["rightsizing"]
+
+    @patch('aws_devops_agent.clients.boto3.Session')
+    def test_aws_client_reused_per_service_and_region(self, mock_session):
+        """Test tools share one pooled boto3 client per service and region"""
+        from aws_devops_agent import clients
+
+        clients.clear_clients()
+        mock_session.return_value.client.side_effect = lambda service, **kwargs: Mock(name=service)
+        try:
+            ce = clients.aws_client('ce')
+            assert clients.aws_client('ce') is ce
+            assert clients.aws_client('ec2', region_name='us-west-2') is not clients.aws_client('ec2')
+            assert mock_session.call_count == 1
+            assert mock_session.return_value.client.call_args.kwargs["config"] is clients.CLIENT_CONFIG
+
+            clients.clear_clients()
+            assert clients.aws_client('ce') is not ce
+            assert mock_session.call_count == 2
+        finally:
+            clients.clear_clients()
+
+
+class TestMCPDiscoveryCache:
+    """Test the on-disk MCP tool catalog cache"""
+
+    def test_catalog_round_trip_skips_list_tools(self, tmp_path, monkeypatch):
+        """Test a saved catalog is served without calling list_tools_sync again"""
+        from mcp import StdioServerParameters
+        from mcp.types import Tool
+        from aws_devops_agent.tools import _mcp_discovery_cache as cache
+
+        monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+        params = StdioServerParameters(command="uvx", args=["awslabs.cost-explorer-mcp-server@latest"],
+                                       env={"AWS_REGION": "us-east-1", "GITHUB_PERSONAL_ACCESS_TOKEN": "secret"})
+        assert cache.load_cached_catalog(params) is None
+
+        cache.save_catalog(params, [Tool(name="get_cost_and_usage", inputSchema={"type": "object"})])
+        client = Mock()
+        tools = cache.cached_list_tools(client, params)
+
+        client.list_tools_sync.assert_not_called()
+        assert [tool.tool_name for tool in tools] == ["get_cost_and_usage"]
+        assert "secret" not in (tmp_path / f"{cache.catalog_key(params)}.json").read_text()
+
+    def test_expired_catalog_is_refetched(self, tmp_path, monkeypatch):
+        """Test a catalog older than the TTL is fetched from the server again"""
+        from mcp import StdioServerParameters
+        from mcp.types import Tool
+        from aws_devops_agent.tools import _mcp_discovery_cache as cache
+
+        monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+        params = StdioServerParameters(command="uvx", args=["awslabs.aws-pricing-mcp-server@latest"])
+        cache.save_catalog(params, [Tool(name="get_pricing", inputSchema={"type": "object"})])
+
+        catalog_file = tmp_path / f"{cache.catalog_key(params)}.json"
+        entry = json.loads(catalog_file.read_text())
+        entry["cached_at"] -= cache.CATALOG_TTL_SECONDS + 1
+        catalog_file.write_text(json.dumps(entry))
+
+        fresh = Mock(mcp_tool=Tool(name="get_pricing_v2", inputSchema={"type": "object"}))
+        client = Mock()
+        client.list_tools_sync.return_value = [fresh]
+
+        assert cache.cached_list_tools(client, params) == [fresh]
+        client.list_tools_sync.assert_called_once()
+        assert [tool.name for tool in cache.load_cached_catalog(params)] == ["get_pricing_v2"]
+
+    def test_unavailable_client_lists_no_tools(self):
+        """Test list_tools returns an empty list when the server client cannot be created"""
+        from aws_devops_agent.mcp_clients.mcp_client import DevOpsMCPClient
+
+        client = DevOpsMCPClient()
+        with patch.dict(client._getters, {"cost_explorer": lambda: None}):
+            assert client.list_tools("cost_explorer") == []
+
+
+class TestAWSMCPSessions:
+    """Test cold MCP session startup"""
+
+    @pytest.mark.asyncio
+    async def test_unresponsive_server_times_out(self):
+        """Test a server that never answers initialize is abandoned after the connect timeout"""
+        from aws_devops_agent.mcp_clients.aws_mcp_client import AWSMCPClient
+
+        client = AWSMCPClient()
+        client.connect_timeout = 1
+        session = await asyncio.wait_for(client._open_session("hung", "sleep", ["30"]), timeout=15)
+
+        assert session is None
+        assert "hung" not in client.sessions
+
+    @pytest.mark.asyncio
+    async def test_warm_session_skips_connect_path(self):
+        """Test a resident session is reused without re-entering the timed connect path"""
+        from aws_devops_agent.mcp_clients.aws_mcp_client import AWSMCPClient
+
+        client = AWSMCPClient()
+        client.sessions["cost_explorer"] = warm = Mock()
+        client._open_session = AsyncMock()
+
+        assert await client.get_cost_explorer_session() is warm
+        client._open_session.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_container_credentials_reach_server_env(self, monkeypatch):
+        """Test the AWS credential chain and proxy settings are forwarded to spawned servers"""
+        from aws_devops_agent.mcp_clients import aws_mcp_client
+
+        monkeypatch.setenv("AWS_CONTAINER_CREDENTIALS_FULL_URI", "http://169.254.170.23/v1/credentials")
+        monkeypatch.setenv("AWS_CONTAINER_AUTHORIZATION_TOKEN", "token")
+        monkeypatch.setenv("AWS_WEB_IDENTITY_TOKEN_FILE", "/var/run/secrets/token")
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy:3128")
+        monkeypatch.setenv("GITHUB_PERSONAL_ACCESS_TOKEN", "secret")
+
+        client = aws_mcp_client.AWSMCPClient()
+        with patch.object(aws_mcp_client, "stdio_client", side_effect=RuntimeError("stop")) as spawn:
+            assert await client._open_session("cost_explorer", "uvx", ["awslabs.cost-explorer-mcp-server@latest"]) is None
+
+        env = spawn.call_args.args[0].env
+        assert env["AWS_CONTAINER_CREDENTIALS_FULL_URI"] == "http://169.254.170.23/v1/credentials"
+        assert env["AWS_CONTAINER_AUTHORIZATION_TOKEN"] == "token"
+        assert env["AWS_WEB_IDENTITY_TOKEN_FILE"] == "/var/run/secrets/token"
+        assert env["HTTPS_PROXY"] == "http://proxy:3128"
+        assert "GITHUB_PERSONAL_ACCESS_TOKEN" not in env
+
+
+class TestLazyToolRegistry:
+    """Test two-tier tool registration"""
+
+    def test_schema_request_registers_tool(self):
+        """Test the agent starts with discovery tools and gains a tool once its schema is loaded"""
+        from strands import Agent
+        from aws_devops_agent.tools.lazy_registry import LazyToolRegistry
+
+        registry = LazyToolRegistry({
+            "aws_cost": ("get_cost_by_service",),
+            "iac": ("analyze_terraform_project",),
+            "docs": ("generate_document",),
+        })
+        agent = Agent(tools=registry.entry_tools(), callback_handler=None)
+        assert sorted(agent.tool_registry.registry) == ["get_tool_schema", "list_tool_categories"]
+
+        categories = json.loads(agent.tool.list_tool_categories()["content"][0]["text"])
+        assert categories["iac"]["tools"] == ["analyze_terraform_project"]
+
+        result = agent.tool.get_tool_schema(category="aws_cost", name="get_cost_by_service")
+        assert result["status"] == "success"
+        assert "get_cost_by_service" in agent.tool_registry.registry
+        assert len(registry) == 3
+
+        repeat = agent.tool.get_tool_schema(category="aws_cost", name="get_cost_by_service")
+        assert "already loaded" in repeat["content"][0]["text"]
+
+    def test_app_factory_builds_discovery_agent(self):
+        """Test the shared factory wires the discovery tools and batched reads"""
+        from aws_devops_agent.app_factory import build_agent, AGENT_NAME
+
+        agent = build_agent("us.anthropic.claude-3-5-sonnet-20241022-v2:0", {"github": ("monitor_infrastructure_prs",)})
+        assert agent.name == AGENT_NAME
+        assert agent.model.config["cache_config"].system_prompt_ttl is True
+        assert agent.model.config["cache_config"].tools_ttl is True
+        assert sorted(agent.tool_registry.registry) == ["get_tool_schema", "list_tool_categories", "run_tools_batch"]
+
+    def test_factory_agents_do_not_share_loaded_tools(self):
+        """Test agents from one factory share the model but keep their own loaded tools"""
+        from aws_devops_agent.app_factory import AgentFactory
+
+        factory = AgentFactory("us.anthropic.claude-3-5-sonnet-20241022-v2:0", {"aws_cost": ("get_cost_by_service",)})
+        first, second = factory.build(), factory.build()
+        assert first.model is second.model
+
+        first.tool.get_tool_schema(category="aws_cost", name="get_cost_by_service")
+        assert "get_cost_by_service" in first.tool_registry.registry
+        assert "get_cost_by_service" not in second.tool_registry.registry
+        assert "get_cost_by_service" not in factory.build().tool_registry.registry
+
+    def test_run_tools_batch_rejects_write_tools(self):
+        """Test batched reads run together while write and unknown tools are refused per op"""
+        from aws_devops_agent import tools
+        from aws_devops_agent.tools.batch import run_tools_batch
+
+        with patch.object(tools, "get_cost_by_service", Mock(return_value={"status": "success", "total": 1.0})):
+            result = run_tools_batch(ops=[
+                {"tool": "get_cost_by_service", "arguments": {"time_period_days": 7}},
+                {"tool": "create_optimization_pull_request", "arguments": {}},
+                {"tool": "get_everything"},
+            ])
+
+        assert result["status"] == "partial"
+        assert [entry["ok"] for entry in result["results"]] == [True, False, False]
+        assert result["results"][0]["result"]["total"] == 1.0
+        assert "not an available read-only tool" in result["results"][1]["error"]
+
+    def test_unknown_tool_name_imports_no_domain(self):
+        """Test probing an unknown name on the tools package fails without importing the domains"""
+        import subprocess
+
+        script = (
+            "import sys\n"
+            "from aws_devops_agent import tools\n"
+            "assert not hasattr(tools, 'get_everything')\n"
+            "from aws_devops_agent.tools import _mcp_discovery_cache\n"
+            "print(sorted(m for m in sys.modules if m.startswith('aws_devops_agent.tools.')))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                                env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[2] / "src")})
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "['aws_devops_agent.tools._mcp_discovery_cache']"
+
 
 class TestAWSIaCTools:
     """Test Infrastructure as Code analysis tools"""
@@ -270,6 +555,33 @@ class TestAWSComplianceTools:
             assert "vulnerabilities" in result
             assert "vulnerability_summary" in result
 
+    @patch('aws_devops_agent.tools.aws_security.trusted_advisor.aws_client')
+    def test_security_recommendations_fetched_once_per_day(self, mock_client):
+        """Test Trusted Advisor security recommendations are reused within a day and failures are not cached"""
+        from aws_devops_agent.tools.aws_security import trusted_advisor
+
+        support = Mock()
+        support.describe_trusted_advisor_checks.side_effect = [
+            Exception("SubscriptionRequiredException"),
+            {"checks": [{"id": "c1", "name": "IAM Use", "category": "security"}]}
+        ]
+        support.describe_trusted_advisor_check_summaries.return_value = {
+            "summaries": [{"checkId": "c1", "status": "warning"}]
+        }
+        mock_client.return_value = support
+        trusted_advisor._fetch_security_recommendations.cache_clear()
+        try:
+            assert trusted_advisor.get_security_recommendations()["status"] == "error"
+            first = trusted_advisor.get_security_recommendations()
+            second = trusted_advisor.get_security_recommendations()
+
+            assert first["status"] == second["status"] == "success"
+            assert second["analysis"]["issues_found"] == 1
+            assert support.describe_trusted_advisor_checks.call_count == 2
+            assert support.describe_trusted_advisor_check_summaries.call_count == 1
+        finally:
+            trusted_advisor._fetch_security_recommendations.cache_clear()
+
 
 class TestMultiAccountTools:
     """Test multi-account AWS management tools"""